@@ -1,10 +1,18 @@
 # src/collectors/base_collector.py
+import gzip
+import hashlib
+import importlib.util
+import json
 import logging
 import os
+import shutil
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections.abc import Iterator
+from datetime import UTC, datetime
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import requests
 
@@ -15,15 +23,44 @@ from src.services.processors.reference_manager import ReferenceManager
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Le cache parsé (Feather) nécessite pyarrow, dépendance optionnelle
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
 
 class BaseCollector(ABC):
-    def __init__(self, cache_dir: str, use_mock_data: bool = False):
+    # Délais (connexion, lecture) : une requête TAP complète peut mettre plusieurs minutes
+    DOWNLOAD_TIMEOUT: tuple[float, float] = (10, 300)
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+    # À incrémenter quand la lecture du CSV change (options, colonnes) pour
+    # invalider les caches parsés existants
+    PARSED_CACHE_SCHEMA_VERSION = 1
+
+    def __init__(
+        self,
+        cache_dir: str,
+        use_mock_data: bool = False,
+        compress_cache: bool = False,
+        revalidate_cache: bool = False,
+        cache_max_age: float | None = None,
+        chunk_size: int | None = None,
+    ):
         self.cache_dir = cache_dir
         os.makedirs(self.cache_dir, exist_ok=True)
         self.use_mock_data = use_mock_data
+        self.compress_cache = compress_cache and not use_mock_data
+        self.revalidate_cache = revalidate_cache and not use_mock_data
+        self.cache_max_age = cache_max_age
+        # Lecture par blocs de chunk_size lignes (None : DataFrame complet)
+        self.chunk_size = chunk_size
         self.reference_manager = ReferenceManager()
         self.last_update_date = datetime.now()
+        self.column_pruning_report: dict[str, int] | None = None
         self.cache_path = os.path.join(self.cache_dir, self.get_default_cache_filename())
+        if self.compress_cache:
+            self.cache_path += ".gz"
+        self.cache_metadata_path = f"{self.cache_path}.meta.json"
+        self.parsed_cache_path = f"{self.cache_path}.parsed.feather"
+        self.parsed_cache_key_path = f"{self.cache_path}.parsed.json"
 
     # ============================================================================
     # 🔶 Méthodes abstraites (contrat à implémenter dans les classes concrètes)
@@ -64,6 +101,30 @@ class BaseCollector(ABC):
         """Convertit une ligne du DataFrame en objet Star."""
         pass
 
+    def transform_row_to_entities(
+        self, row: pd.Series, with_star: bool = True
+    ) -> tuple[Exoplanet | None, Star | None]:
+        """
+        Convertit une ligne en (Exoplanet, Star).
+
+        Par défaut, délègue aux deux conversions séparées ; une source peut surcharger
+        cette méthode pour construire les deux entités en une seule passe.
+        with_star=False saute la construction de l'étoile (ligne non représentative).
+        """
+        exoplanet = self.transform_row_to_exoplanet(row)
+        star = self.transform_row_to_star(row) if with_star else None
+        return exoplanet, star
+
+    def select_host_star_rows(self, df: pd.DataFrame) -> list[int] | None:
+        """
+        Positions (iloc) des lignes à partir desquelles construire les étoiles.
+
+        Par défaut None : une étoile est construite pour chaque ligne. Une source
+        dont plusieurs lignes partagent la même étoile hôte peut surcharger cette
+        méthode pour n'en retenir qu'une par étoile.
+        """
+        return None
+
     # ============================================================================
     # 🧰 Méthodes utilitaires réutilisables par tous les collecteurs
     # ============================================================================
@@ -72,28 +133,108 @@ class BaseCollector(ABC):
         """Arguments optionnels pour pd.read_csv (ex: comment char)."""
         return {}  # Par défaut, aucun argument spécial
 
+    def get_used_csv_columns(self) -> set[str] | None:
+        """
+        Colonnes lues par la conversion des lignes (None : toutes les colonnes).
+
+        Les autres colonnes ne sont pas matérialisées par pd.read_csv. Les colonnes
+        requises (get_required_csv_columns) sont toujours conservées.
+        """
+        return None
+
+    def get_csv_column_dtypes(self) -> dict[str, Any]:
+        """Types explicites par colonne pour pd.read_csv (les autres sont inférés)."""
+        return {}
+
     def read_csv_file(self, file_path: str) -> pd.DataFrame | None:
+        options, header = self._build_csv_read_options()
         try:
-            return pd.read_csv(file_path, **self.get_csv_reader_options())
+            df = pd.read_csv(file_path, **options)
         except FileNotFoundError:
             logger.warning(f"Fichier non trouvé : {file_path}")
+            return None
         except pd.errors.EmptyDataError:
             logger.error(f"Fichier vide : {file_path}")
+            return None
         except Exception as e:
             logger.error(f"Erreur lecture CSV {file_path}: {e}")
-        return None
+            return None
 
-    def fetch_and_cache_csv_data(self) -> pd.DataFrame | None:
+        if header:
+            self._report_column_pruning(file_path, df, len(header))
+        return df
+
+    def _build_csv_read_options(self) -> tuple[dict[str, Any], set[str]]:
+        """
+        Options pd.read_csv (colonnes retenues et types compris).
+
+        Le second élément est rempli, pendant la lecture, avec les colonnes de l'en-tête
+        (vide si toutes les colonnes sont lues).
+        """
+        options = dict(self.get_csv_reader_options())
+        used_columns = self._get_kept_csv_columns()
+        header: set[str] = set()
+        if used_columns is not None:
+
+            def keep_column(column: str) -> bool:
+                header.add(column)
+                return column in used_columns
+
+            options.setdefault("usecols", keep_column)
+        dtypes = self.get_csv_column_dtypes()
+        if dtypes:
+            options.setdefault("dtype", dtypes)
+        return options, header
+
+    def _get_kept_csv_columns(self) -> set[str] | None:
+        used_columns = self.get_used_csv_columns()
+        if used_columns is None:
+            return None
+        return set(used_columns) | set(self.get_required_csv_columns())
+
+    def _report_column_pruning(self, file_path: str, df: pd.DataFrame, total_columns: int) -> None:
+        """Journalise (et mémorise) les colonnes ignorées et la mémoire ainsi évitée."""
+        kept_columns = len(df.columns)
+        skipped_columns = total_columns - kept_columns
+        # Estimation : les colonnes ignorées auraient coûté autant que la moyenne des
+        # colonnes conservées
+        bytes_per_column = df.memory_usage(index=False).sum() / kept_columns if kept_columns else 0
+        self.column_pruning_report = {
+            "total_columns": total_columns,
+            "kept_columns": kept_columns,
+            "skipped_columns": skipped_columns,
+            "skipped_bytes": int(bytes_per_column * skipped_columns),
+        }
+        logger.info(
+            f"{skipped_columns}/{total_columns} colonnes ignorées à la lecture de {file_path} "
+            f"(~{self.column_pruning_report['skipped_bytes'] / 1024 / 1024:.1f} Mo évités)"
+        )
+
+    def fetch_and_cache_csv_data(self, conditional: bool = False) -> pd.DataFrame | None:
+        status = self.refresh_cache(conditional=conditional)
+        if status is None:
+            return None
+        df = self.read_cache_file()
+        if df is None and status == "not_modified":
+            # Cache confirmé par le serveur mais illisible : téléchargement complet
+            if self.refresh_cache() is not None:
+                df = self.read_cache_file()
+        return df
+
+    def refresh_cache(self, conditional: bool = False) -> str | None:
+        """
+        Met le cache brut à jour depuis la source, sans le lire.
+
+        Retourne "downloaded", "not_modified" (réponse 304) ou None en cas d'échec.
+        """
         url = self.get_data_download_url()
         logger.info(f"Téléchargement depuis {url}")
 
         try:
-            response: requests.Response = requests.get(url, timeout=10)
-            response.raise_for_status()
-
-            with open(self.cache_path, "w", encoding="utf-8") as f:
-                f.write(response.text)
-            return self.read_csv_file(self.cache_path)
+            if not self.download_to_cache(url, conditional=conditional):
+                logger.info(f"Cache inchangé côté serveur (304) : {self.cache_path}")
+                return "not_modified"
+            return "downloaded"
         except requests.exceptions.RequestException as e:
             logger.error(f"Erreur HTTP depuis {url}: {e}")
         except Exception as e:
@@ -101,6 +242,205 @@ class BaseCollector(ABC):
 
         return None
 
+    def download_to_cache(self, url: str, conditional: bool = False) -> bool:
+        """
+        Télécharge url en flux vers <cache>.part puis le renomme atomiquement en cache.
+
+        Un .part laissé par un téléchargement interrompu est repris avec les en-têtes
+        Range et If-Range (ETag ou Last-Modified enregistrés avec l'URL dans
+        <cache>.part.meta.json) : si la ressource a changé depuis, le serveur renvoie le
+        fichier complet et le .part est réécrit. Un .part d'une autre URL ou sans
+        validateur est supprimé. Le cache existant n'est remplacé qu'une fois le fichier
+        complet (et compressé en gzip si compress_cache). Les validateurs de la réponse
+        sont enregistrés dans le fichier annexe <cache>.meta.json.
+
+        Avec conditional=True, la requête porte If-None-Match / If-Modified-Since :
+        une réponse 304 laisse le cache en place et retourne False.
+        """
+        part_path = f"{self.cache_path}.part"
+        os.makedirs(os.path.dirname(part_path) or ".", exist_ok=True)
+        resume_from = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if_range = self._get_partial_download_validator(url) if resume_from else None
+        if resume_from and if_range is None:
+            logger.info(f"{part_path} d'origine inconnue (URL ou version) : téléchargement complet")
+            self._discard_partial_download()
+            resume_from = 0
+
+        headers = {}
+        if resume_from:
+            # Les offsets Range portent sur le corps non compressé
+            headers = {
+                "Range": f"bytes={resume_from}-",
+                "If-Range": if_range,
+                "Accept-Encoding": "identity",
+            }
+            logger.info(f"Reprise du téléchargement à l'octet {resume_from}")
+        elif conditional and os.path.exists(self.cache_path):
+            headers = self._get_conditional_headers()
+
+        start = time.perf_counter()
+        response: requests.Response = requests.get(
+            url, stream=True, timeout=self.DOWNLOAD_TIMEOUT, headers=headers
+        )
+        try:
+            if resume_from and (
+                response.status_code == 416
+                or (
+                    response.status_code == 206
+                    and not self._content_range_starts_at(response, resume_from)
+                )
+            ):
+                # Plage refusée ou incohérente : le .part ne correspond plus à la ressource
+                response.close()
+                self._discard_partial_download()
+                return self.download_to_cache(url, conditional=conditional)
+            if response.status_code == 304:
+                self._touch_cache_metadata()
+                return False
+            response.raise_for_status()
+
+            if response.status_code != 206:
+                # Fichier complet (ressource modifiée ou Range ignoré) : le .part est
+                # réécrit, avec l'origine qui permettra de le reprendre
+                resume_from = 0
+                self._save_partial_download_metadata(url, response.headers)
+            written = 0
+            with open(part_path, "ab" if resume_from else "wb") as f:
+                for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        written += len(chunk)
+        finally:
+            response.close()
+
+        elapsed = max(time.perf_counter() - start, 1e-6)
+        logger.info(
+            f"{written} octets téléchargés en {elapsed:.1f} s "
+            f"({written / elapsed / 1024:.0f} Ko/s, total {resume_from + written} octets)"
+        )
+
+        if self.compress_cache:
+            compressed_path = f"{self.cache_path}.tmp"
+            with open(part_path, "rb") as src, gzip.open(compressed_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, self.DOWNLOAD_CHUNK_SIZE)
+            os.replace(compressed_path, self.cache_path)
+            os.remove(part_path)
+        else:
+            os.replace(part_path, self.cache_path)
+        self._discard_partial_download()
+
+        self._write_cache_metadata(url, response.headers)
+        return True
+
+    def _save_partial_download_metadata(self, url: str, response_headers: Any) -> None:
+        with open(f"{self.cache_path}.part.meta.json", "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "url": url,
+                    "etag": response_headers.get("ETag"),
+                    "last_modified": response_headers.get("Last-Modified"),
+                },
+                f,
+            )
+
+    def _get_partial_download_validator(self, url: str) -> str | None:
+        """
+        Valeur If-Range du .part s'il provient de url : ETag fort, sinon Last-Modified.
+        None si le .part ne peut pas être repris sans risque de mélanger deux versions.
+        """
+        try:
+            with open(f"{self.cache_path}.part.meta.json", encoding="utf-8") as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if metadata.get("url") != url:
+            return None
+        etag = metadata.get("etag")
+        if etag and not etag.startswith("W/"):
+            # If-Range n'accepte pas les ETag faibles
+            return etag
+        return metadata.get("last_modified")
+
+    @staticmethod
+    def _content_range_starts_at(response: requests.Response, offset: int) -> bool:
+        content_range = response.headers.get("Content-Range", "")
+        return content_range.startswith(f"bytes {offset}-")
+
+    def _discard_partial_download(self) -> None:
+        for path in (f"{self.cache_path}.part", f"{self.cache_path}.part.meta.json"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    # ============================================================================
+    # 🗂️ Validateurs HTTP du cache (fichier annexe <cache>.meta.json)
+    # ============================================================================
+
+    def read_cache_metadata(self) -> dict[str, Any]:
+        """Validateurs enregistrés pour le cache ({} si absents ou illisibles)."""
+        try:
+            with open(self.cache_metadata_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get_cache_age(self) -> float | None:
+        """Âge du cache en secondes depuis sa dernière récupération (None si absent)."""
+        if not os.path.exists(self.cache_path):
+            return None
+        fetched_at = self.read_cache_metadata().get("fetched_at")
+        try:
+            fetched_ts = datetime.fromisoformat(fetched_at).timestamp()
+        except (TypeError, ValueError):
+            # Cache antérieur aux métadonnées : on se rabat sur la date du fichier
+            fetched_ts = os.path.getmtime(self.cache_path)
+        return max(time.time() - fetched_ts, 0.0)
+
+    def is_cache_fresh(self) -> bool:
+        """Vrai si le cache peut être utilisé sans revalidation auprès du serveur."""
+        if not self.revalidate_cache:
+            return True
+        if self.cache_max_age is None:
+            return False
+        age = self.get_cache_age()
+        return age is not None and age <= self.cache_max_age
+
+    def _get_conditional_headers(self) -> dict[str, str]:
+        metadata = self.read_cache_metadata()
+        headers = {}
+        if metadata.get("etag"):
+            headers["If-None-Match"] = metadata["etag"]
+        if metadata.get("last_modified"):
+            headers["If-Modified-Since"] = metadata["last_modified"]
+        return headers
+
+    def _write_cache_metadata(self, url: str, response_headers: Any) -> None:
+        metadata = {
+            "url": url,
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+            "sha256": self._hash_cache_file(),
+            "fetched_at": datetime.now(UTC).isoformat(),
+        }
+        self._save_cache_metadata(metadata)
+
+    def _hash_cache_file(self) -> str:
+        sha256 = hashlib.sha256()
+        with open(self.cache_path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.DOWNLOAD_CHUNK_SIZE), b""):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def _touch_cache_metadata(self) -> None:
+        metadata = self.read_cache_metadata()
+        metadata["fetched_at"] = datetime.now(UTC).isoformat()
+        self._save_cache_metadata(metadata)
+
+    def _save_cache_metadata(self, metadata: dict[str, Any]) -> None:
+        tmp_path = f"{self.cache_metadata_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2)
+        os.replace(tmp_path, self.cache_metadata_path)
+
     def convert_to_float_if_possible(self, value: any) -> float | None:
         if pd.isna(value):
             return None
@@ -117,6 +457,128 @@ class BaseCollector(ABC):
             return False
         return True
 
+    # ============================================================================
+    # 🧊 Cache parsé (copie Feather typée du CSV brut)
+    # ============================================================================
+
+    def read_cache_file(self) -> pd.DataFrame | None:
+        """
+        Lit le cache brut, via sa copie Feather si elle correspond encore au CSV.
+
+        La copie est indexée par le SHA-256 du fichier brut, la version de schéma du
+        collecteur et les options de lecture : tant qu'ils sont inchangés, le CSV n'est
+        pas re-parsé. Le hash n'est recalculé que si la taille ou la date de
+        modification du fichier brut ont changé. Sans pyarrow, le CSV est simplement relu.
+        """
+        if not HAS_PYARROW:
+            return self.read_csv_file(self.cache_path)
+
+        stored = self._read_parsed_cache_key()
+        try:
+            stat = os.stat(self.cache_path)
+            sha256 = self._get_cache_file_sha256(stat, stored)
+        except OSError as e:
+            logger.warning(f"Fichier non lisible : {self.cache_path} ({e})")
+            return None
+
+        key = {
+            "sha256": sha256,
+            "schema_version": self.PARSED_CACHE_SCHEMA_VERSION,
+            "reader_options": self._get_csv_read_signature(),
+        }
+        if all(stored.get(name) == value for name, value in key.items()):
+            df = self._load_parsed_cache()
+            if df is not None:
+                return df
+
+        df = self.read_csv_file(self.cache_path)
+        if df is not None:
+            self._save_parsed_cache(df, {**key, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns})
+        return df
+
+    def _get_cache_file_sha256(self, stat: os.stat_result, stored: dict[str, Any]) -> str:
+        """SHA-256 du cache brut, repris de la clé du cache parsé si le fichier n'a pas changé."""
+        if (stored.get("size"), stored.get("mtime_ns")) == (stat.st_size, stat.st_mtime_ns):
+            return stored.get("sha256")
+        return self._hash_cache_file()
+
+    def get_cache_fingerprint(self) -> dict[str, Any] | None:
+        """
+        Empreinte du fichier source en cache (SHA-256, version de schéma, options de
+        lecture) : tant qu'elle est inchangée, la collecte produit les mêmes entités.
+
+        None si la prochaine collecte doit (re)télécharger le fichier : cache absent ou à
+        revalider auprès du serveur.
+        """
+        if not self.use_mock_data and not self.is_cache_fresh():
+            return None
+        try:
+            stat = os.stat(self.cache_path)
+            sha256 = self._get_cache_file_sha256(stat, self._read_parsed_cache_key())
+        except OSError:
+            return None
+        return {
+            "collector": type(self).__name__,
+            "cache_path": self.cache_path,
+            "size": stat.st_size,
+            "sha256": sha256,
+            "schema_version": self.PARSED_CACHE_SCHEMA_VERSION,
+            "reader_options": self._get_csv_read_signature(),
+        }
+
+    def _get_csv_read_signature(self) -> str:
+        """Options de lecture du CSV (colonnes et types compris) pour la clé du cache parsé."""
+        used_columns = self._get_kept_csv_columns()
+        return repr(
+            (
+                sorted(self.get_csv_reader_options().items()),
+                sorted(used_columns) if used_columns is not None else None,
+                sorted(
+                    (column, str(dtype)) for column, dtype in self.get_csv_column_dtypes().items()
+                ),
+            )
+        )
+
+    def _read_parsed_cache_key(self) -> dict[str, Any]:
+        try:
+            with open(self.parsed_cache_key_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _load_parsed_cache(self) -> pd.DataFrame | None:
+        try:
+            df = pd.read_feather(self.parsed_cache_path)
+        except (OSError, ValueError):
+            return None
+
+        # Arrow restitue les valeurs manquantes des colonnes texte en None ; on
+        # rétablit NaN comme pd.read_csv
+        for column in df.select_dtypes(include="object").columns:
+            values = df[column].to_numpy(copy=True)
+            values[pd.isna(values)] = np.nan
+            df[column] = values
+        logger.info(f"Cache parsé chargé : {self.parsed_cache_path} ({len(df)} lignes)")
+        return df
+
+    def _save_parsed_cache(self, df: pd.DataFrame, key: dict[str, Any]) -> None:
+        tmp_path = f"{self.parsed_cache_path}.tmp"
+        try:
+            # Clé retirée d'abord : une écriture interrompue ne laisse jamais une clé
+            # pointant vers une copie qui ne lui correspond pas
+            if os.path.exists(self.parsed_cache_key_path):
+                os.remove(self.parsed_cache_key_path)
+            # Non compressé : la lecture est plus rapide que lz4 sur ces tables larges
+            df.to_feather(tmp_path, compression="uncompressed")
+            os.replace(tmp_path, self.parsed_cache_path)
+            with open(self.parsed_cache_key_path, "w", encoding="utf-8") as f:
+                json.dump(key, f, indent=2)
+        except Exception as e:
+            # Ex. colonne de types mixtes non représentable en Arrow : on garde le CSV seul
+            logger.warning(f"Cache parsé non écrit pour {self.cache_path} : {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     # ============================================================================
     # 🔁 Pipeline de chargement et parsing des entités
     # ============================================================================
@@ -135,45 +597,108 @@ class BaseCollector(ABC):
                 logger.error(f"Fichier mock introuvable: {self.cache_path}")
                 return None
 
+        conditional = False
         if os.path.exists(self.cache_path):
-            df: pd.DataFrame | None = self.read_csv_file(self.cache_path)
-            if df is not None:
-                return df
-            logger.warning("Échec lecture cache, tentative de téléchargement.")
+            if self.is_cache_fresh():
+                df: pd.DataFrame | None = self.read_cache_file()
+                if df is not None:
+                    return df
+                logger.warning("Échec lecture cache, tentative de téléchargement.")
+            else:
+                logger.info(f"Cache expiré, revalidation auprès du serveur : {self.cache_path}")
+                conditional = True
 
-        df = self.fetch_and_cache_csv_data()
+        df = self.fetch_and_cache_csv_data(conditional=conditional)
         if df is None and os.path.exists(self.cache_path):
             logger.info("Relecture du cache après échec du téléchargement.")
-            return self.read_csv_file(self.cache_path)
+            return self.read_cache_file()
 
         return df
 
-    def extract_entities_from_dataframe(
+    def iter_source_dataframes(self) -> Iterator[pd.DataFrame]:
+        """
+        Lit le cache par blocs de chunk_size lignes, avec les mêmes options que
+        read_csv_file (colonnes retenues, types).
+
+        Le cache est d'abord mis à jour si nécessaire, sans être lu en entier ; le
+        cache parsé (Feather) n'est pas utilisé dans ce mode.
+        """
+        if self.use_mock_data:
+            logger.info("Chargement par blocs depuis les données mockées.")
+        elif not os.path.exists(self.cache_path) or not self.is_cache_fresh():
+            status = self.refresh_cache(conditional=os.path.exists(self.cache_path))
+            if status is None and os.path.exists(self.cache_path):
+                logger.info("Relecture du cache après échec du téléchargement.")
+
+        options, _ = self._build_csv_read_options()
+        try:
+            with pd.read_csv(self.cache_path, chunksize=self.chunk_size, **options) as reader:
+                yield from reader
+        except FileNotFoundError:
+            logger.error(f"Fichier non trouvé : {self.cache_path}")
+        except pd.errors.EmptyDataError:
+            logger.error(f"Fichier vide : {self.cache_path}")
+
+    def iter_entities_from_dataframe(
         self, df: pd.DataFrame
-    ) -> tuple[list[Exoplanet], list[Star]]:
-        exoplanets: list[Exoplanet] = []
-        stars: list[Star] = []
+    ) -> Iterator[tuple[Exoplanet | None, Star | None]]:
+        """Convertit les lignes une à une en (Exoplanet, Star), à la demande."""
+        star_rows = self.select_host_star_rows(df)
+        star_positions = set(star_rows) if star_rows is not None else None
 
-        for idx, row in df.iterrows():
+        for position, (idx, row) in enumerate(df.iterrows()):
             try:
-                exo: Exoplanet | None = self.transform_row_to_exoplanet(row)
-                if exo:
-                    exoplanets.append(exo)
-
-                star: Star | None = self.transform_row_to_star(row)
-                if star:
-                    stars.append(star)
+                with_star = star_positions is None or position in star_positions
+                yield self.transform_row_to_entities(row, with_star=with_star)
             except Exception as e:
                 logger.exception(
                     f"Erreur conversion ligne {idx} ({self.get_source_type().name}): {e}"
                 )
 
+    def extract_entities_from_dataframe(
+        self, df: pd.DataFrame
+    ) -> tuple[list[Exoplanet], list[Star]]:
+        exoplanets: list[Exoplanet] = []
+        stars: list[Star] = []
+
+        for exo, star in self.iter_entities_from_dataframe(df):
+            if exo:
+                exoplanets.append(exo)
+            if star:
+                stars.append(star)
+
         logger.info(f"{len(exoplanets)} exoplanètes et {len(stars)} étoiles extraites.")
         return exoplanets, stars
 
+    def iter_entities_from_source(self) -> Iterator[tuple[list[Exoplanet], list[Star]]]:
+        """
+        Collecte la source bloc par bloc : un couple (exoplanètes, étoiles) par bloc de
+        chunk_size lignes, de sorte que seul le bloc courant est en mémoire.
+
+        Sans chunk_size, le DataFrame complet forme un unique bloc. Une étoile hôte dont
+        les planètes sont réparties sur plusieurs blocs peut être produite plusieurs
+        fois ; StarRepository fusionne alors ces occurrences champ par champ.
+        """
+        if not self.chunk_size:
+            yield self.collect_entities_from_source()
+            return
+
+        for position, chunk in enumerate(self.iter_source_dataframes()):
+            if position == 0 and not self.validate_required_columns(chunk):
+                return
+            yield self.extract_entities_from_dataframe(chunk)
+
     def collect_entities_from_source(
         self,
     ) -> tuple[list[Exoplanet], list[Star]]:
+        if self.chunk_size:
+            exoplanets: list[Exoplanet] = []
+            stars: list[Star] = []
+            for chunk_exoplanets, chunk_stars in self.iter_entities_from_source():
+                exoplanets.extend(chunk_exoplanets)
+                stars.extend(chunk_stars)
+            return exoplanets, stars
+
         df: pd.DataFrame | None = self.load_source_dataframe()
         if df is None:
             logger.error("Chargement des données impossible.")
@@ -5,7 +5,7 @@ from typing import Any
 import pandas as pd
 
 from src.collectors.base_collector import BaseCollector
-from src.models.entities.exoplanet_entity import Exoplanet, ValueWithUncertainty
+from src.models.entities.exoplanet_entity import Exoplanet, intern_value_with_uncertainty
 from src.models.entities.star_entity import Star
 from src.models.references.reference import SourceType
 
@@ -13,8 +13,42 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 
 class ExoplanetEUCollector(BaseCollector):
-    def __init__(self, cache_dir: str = "data/cache/exoplanet_eu", use_mock_data: bool = False):
-        super().__init__(cache_dir, use_mock_data)
+    # Correspondances attribut Exoplanet -> colonne CSV
+    ORBITAL_FIELDS: list[tuple[str, str]] = [
+        ("pl_semi_major_axis", "semi_major_axis"),
+        ("pl_eccentricity", "eccentricity"),
+        ("pl_orbital_period", "orbital_period"),
+        ("pl_inclination", "inclination"),
+        ("pl_argument_of_periastron", "argument_of_periastron"),
+        ("pl_periastron_time", "periastron_time"),
+    ]
+    PHYSICAL_FIELDS: list[tuple[str, str]] = [
+        ("pl_mass", "mass"),
+        ("pl_radius", "radius"),
+        ("pl_temperature", "temperature"),
+    ]
+    STAR_INFO_FIELDS: list[tuple[str, str]] = [
+        ("st_spectral_type", "spectral_type"),
+        ("st_temperature", "star_temperature"),
+        ("st_radius", "star_radius"),
+        ("st_mass", "star_mass"),
+        ("st_distance", "distance"),
+        ("st_apparent_magnitude", "apparent_magnitude"),
+    ]
+    TEXT_COLUMNS: tuple[str, ...] = ("name", "star_name", "alt_names")
+
+    def __init__(
+        self,
+        cache_dir: str = "data/cache/exoplanet_eu",
+        use_mock_data: bool = False,
+        compress_cache: bool = False,
+        revalidate_cache: bool = False,
+        cache_max_age: float | None = None,
+        chunk_size: int | None = None,
+    ):
+        super().__init__(
+            cache_dir, use_mock_data, compress_cache, revalidate_cache, cache_max_age, chunk_size
+        )
 
     def get_default_cache_filename(self) -> str:
         return "exoplanet.eu_catalog.csv"
@@ -34,38 +68,27 @@ class ExoplanetEUCollector(BaseCollector):
     def get_csv_reader_options(self) -> dict[str, Any]:
         return {"comment": "#"}
 
+    def get_used_csv_columns(self) -> set[str] | None:
+        mapped_fields = self.ORBITAL_FIELDS + self.PHYSICAL_FIELDS + self.STAR_INFO_FIELDS
+        return {csv_field for _, csv_field in mapped_fields} | set(self.TEXT_COLUMNS)
+
+    def get_csv_column_dtypes(self) -> dict[str, Any]:
+        return dict.fromkeys(self.TEXT_COLUMNS, "str")
+
     def _set_orbital_characteristics(self, exoplanet: Exoplanet, row: pd.Series) -> None:
-        for field, csv_field in [
-            ("semi_major_axis", "semi_major_axis"),
-            ("eccentricity", "eccentricity"),
-            ("orbital_period", "orbital_period"),
-            ("inclination", "inclination"),
-            ("argument_of_periastron", "argument_of_periastron"),
-            ("periastron_time", "periastron_time"),
-        ]:
+        for field, csv_field in self.ORBITAL_FIELDS:
             value: float | None = self.convert_to_float_if_possible(row.get(csv_field))
             if value is not None:
-                setattr(exoplanet, field, ValueWithUncertainty(value=value))
+                setattr(exoplanet, field, intern_value_with_uncertainty(value=value))
 
     def _set_physical_characteristics(self, exoplanet: Exoplanet, row: pd.Series) -> None:
-        for field, csv_field in [
-            ("mass", "mass"),
-            ("radius", "radius"),
-            ("temperature", "temperature"),
-        ]:
+        for field, csv_field in self.PHYSICAL_FIELDS:
             value = self.convert_to_float_if_possible(row.get(csv_field))
             if value is not None:
-                setattr(exoplanet, field, ValueWithUncertainty(value=value))
+                setattr(exoplanet, field, intern_value_with_uncertainty(value=value))
 
     def _set_star_info(self, exoplanet: Exoplanet, row: pd.Series) -> None:
-        for field, csv_field in [
-            ("spectral_type", "spectral_type"),
-            ("star_temperature", "star_temperature"),
-            ("star_radius", "star_radius"),
-            ("star_mass", "star_mass"),
-            ("distance", "distance"),
-            ("apparent_magnitude", "apparent_magnitude"),
-        ]:
+        for field, csv_field in self.STAR_INFO_FIELDS:
             value = row.get(csv_field)
             if pd.notna(value):
                 processed_value: float | None | str = (
@@ -79,7 +102,7 @@ class ExoplanetEUCollector(BaseCollector):
                         setattr(
                             exoplanet,
                             field,
-                            processed_value,
+                            intern_value_with_uncertainty(value=processed_value),
                         )
                     else:
                         setattr(exoplanet, field, processed_value)
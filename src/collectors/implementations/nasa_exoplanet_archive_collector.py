@@ -1,13 +1,19 @@
 # src/collectors/implementations/nasa_exoplanet_archive_collector.py
+import io
 import logging
+import os
+from dataclasses import fields
 from typing import Any
+from urllib.parse import quote_plus
 
 import pandas as pd
+import requests
 
 from src.collectors.base_collector import BaseCollector
 from src.core.config import CACHE_PATHS
 from src.mappers.nasa_exoplanet_archive_mapper import NasaExoplanetArchiveMapper
 from src.models.entities.exoplanet_entity import Exoplanet
+from src.models.entities.nea_entity import NEA_ENTITY
 from src.models.entities.star_entity import Star
 from src.models.references.reference import SourceType
 
@@ -16,19 +22,49 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 class NasaExoplanetArchiveCollector(BaseCollector):
     BASE_NEARCHIVE_URL = "https://exoplanetarchive.ipac.caltech.edu"
-    NEARCHIVE_CSV_ENDPOINT = (
-        f"{BASE_NEARCHIVE_URL}/TAP/sync?query=select+*+from+PSCompPars&format=csv"
-    )
+    NEARCHIVE_TAP_SYNC_URL = f"{BASE_NEARCHIVE_URL}/TAP/sync"
+    NEARCHIVE_TABLE = "PSCompPars"
+    NEARCHIVE_CSV_ENDPOINT = f"{NEARCHIVE_TAP_SYNC_URL}?query=select+*+from+PSCompPars&format=csv"
+    # Date de dernière mise à jour d'une ligne, utilisée pour le mode incrémental
+    ROW_UPDATE_COLUMN = "rowupdate"
+    # Colonnes existant réellement dans PSCompPars (une requête TAP échoue sur une
+    # colonne inconnue)
+    NEARCHIVE_COLUMNS: frozenset[str] = frozenset(f.name for f in fields(NEA_ENTITY)) | {
+        ROW_UPDATE_COLUMN
+    }
 
     def __init__(
         self,
         cache_dir: str = "data",
         use_mock_data: bool = False,
         custom_cache_filename: str | None = None,
+        use_vectorized_mapping: bool = True,
+        compress_cache: bool = False,
+        revalidate_cache: bool = False,
+        cache_max_age: float | None = None,
+        incremental_fetch: bool = False,
+        chunk_size: int | None = None,
     ):
         self._custom_cache_filename = custom_cache_filename
+        self.use_vectorized_mapping = use_vectorized_mapping
+        self.incremental_fetch = incremental_fetch
+        if incremental_fetch and use_mock_data:
+            logger.warning("Mise à jour incrémentale ignorée avec les données mockées.")
+            self.incremental_fetch = False
+        if self.incremental_fetch and cache_max_age is None:
+            # Sans durée de validité, le cache ne serait jamais frais : chaque exécution
+            # redemanderait les lignes modifiées
+            cache_max_age = CACHE_PATHS["nasa_exoplanet_archive"]["max_age"]
 
-        super().__init__(cache_dir, use_mock_data)
+        # Le mode incrémental rafraîchit le cache dès qu'il dépasse cache_max_age
+        super().__init__(
+            cache_dir,
+            use_mock_data,
+            compress_cache,
+            revalidate_cache or self.incremental_fetch,
+            cache_max_age,
+            chunk_size,
+        )
         self.mapper = NasaExoplanetArchiveMapper()
 
     def get_default_cache_filename(self) -> str:
@@ -38,7 +74,23 @@ class NasaExoplanetArchiveCollector(BaseCollector):
         return CACHE_PATHS["nasa_exoplanet_archive"][mode]
 
     def get_data_download_url(self) -> str:
-        return self.NEARCHIVE_CSV_ENDPOINT
+        return self.build_tap_query_url()
+
+    def get_tap_columns(self) -> list[str]:
+        """Colonnes PSCompPars demandées au serveur TAP : celles que lit le collecteur."""
+        kept_columns = self._get_kept_csv_columns() or set()
+        return sorted((kept_columns | {self.ROW_UPDATE_COLUMN}) & self.NEARCHIVE_COLUMNS)
+
+    def build_tap_query(self, updated_since: str | None = None) -> str:
+        """Requête ADQL limitée aux colonnes utiles (et aux lignes modifiées depuis une date)."""
+        query = f"select {','.join(self.get_tap_columns())} from {self.NEARCHIVE_TABLE}"
+        if updated_since:
+            query += f" where {self.ROW_UPDATE_COLUMN} >= '{updated_since}'"
+        return query
+
+    def build_tap_query_url(self, updated_since: str | None = None) -> str:
+        query = quote_plus(self.build_tap_query(updated_since))
+        return f"{self.NEARCHIVE_TAP_SYNC_URL}?query={query}&format=csv"
 
     def get_source_type(self) -> SourceType:
         return SourceType.NEA
@@ -49,11 +101,81 @@ class NasaExoplanetArchiveCollector(BaseCollector):
     def get_required_csv_columns(self) -> list[str]:
         return ["pl_name", "hostname", "discoverymethod", "disc_year"]
 
+    def get_used_csv_columns(self) -> set[str] | None:
+        return self.mapper.get_source_columns()
+
+    def get_csv_column_dtypes(self) -> dict[str, Any]:
+        return self.mapper.get_source_column_dtypes()
+
     def get_csv_reader_options(self) -> dict[str, Any]:
         # Le fichier téléchargé de NEA n'a pas de lignes de commentaire typiques à ignorer avec '#' au début.
         # Si le fichier que vous sauvegardez/mockez en a, ajustez ici.
         return {}
 
+    def refresh_cache(self, conditional: bool = False) -> str | None:
+        if self.incremental_fetch and os.path.exists(self.cache_path):
+            try:
+                if self.merge_incremental_update():
+                    return "downloaded"
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Erreur HTTP lors de la mise à jour incrémentale : {e}")
+                return None
+            except Exception as e:
+                logger.warning(
+                    f"Mise à jour incrémentale impossible ({e}), téléchargement complet."
+                )
+        return super().refresh_cache(conditional)
+
+    def merge_incremental_update(self) -> bool:
+        """
+        Récupère les lignes modifiées depuis la dernière mise à jour du cache et les
+        fusionne dans celui-ci (remplacement par pl_name, ajout des nouvelles planètes).
+
+        Le filtre porte sur rowupdate >= la date la plus récente du cache (la granularité
+        étant le jour, les lignes de ce jour sont redemandées ; la fusion est idempotente).
+        Les planètes retirées de l'archive ne sont pas détectées : un téléchargement
+        complet (sans --incremental-fetch) les élimine.
+
+        Returns:
+            False si le cache ne permet pas de fusion (colonnes différentes, pas de
+            rowupdate, pl_name non unique) : un téléchargement complet est alors requis.
+        """
+        # Lecture brute (texte) : les lignes non modifiées sont réécrites à l'identique
+        cached = pd.read_csv(self.cache_path, dtype=str, keep_default_na=False)
+        expected_columns = set(self.get_tap_columns())
+        if set(cached.columns) != expected_columns or not cached["pl_name"].is_unique:
+            logger.info("Cache NEA incompatible avec une mise à jour incrémentale.")
+            return False
+
+        updated_since = cached[self.ROW_UPDATE_COLUMN].max()
+        if not updated_since:
+            return False
+
+        url = self.build_tap_query_url(updated_since)
+        logger.info(f"Mise à jour incrémentale NEA depuis {updated_since} : {url}")
+        response = requests.get(url, timeout=self.DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+        delta = pd.read_csv(io.StringIO(response.text), dtype=str, keep_default_na=False)
+        if set(delta.columns) != expected_columns:
+            return False
+
+        delta = delta.drop_duplicates(subset="pl_name", keep="last").set_index("pl_name")
+        merged = cached.set_index("pl_name")
+        new_names = delta.index.difference(merged.index, sort=False)
+        merged = pd.concat([merged, delta.loc[new_names]])
+        merged.update(delta)
+        merged = merged.reset_index()[cached.columns]
+
+        tmp_path = f"{self.cache_path}.tmp"
+        merged.to_csv(tmp_path, index=False, compression="gzip" if self.compress_cache else None)
+        os.replace(tmp_path, self.cache_path)
+        self._write_cache_metadata(url, response.headers)
+        logger.info(
+            f"{len(delta) - len(new_names)} planètes mises à jour et {len(new_names)} "
+            f"ajoutées ({len(response.content)} octets reçus)."
+        )
+        return True
+
     def transform_row_to_exoplanet(self, row: pd.Series) -> Exoplanet | None:
         """
         Converts a pandas Series (row from a CSV/DataFrame) to an Exoplanet object,
@@ -70,7 +192,9 @@ class NasaExoplanetArchiveCollector(BaseCollector):
                 return None
 
             # Déléguer toute la logique de mappage et de création de l'objet au mapper.
-            exoplanet: Exoplanet = self.mapper.map_exoplanet_from_nea_record(nea_data_dict)
+            exoplanet: Exoplanet = self.mapper.map_exoplanet_from_nea_record(
+                nea_data_dict, plans=self.mapper.get_record_plans(row.index)
+            )
             return exoplanet
         except Exception as e:
             logger.error(
@@ -95,7 +219,9 @@ class NasaExoplanetArchiveCollector(BaseCollector):
                 return None
 
             # Déléguer toute la logique de mappage et de création de l'objet au mapper.
-            star: Star = self.mapper.map_star_from_nea_record(nea_data_dict)
+            star: Star = self.mapper.map_star_from_nea_record(
+                nea_data_dict, plans=self.mapper.get_record_plans(row.index)
+            )
             return star
         except Exception as e:
             logger.error(
@@ -103,3 +229,84 @@ class NasaExoplanetArchiveCollector(BaseCollector):
                 exc_info=True,
             )
             return None
+
+    def transform_row_to_entities(
+        self, row: pd.Series, with_star: bool = True
+    ) -> tuple[Exoplanet | None, Star | None]:
+        """
+        Converts a row to its Exoplanet and host Star in a single pass: the row is
+        converted to a dict once and shared host fields are parsed once by the mapper.
+        With with_star=False (row not selected as its host's representative), only
+        the Exoplanet is built.
+        """
+        nea_data_dict = row.to_dict()
+        pl_name = nea_data_dict.get("pl_name")
+        hostname = nea_data_dict.get("hostname")
+        with_exoplanet = not (pd.isna(pl_name) or not pl_name)
+        has_hostname = not (pd.isna(hostname) or not hostname)
+        with_star = with_star and has_hostname
+        if not with_exoplanet:
+            logger.warning(
+                f"Exoplanet name (pl_name) is missing or empty for a row. Skipping exoplanet creation. Row data: {nea_data_dict}"
+            )
+        if not has_hostname:
+            logger.warning(
+                f"Star name (hostname) is missing or empty for a row. Skipping star creation. Row data: {nea_data_dict}"
+            )
+        if not (with_exoplanet or with_star):
+            return None, None
+
+        try:
+            return self.mapper.map_entities_from_nea_record(
+                nea_data_dict,
+                with_exoplanet=with_exoplanet,
+                with_star=with_star,
+                plans=self.mapper.get_record_plans(row.index),
+            )
+        except Exception as e:
+            logger.error(
+                f"Unexpected error converting row to Exoplanet/Star using mapper for {pl_name or hostname}: {e}",
+                exc_info=True,
+            )
+            return None, None
+
+    def select_host_star_rows(self, df: pd.DataFrame) -> list[int] | None:
+        """
+        Regroupe les lignes par hostname et retient, pour chaque étoile hôte, la
+        ligne dont les colonnes stellaires sont les mieux renseignées (la première
+        en cas d'égalité). Les étoiles ne sont ainsi mappées qu'une fois par système
+        au lieu d'une fois par planète.
+
+        Retourne les positions (iloc) retenues, triées dans l'ordre du DataFrame.
+        """
+        if "hostname" not in df.columns:
+            return None
+
+        stellar_columns = self.mapper.get_star_source_columns(df.columns)
+        populated = df[stellar_columns].notna().sum(axis=1).reset_index(drop=True)
+        hostnames = df["hostname"].reset_index(drop=True)
+        representatives = populated.groupby(hostnames, sort=False).idxmax()
+        positions = sorted(int(position) for position in representatives)
+        logger.info(f"{len(positions)} étoiles hôtes distinctes pour {len(df)} lignes.")
+        return positions
+
+    def extract_entities_from_dataframe(
+        self, df: pd.DataFrame
+    ) -> tuple[list[Exoplanet], list[Star]]:
+        """
+        Extrait les entités du DataFrame NEA.
+
+        Par défaut le mapping est vectorisé (colonne par colonne) ; le parcours
+        ligne par ligne de BaseCollector reste disponible avec
+        use_vectorized_mapping=False.
+        """
+        if not self.use_vectorized_mapping:
+            return super().extract_entities_from_dataframe(df)
+
+        exoplanets, stars = self.mapper.map_entities_from_nea_dataframe(
+            df, star_rows=self.select_host_star_rows(df)
+        )
+        logger.info(
+            f"{len(exoplanets)} exoplanètes et {len(stars)} étoiles extraites (mapping vectorisé)."
+        )
+        return exoplanets, stars
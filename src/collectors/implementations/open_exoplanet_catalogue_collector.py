@@ -1,10 +1,11 @@
 # src/collectors/implementations/open_exoplanet_catalogue_collector.py
 import logging
+from typing import Any
 
 import pandas as pd
 
 from src.collectors.base_collector import BaseCollector
-from src.models.entities.exoplanet_entity import Exoplanet, ValueWithUncertainty
+from src.models.entities.exoplanet_entity import Exoplanet, intern_value_with_uncertainty
 from src.models.entities.star_entity import Star
 from src.models.references.reference import SourceType
 
@@ -12,8 +13,42 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 
 class OpenExoplanetCatalogueCollector(BaseCollector):
-    def __init__(self, cache_dir: str = "data/cache/oec", use_mock_data: bool = False):
-        super().__init__(cache_dir, use_mock_data)
+    # Correspondances attribut Exoplanet -> colonne CSV
+    ORBITAL_FIELDS: list[tuple[str, str]] = [
+        ("pl_semi_major_axis", "semimajoraxis"),
+        ("pl_eccentricity", "eccentricity"),
+        ("pl_orbital_period", "period"),
+        ("pl_inclination", "inclination"),
+        ("pl_argument_of_periastron", "longitudeofperiastron"),
+        ("pl_periastron_time", "periastrontime"),
+    ]
+    PHYSICAL_FIELDS: list[tuple[str, str]] = [
+        ("pl_mass", "mass"),
+        ("pl_radius", "radius"),
+        ("pl_temperature", "temperature"),
+    ]
+    STAR_INFO_FIELDS: list[tuple[str, str]] = [
+        ("st_spectral_type", "spectraltype"),
+        ("st_temperature", "star_temperature"),
+        ("st_radius", "star_radius"),
+        ("st_mass", "star_mass"),
+        ("st_distance", "distance"),
+        ("st_apparent_magnitude", "apparentmagnitude"),
+    ]
+    TEXT_COLUMNS: tuple[str, ...] = ("name", "star_name", "alt_names")
+
+    def __init__(
+        self,
+        cache_dir: str = "data/cache/oec",
+        use_mock_data: bool = False,
+        compress_cache: bool = False,
+        revalidate_cache: bool = False,
+        cache_max_age: float | None = None,
+        chunk_size: int | None = None,
+    ):
+        super().__init__(
+            cache_dir, use_mock_data, compress_cache, revalidate_cache, cache_max_age, chunk_size
+        )
 
     def get_default_cache_filename(self) -> str:
         return "open_exoplanet_catalogue.txt"
@@ -33,38 +68,27 @@ class OpenExoplanetCatalogueCollector(BaseCollector):
 
     # _get_csv_reader_kwargs n'a pas besoin d'être surchargé si le CSV OEC n'a pas de commentaires spéciaux
 
+    def get_used_csv_columns(self) -> set[str] | None:
+        mapped_fields = self.ORBITAL_FIELDS + self.PHYSICAL_FIELDS + self.STAR_INFO_FIELDS
+        return {csv_field for _, csv_field in mapped_fields} | set(self.TEXT_COLUMNS)
+
+    def get_csv_column_dtypes(self) -> dict[str, Any]:
+        return dict.fromkeys(self.TEXT_COLUMNS, "str")
+
     def _set_orbital_characteristics(self, exoplanet: Exoplanet, row: pd.Series) -> None:
-        for field, csv_field in [
-            ("pl_semi_major_axis", "semimajoraxis"),
-            ("pl_eccentricity", "eccentricity"),
-            ("pl_orbital_period", "period"),
-            ("pl_inclination", "inclination"),
-            ("pl_argument_of_periastron", "longitudeofperiastron"),
-            ("pl_periastron_time", "periastrontime"),
-        ]:
+        for field, csv_field in self.ORBITAL_FIELDS:
             value: float | None = self.convert_to_float_if_possible(row.get(csv_field))
             if value is not None:
-                setattr(exoplanet, field, ValueWithUncertainty(value=value))
+                setattr(exoplanet, field, intern_value_with_uncertainty(value=value))
 
     def _set_physical_characteristics(self, exoplanet: Exoplanet, row: pd.Series) -> None:
-        for field, csv_field in [
-            ("pl_mass", "mass"),
-            ("pl_radius", "radius"),
-            ("pl_temperature", "temperature"),
-        ]:
+        for field, csv_field in self.PHYSICAL_FIELDS:
             value = self.convert_to_float_if_possible(row.get(csv_field))
             if value is not None:
-                setattr(exoplanet, field, ValueWithUncertainty(value=value))
+                setattr(exoplanet, field, intern_value_with_uncertainty(value=value))
 
     def _set_star_info(self, exoplanet: Exoplanet, row: pd.Series) -> None:
-        for field, csv_field in [
-            ("st_spectral_type", "spectraltype"),
-            ("st_temperature", "star_temperature"),
-            ("st_radius", "star_radius"),
-            ("st_mass", "star_mass"),
-            ("st_distance", "distance"),
-            ("st_apparent_magnitude", "apparentmagnitude"),
-        ]:
+        for field, csv_field in self.STAR_INFO_FIELDS:
             value = row.get(csv_field)
             if pd.notna(value):
                 processed_value = (
@@ -78,7 +102,7 @@ class OpenExoplanetCatalogueCollector(BaseCollector):
                         setattr(
                             exoplanet,
                             field,
-                            ValueWithUncertainty(value=processed_value),
+                            intern_value_with_uncertainty(value=processed_value),
                         )
                     else:
                         setattr(exoplanet, field, processed_value)
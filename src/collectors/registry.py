@@ -0,0 +1,49 @@
+# src/collectors/registry.py
+"""
+Registre des collecteurs : nom de source -> "module:Classe", à la manière des entry
+points. La classe n'est importée qu'à la première demande, de sorte que seuls les
+collecteurs des sources sélectionnées (et leurs dépendances) sont chargés.
+"""
+
+import importlib
+from typing import Any
+
+COLLECTOR_REGISTRY: dict[str, str] = {
+    "nasa_exoplanet_archive": (
+        "src.collectors.implementations.nasa_exoplanet_archive_collector"
+        ":NasaExoplanetArchiveCollector"
+    ),
+    "exoplanet_eu": "src.collectors.implementations.exoplanet_eu_collector:ExoplanetEUCollector",
+    "open_exoplanet": (
+        "src.collectors.implementations.open_exoplanet_catalogue_collector"
+        ":OpenExoplanetCatalogueCollector"
+    ),
+}
+
+_loaded_collectors: dict[str, type] = {}
+
+
+def register_collector(source: str, spec: str) -> None:
+    """Déclare (ou remplace) le collecteur d'une source, au format "module:Classe"."""
+    if ":" not in spec:
+        raise ValueError(f"Spécification de collecteur invalide (module:Classe) : {spec}")
+    COLLECTOR_REGISTRY[source] = spec
+    _loaded_collectors.pop(source, None)
+
+
+def load_collector_class(source: str) -> Any:
+    """
+    Classe du collecteur de la source, importée à la première demande.
+
+    Raises:
+        ValueError: Si la source est inconnue
+    """
+    if source in _loaded_collectors:
+        return _loaded_collectors[source]
+    spec = COLLECTOR_REGISTRY.get(source)
+    if spec is None:
+        raise ValueError(f"Source inconnue : {source}")
+    module_name, class_name = spec.split(":", 1)
+    collector_class = getattr(importlib.import_module(module_name), class_name)
+    _loaded_collectors[source] = collector_class
+    return collector_class
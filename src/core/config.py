@@ -25,8 +25,36 @@ AVAILABLE_SOURCES: list[str] = [
     "open_exoplanet",
 ]
 
+# Priorité des sources lors de la fusion champ par champ des entités (la première
+# l'emporte), par valeur de SourceType ; FIELD_SOURCE_PRIORITY la redéfinit pour un
+# champ donné, ex. {"pl_mass": ("EPE", "NEA", "OEC")}
+SOURCE_PRIORITY: tuple[str, ...] = ("NEA", "EPE", "OEC")
+FIELD_SOURCE_PRIORITY: dict[str, tuple[str, ...]] = {}
+
+# Table de correspondance de la résolution inter-catalogues (--resolve-entities),
+# réutilisée d'une exécution à l'autre
+ENTITY_MATCH_TABLE_PATH = f"{DEFAULT_CACHE_DIR}/entity_match_table.json"
+
+# Instantané des référentiels consolidés (--repository-snapshot sans chemin), rechargé
+# tant que les catalogues en cache sont inchangés (--rebuild-snapshot pour le reconstruire)
+REPOSITORY_SNAPSHOT_PATH = f"{DEFAULT_CACHE_DIR}/repository_snapshot.pkl"
+
+# Cache SQLite des réponses MediaWiki (existence des articles), par titre interrogé
+# (--wikipedia-cache sans chemin, désactivé par défaut). Un article absent peut être
+# créé entre deux exécutions : sa réponse expire plus vite
+WIKIPEDIA_CACHE_PATH = f"{DEFAULT_CACHE_DIR}/wikipedia_existence.sqlite"
+WIKIPEDIA_CACHE_POSITIVE_TTL = 30 * 24 * 3600  # secondes
+WIKIPEDIA_CACHE_NEGATIVE_TTL = 24 * 3600  # secondes
+
+# Requêtes MediaWiki : débit maximal (seau à jetons partagé par les threads de
+# --wikipedia-workers) et retard de réplication toléré (paramètre maxlag de l'API)
+WIKIPEDIA_REQUESTS_PER_SECOND = 5.0
+WIKIPEDIA_MAXLAG = 5  # secondes
+
 # Chemins de cache pour les différentes sources
-CACHE_PATHS: dict[str, dict[str, str]] = {
+# max_age : durée (secondes) pendant laquelle un cache téléchargé est réutilisé sans
+# revalidation HTTP lorsque --revalidate-cache est actif
+CACHE_PATHS: dict[str, dict[str, str | int]] = {
     "nasa_exoplanet_archive": {
         # "mock": "generated/random_exoplanets_100.csv",
         # "mock": "generated/random_exoplanets_50.csv",
@@ -34,13 +62,16 @@ CACHE_PATHS: dict[str, dict[str, str]] = {
         "mock": "cache/nasa_exoplanet_archive/nea_mock_25.csv",
         # "mock": "cache/nasa_exoplanet_archive/nea_mock_complete.csv",
         "real": "cache/nasa_exoplanet_archive/nea_mock_downloaded.csv",
+        "max_age": 24 * 3600,
     },
     "exoplanet_eu": {
         "mock": "cache/exoplanet_eu/exoplanet_eu_mock.csv",
         "real": "cache/exoplanet_eu/exoplanet_eu.csv",
+        "max_age": 24 * 3600,
     },
     "open_exoplanet": {
         "mock": "cache/oec/open_exoplanet_mock.csv",
         "real": "cache/oec/open_exoplanet.csv",
+        "max_age": 7 * 24 * 3600,
     },
 }
@@ -6,7 +6,6 @@ Ce module simplifié délègue toute la logique aux modules d'orchestration.
 """
 
 from src.orchestration.cli_parser import parse_cli_arguments
-from src.orchestration.pipeline_executor import execute_pipeline
 
 
 def main() -> None:
@@ -16,6 +15,11 @@ def main() -> None:
     Parse les arguments CLI et exécute le pipeline complet.
     """
     args = parse_cli_arguments()
+
+    # Import différé : --help et les erreurs d'arguments ne chargent ni pandas, ni
+    # numpy, ni requests, ni les générateurs
+    from src.orchestration.pipeline_executor import execute_pipeline
+
     execute_pipeline(args)
 
 
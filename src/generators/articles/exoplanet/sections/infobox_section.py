@@ -8,7 +8,6 @@ from src.constants.wikipedia_field_config import (
 from src.models.entities.exoplanet_entity import Exoplanet
 from src.models.infobox_fields import InfoboxMapper
 from src.services.processors.reference_manager import ReferenceManager
-from src.utils.astro.constellation_util import ConstellationUtil
 from src.utils.formatters.article_formatter import ArticleFormatter
 from src.utils.formatters.infobox_field_formatter import InboxFieldFormatter
 
@@ -20,7 +19,6 @@ class InfoboxSection:
         self.reference_manager = reference_manager
         self.inbox_field_formatter = InboxFieldFormatter()
         self.article_util = ArticleFormatter()
-        self.constellation_util = ConstellationUtil()
 
     def generate(self, exoplanet: Exoplanet) -> str:
         """Génère le code wiki de l'infobox."""
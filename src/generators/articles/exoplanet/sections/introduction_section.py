@@ -6,7 +6,6 @@ from src.utils.astro.classification.exoplanet_comparison_util import (
 )
 from src.utils.astro.classification.exoplanet_type_util import ExoplanetTypeUtil
 from src.utils.astro.classification.star_type_util import StarTypeUtil
-from src.utils.astro.constellation_util import ConstellationUtil
 from src.utils.formatters.article_formatter import ArticleFormatter
 from src.utils.lang.french_articles import (
     get_french_article_noun,
@@ -22,7 +21,6 @@ class IntroductionSection:
         self.comparison_util = comparison_util
         self.article_util = article_util
         self.planet_type_util = ExoplanetTypeUtil()
-        self.constellation_util = ConstellationUtil()
         self.star_type_util = StarTypeUtil()
 
     def _compose_host_star_phrase(self, exoplanet: Exoplanet) -> str | None:
@@ -1,12 +1,19 @@
+import dataclasses
+import logging
 import math
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
 
-from src.models.entities.exoplanet_entity import Exoplanet, ValueWithUncertainty
+from src.models.entities.exoplanet_entity import (
+    Exoplanet,
+    ValueWithUncertainty,
+    intern_value_with_uncertainty,
+)
 from src.models.entities.nea_entity import (
     NEA_ENTITY,
     NEA_TO_EXOPLANET_MAPPING,
@@ -16,8 +23,121 @@ from src.models.entities.star_entity import Star
 from src.models.references.reference import Reference, SourceType
 from src.utils.astro.constellation_util import ConstellationUtil
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Attributs convertis en entier plutôt qu'en ValueWithUncertainty
+INTEGER_ATTRIBUTES: frozenset[str] = frozenset(
+    {"disc_year", "sy_star_count", "sy_snum", "cb_flag", "sy_planet_count"}
+)
+
+# Attributs exprimés en log10 dans NEA (convertis en valeur linéaire)
+LOG10_ATTRIBUTES: frozenset[str] = frozenset({"st_luminosity"})
+
+# Exclusions communes aux mappings planète et étoile
+MAPPING_EXCLUSIONS: frozenset[str] = frozenset({"st_name", "pl_name", "reference"})
+
+STAR_ALTNAME_FIELDS: tuple[str, ...] = ("hd_name", "hip_name", "tic_id")
+COORDINATE_FIELDS: tuple[str, ...] = ("rastr", "ra", "decstr", "dec")
+
+# Colonnes NEA purement textuelles, lues sans inférence de type. Les colonnes
+# numériques restent inférées : elles peuvent porter des valeurs composites
+# ("&lt0.1", HTML) que le mapper sait parser.
+TEXT_FIELDS: frozenset[str] = frozenset(
+    {
+        "pl_name",
+        "pl_altname",
+        "hostname",
+        "discoverymethod",
+        "disc_facility",
+        "st_spectype",
+        "rastr",
+        "decstr",
+        *STAR_ALTNAME_FIELDS,
+    }
+)
+
+# Marqueurs des valeurs composites NEA (colonnes *str) : HTML, ± ou limite
+COMPOSITE_MARKERS: re.Pattern[str] = re.compile(r"<span|<div|&plusmn|&gt|&lt")
+
+# Mise en page HTML des colonnes *str : valeur puis erreurs dans des <span> successifs,
+# l'attribut class étant parfois mal guillemeté (class=supersubNumber")
+_HTML_SPAN = r'\s*<span class="?{}"?>([^<&]*)</span>'
+HTML_VALUE_PATTERN: re.Pattern[str] = re.compile(
+    r"<div>"
+    + _HTML_SPAN.format("supersubNumber")
+    + f"(?:{_HTML_SPAN.format('superscript')})?"
+    + f"(?:{_HTML_SPAN.format('subscript')})?"
+    + r"\s*</div>"
+)
+
+# Nombre de chaînes composites distinctes mémorisées par mapper
+COMPOSITE_CACHE_SIZE = 8192
+
+
+def _parses_identically(attribute_a: str, attribute_b: str) -> bool:
+    """Deux attributs partagent le même parsing s'ils ont les mêmes conversions spéciales."""
+    return all(
+        (attribute_a in special) == (attribute_b in special)
+        for special in (INTEGER_ATTRIBUTES, LOG10_ATTRIBUTES)
+    )
+
+
+# Colonnes NEA mappées à la fois sur l'exoplanète et sur son étoile hôte
+# (distance, type spectral, masse stellaire...) : parsées une seule fois par ligne
+SHARED_HOST_FIELDS: frozenset[str] = frozenset(
+    nea_field
+    for nea_field, attribute in NEA_TO_EXOPLANET_MAPPING.items()
+    if nea_field in NEA_TO_STAR_MAPPING
+    and attribute not in MAPPING_EXCLUSIONS
+    and NEA_TO_STAR_MAPPING[nea_field] not in MAPPING_EXCLUSIONS
+    and _parses_identically(attribute, NEA_TO_STAR_MAPPING[nea_field])
+)
+
+SHARED_HOST_MAPPING: dict[str, str] = {
+    nea_field: NEA_TO_STAR_MAPPING[nea_field] for nea_field in sorted(SHARED_HOST_FIELDS)
+}
+
+# Nombre de schémas (jeux de colonnes) dont le plan de mapping est conservé
+MAPPING_PLAN_CACHE_SIZE = 64
+
+
+@dataclasses.dataclass(frozen=True)
+class NeaFieldPlan:
+    """Conversion d'une colonne NEA présente dans le schéma, résolue une fois par schéma."""
+
+    nea_field: str
+    attribute: str
+    err_pos_field: str | None = None
+    err_neg_field: str | None = None
+    is_integer: bool = False
+    is_log10: bool = False
+    is_shared: bool = False
+
+
+@dataclasses.dataclass(frozen=True)
+class NeaRecordPlans:
+    """Plans de mapping d'un schéma pour le parcours ligne par ligne."""
+
+    shared_host: tuple[NeaFieldPlan, ...]
+    exoplanet: tuple[NeaFieldPlan, ...]
+    star: tuple[NeaFieldPlan, ...]
+
+
+@dataclasses.dataclass
+class NeaHostRecord:
+    """Champs d'une ligne NEA communs à la planète et à son étoile, parsés une seule fois."""
+
+    update_date: datetime
+    right_ascension: str | None = None
+    declination: str | None = None
+    constellation: str | None = None
+    st_altname: list[str] | None = None
+    parsed_fields: dict[str, Any] = dataclasses.field(default_factory=dict)
+
 
 def is_invalid_raw_value(value: Any) -> bool:
+    if isinstance(value, float):
+        return math.isnan(value)
     try:
         if value is None:
             return True
@@ -35,34 +155,186 @@ class NasaExoplanetArchiveMapper:
 
     def __init__(self):
         self.constellation_util = ConstellationUtil()
-
-    def map_star_from_nea_record(self, nea_data: NEA_ENTITY) -> Star:
+        # Les mêmes chaînes composites reviennent d'une ligne à l'autre (époques,
+        # limites) : ValueWithUncertainty étant immuable, le résultat est partagé
+        self._parse_composite_memo = lru_cache(maxsize=COMPOSITE_CACHE_SIZE)(
+            self._parse_composite_string
+        )
+        # Plans de mapping compilés, par (colonnes, mapping)
+        self._mapping_plans: dict[tuple, tuple[NeaFieldPlan, ...]] = {}
+        # Derniers plans ligne par ligne et les colonnes (objet Index) qu'ils décrivent
+        self._record_plans_columns: Any = None
+        self._record_plans: NeaRecordPlans | None = None
+
+    def map_star_from_nea_record(
+        self, nea_data: NEA_ENTITY, plans: NeaRecordPlans | None = None
+    ) -> Star:
         return self._map_from_nea_record(
             nea_data,
             model_class=Star,
-            mapping_dict=NEA_TO_STAR_MAPPING,
-            exclusions={"st_name", "pl_name", "reference"},
+            field_plans=(plans or self.get_record_plans(tuple(nea_data))).star,
             is_planet=False,
         )
 
-    def map_exoplanet_from_nea_record(self, nea_data: NEA_ENTITY) -> Exoplanet:
+    def map_exoplanet_from_nea_record(
+        self, nea_data: NEA_ENTITY, plans: NeaRecordPlans | None = None
+    ) -> Exoplanet:
         return self._map_from_nea_record(
             nea_data,
             model_class=Exoplanet,
-            mapping_dict=NEA_TO_EXOPLANET_MAPPING,
-            exclusions={"st_name", "pl_name", "reference"},
+            field_plans=(plans or self.get_record_plans(tuple(nea_data))).exoplanet,
             is_planet=True,
         )
 
+    def map_entities_from_nea_record(
+        self,
+        nea_data: NEA_ENTITY,
+        with_exoplanet: bool = True,
+        with_star: bool = True,
+        plans: NeaRecordPlans | None = None,
+    ) -> tuple[Exoplanet | None, Star | None]:
+        """
+        Construit en une passe l'exoplanète et son étoile hôte depuis une même ligne NEA.
+
+        Les champs communs (coordonnées, constellation, distance, type spectral,
+        identifiants, date de référence) ne sont parsés qu'une fois. plans (voir
+        get_record_plans) évite de retrouver les plans du schéma à chaque ligne.
+        """
+        plans = plans or self.get_record_plans(tuple(nea_data))
+        host_record = self.parse_host_record(nea_data, plans)
+        exoplanet = (
+            self._map_from_nea_record(
+                nea_data,
+                model_class=Exoplanet,
+                field_plans=plans.exoplanet,
+                is_planet=True,
+                host_record=host_record,
+            )
+            if with_exoplanet
+            else None
+        )
+        star = (
+            self._map_from_nea_record(
+                nea_data,
+                model_class=Star,
+                field_plans=plans.star,
+                is_planet=False,
+                host_record=host_record,
+            )
+            if with_star
+            else None
+        )
+        return exoplanet, star
+
+    def get_source_columns(self) -> set[str]:
+        """Colonnes NEA lues par le mapping (valeurs, erreurs, alias, coordonnées)."""
+        source_columns = {"pl_name", *STAR_ALTNAME_FIELDS, *COORDINATE_FIELDS}
+        for nea_field in (*NEA_TO_EXOPLANET_MAPPING, *NEA_TO_STAR_MAPPING):
+            source_columns.update((nea_field, f"{nea_field}_err1", f"{nea_field}_err2"))
+        return source_columns
+
+    def get_source_column_dtypes(self) -> dict[str, str]:
+        """Types explicites des colonnes NEA textuelles (les autres sont inférées)."""
+        return dict.fromkeys(sorted(TEXT_FIELDS), "str")
+
+    def get_star_source_columns(self, columns: Any) -> list[str]:
+        """Colonnes NEA (valeurs, erreurs, alias, coordonnées) qui alimentent une Star."""
+        star_fields = set(STAR_ALTNAME_FIELDS) | set(COORDINATE_FIELDS)
+        for nea_field in NEA_TO_STAR_MAPPING:
+            star_fields.update((nea_field, f"{nea_field}_err1", f"{nea_field}_err2"))
+        return [column for column in columns if column in star_fields]
+
+    def get_mapping_plan(
+        self,
+        columns: tuple[str, ...],
+        mapping_dict: dict[str, str],
+        exclusions: set[str] | frozenset[str] = MAPPING_EXCLUSIONS,
+    ) -> tuple[NeaFieldPlan, ...]:
+        """
+        Plan de mapping d'un schéma : colonnes présentes, attribut cible, conversion
+        (entier, log10) et colonnes d'erreur existantes, calculé une fois par jeu de
+        colonnes puis réutilisé pour chaque ligne.
+        """
+        key = (columns, id(mapping_dict), frozenset(exclusions))
+        cached = self._mapping_plans.get(key)
+        if cached is not None and cached[0] is mapping_dict:
+            return cached[1]
+
+        present = set(columns)
+        plan = tuple(
+            NeaFieldPlan(
+                nea_field=nea_field,
+                attribute=attribute,
+                err_pos_field=f"{nea_field}_err1" if f"{nea_field}_err1" in present else None,
+                err_neg_field=f"{nea_field}_err2" if f"{nea_field}_err2" in present else None,
+                is_integer=attribute in INTEGER_ATTRIBUTES,
+                is_log10=attribute in LOG10_ATTRIBUTES,
+                is_shared=nea_field in SHARED_HOST_FIELDS,
+            )
+            for nea_field, attribute in mapping_dict.items()
+            if nea_field in present and attribute not in exclusions
+        )
+        if len(self._mapping_plans) >= MAPPING_PLAN_CACHE_SIZE:
+            self._mapping_plans.clear()
+        # Le mapping est conservé avec le plan : son id() ne suffit pas à l'identifier
+        self._mapping_plans[key] = (mapping_dict, plan)
+        return plan
+
+    def get_record_plans(self, columns: Any) -> NeaRecordPlans:
+        """
+        Plans (hôte, planète, étoile) d'un schéma pour le parcours ligne par ligne.
+
+        Les lignes d'un DataFrame (iterrows) partagent l'objet Index de ses colonnes :
+        il est reconnu par identité, sans reconstruire ni hacher la liste des colonnes
+        à chaque ligne.
+        """
+        if columns is self._record_plans_columns and self._record_plans is not None:
+            return self._record_plans
+        key = tuple(columns)
+        plans = NeaRecordPlans(
+            shared_host=self.get_mapping_plan(key, SHARED_HOST_MAPPING),
+            exoplanet=self.get_mapping_plan(key, NEA_TO_EXOPLANET_MAPPING, MAPPING_EXCLUSIONS),
+            star=self.get_mapping_plan(key, NEA_TO_STAR_MAPPING, MAPPING_EXCLUSIONS),
+        )
+        self._record_plans_columns, self._record_plans = columns, plans
+        return plans
+
+    def parse_host_record(
+        self, nea_data: NEA_ENTITY, plans: NeaRecordPlans | None = None
+    ) -> NeaHostRecord:
+        """Parse les champs de l'étoile hôte partagés par la planète et l'étoile."""
+        host_record = NeaHostRecord(
+            update_date=datetime.now(),
+            right_ascension=self._resolve_right_ascension(nea_data),
+            declination=self._resolve_declination(nea_data),
+            st_altname=self.extract_star_alternative_names(nea_data),
+        )
+        if host_record.right_ascension and host_record.declination:
+            host_record.constellation = self.constellation_util.get_constellation_name(
+                host_record.right_ascension, host_record.declination
+            )
+
+        plans = plans or self.get_record_plans(tuple(nea_data))
+        for field_plan in plans.shared_host:
+            raw_value = nea_data[field_plan.nea_field]
+            if is_invalid_raw_value(raw_value):
+                continue
+            host_record.parsed_fields[field_plan.nea_field] = self._parse_planned_field(
+                raw_value, nea_data, field_plan
+            )
+        return host_record
+
     def _map_from_nea_record(
         self,
         nea_data: NEA_ENTITY,
         model_class: type,
-        mapping_dict: dict[str, str],
-        exclusions: set[str],
+        field_plans: tuple[NeaFieldPlan, ...],
         is_planet: bool,
+        host_record: NeaHostRecord | None = None,
     ) -> Star | Exoplanet:
-        reference = self.build_reference_from_nea(nea_data, is_planet)
+        reference = self.build_reference_from_nea(
+            nea_data, is_planet, host_record.update_date if host_record else None
+        )
         if is_planet:
             obj = model_class(
                 pl_name=nea_data.get("pl_name"),
@@ -75,27 +347,33 @@ class NasaExoplanetArchiveMapper:
                 reference=reference,
             )
 
-        for nea_field, attribute in mapping_dict.items():
-            if nea_field not in nea_data or attribute in exclusions:
-                continue
-
-            raw_value = nea_data[nea_field]
+        for field_plan in field_plans:
+            if host_record and field_plan.is_shared:
+                # Déjà parsé (None si la valeur brute est invalide)
+                parsed = host_record.parsed_fields.get(field_plan.nea_field)
+            else:
+                raw_value = nea_data[field_plan.nea_field]
 
-            if is_invalid_raw_value(raw_value):
-                continue
+                if is_invalid_raw_value(raw_value):
+                    continue
 
-            # Parsing intelligent de la valeur
-            parsed = self._parse_field(raw_value, nea_data, nea_field, attribute)
+                # Parsing intelligent de la valeur
+                parsed = self._parse_planned_field(raw_value, nea_data, field_plan)
             if parsed is not None:
-                setattr(obj, attribute, parsed)
+                setattr(obj, field_plan.attribute, parsed)
 
         # Post-traitements
         if is_planet:
             obj.pl_altname = self.extract_exoplanet_alternative_names(nea_data)
+        elif host_record:
+            obj.st_altname = list(host_record.st_altname) if host_record.st_altname else None
         else:
             obj.st_altname = self.extract_star_alternative_names(nea_data)
 
-        self.set_coordinates_and_constellation(obj, nea_data, reference)
+        if host_record:
+            self._apply_host_record_coordinates(obj, host_record)
+        else:
+            self.set_coordinates_and_constellation(obj, nea_data, reference)
         return obj
 
     def _parse_field(
@@ -104,25 +382,46 @@ class NasaExoplanetArchiveMapper:
         nea_data: NEA_ENTITY,
         nea_field: str,
         attribute: str,
+    ) -> Any | None:
+        field_plan = NeaFieldPlan(
+            nea_field=nea_field,
+            attribute=attribute,
+            err_pos_field=f"{nea_field}_err1",
+            err_neg_field=f"{nea_field}_err2",
+            is_integer=attribute in INTEGER_ATTRIBUTES,
+            is_log10=attribute in LOG10_ATTRIBUTES,
+        )
+        return self._parse_planned_field(raw_value, nea_data, field_plan)
+
+    def _parse_planned_field(
+        self, raw_value: Any, nea_data: NEA_ENTITY, field_plan: NeaFieldPlan
     ) -> Any | None:
         if isinstance(raw_value, str) and self.is_composite_formatted_string(raw_value):
             return self.parse_composite_formatted_value(raw_value)
 
         try:
             # Cas spécial pour les champs entiers
-            if attribute in ("disc_year", "sy_star_count", "sy_snum", "cb_flag", "sy_planet_count"):
+            if field_plan.is_integer:
                 return int(float(raw_value))
 
             # Cas spécial luminosité exprimée en log10
-            if attribute == "st_luminosity":
+            if field_plan.is_log10:
                 numeric_value = float(10 ** float(raw_value))
             else:
                 numeric_value = float(raw_value)
 
-            err_pos = self._parse_error_value(nea_data.get(f"{nea_field}_err1"))
-            err_neg = self._parse_error_value(nea_data.get(f"{nea_field}_err2"))
+            err_pos = (
+                self._parse_error_value(nea_data.get(field_plan.err_pos_field))
+                if field_plan.err_pos_field
+                else None
+            )
+            err_neg = (
+                self._parse_error_value(nea_data.get(field_plan.err_neg_field))
+                if field_plan.err_neg_field
+                else None
+            )
 
-            return ValueWithUncertainty(
+            return intern_value_with_uncertainty(
                 value=numeric_value,
                 error_positive=err_pos,
                 error_negative=err_neg,
@@ -134,50 +433,287 @@ class NasaExoplanetArchiveMapper:
 
     def _parse_error_value(self, val: Any) -> float | None:
         try:
-            return float(str(val).replace("+", "").replace("-", "")) if val else None
+            return abs(float(val)) if val else None
         except Exception:
             return None
 
+    # ============================================================================
+    # MAPPING VECTORISÉ (DATAFRAME COMPLET)
+    # ============================================================================
+    def map_entities_from_nea_dataframe(
+        self, df: pd.DataFrame, star_rows: list[int] | None = None
+    ) -> tuple[list[Exoplanet], list[Star]]:
+        """
+        Mappe un DataFrame NEA complet colonne par colonne.
+
+        Les triplets valeur/err1/err2 sont convertis en bloc (pd.to_numeric), les
+        masques de validité sont calculés une fois par colonne, et les objets
+        Exoplanet/Star ne sont matérialisés qu'à la fin. Le résultat est identique
+        à celui du mapping ligne par ligne (map_*_from_nea_record).
+
+        star_rows limite le mapping des étoiles aux positions (iloc) indiquées,
+        typiquement une ligne représentative par hostname.
+        """
+        update_date = datetime.now()
+        coordinates = self._resolve_coordinates_column_wise(df)
+
+        star_df = df
+        star_coordinates = coordinates
+        if star_rows is not None:
+            star_df = df.iloc[star_rows]
+            star_coordinates = [coordinates[position] for position in star_rows]
+
+        exoplanets = self._map_nea_dataframe(
+            df,
+            model_class=Exoplanet,
+            mapping_dict=NEA_TO_EXOPLANET_MAPPING,
+            is_planet=True,
+            coordinates=coordinates,
+            update_date=update_date,
+        )
+        stars = self._map_nea_dataframe(
+            star_df,
+            model_class=Star,
+            mapping_dict=NEA_TO_STAR_MAPPING,
+            is_planet=False,
+            coordinates=star_coordinates,
+            update_date=update_date,
+        )
+        return exoplanets, stars
+
+    def _map_nea_dataframe(
+        self,
+        df: pd.DataFrame,
+        model_class: type,
+        mapping_dict: dict[str, str],
+        is_planet: bool,
+        coordinates: list[tuple[str | None, str | None, str | None]],
+        update_date: datetime,
+    ) -> list[Star] | list[Exoplanet]:
+        name_field = "pl_name" if is_planet else "hostname"
+        names = self._column_values(df, name_field)
+        hostnames = self._column_values(df, "hostname")
+        row_indices = [i for i, name in enumerate(names) if not (pd.isna(name) or not name)]
+        skipped = len(df) - len(row_indices)
+        if skipped:
+            logger.warning(f"{skipped} lignes sans {name_field} ignorées ({model_class.__name__}).")
+
+        converted_columns = [
+            (
+                field_plan.attribute,
+                self._convert_nea_column(df, field_plan.nea_field, field_plan.attribute),
+            )
+            for field_plan in self.get_mapping_plan(tuple(df.columns), mapping_dict)
+        ]
+        altname_fields = ("pl_name",) if is_planet else ("hostname", *STAR_ALTNAME_FIELDS)
+        altname_columns = {
+            field: self._column_values(df, field) for field in altname_fields if field in df.columns
+        }
+
+        entities = []
+        for i in row_indices:
+            try:
+                reference = Reference(
+                    source=SourceType.NEA,
+                    update_date=update_date,
+                    consultation_date=update_date,
+                    star_id=hostnames[i],
+                    planet_id=names[i] if is_planet else None,
+                )
+                if is_planet:
+                    obj = model_class(pl_name=names[i], st_name=hostnames[i], reference=reference)
+                else:
+                    obj = model_class(st_name=hostnames[i], reference=reference)
+
+                for attribute, values in converted_columns:
+                    if values[i] is not None:
+                        setattr(obj, attribute, values[i])
+
+                altname_record = {field: values[i] for field, values in altname_columns.items()}
+                if is_planet:
+                    obj.pl_altname = self.extract_exoplanet_alternative_names(altname_record)
+                else:
+                    obj.st_altname = self.extract_star_alternative_names(altname_record)
+
+                self._apply_resolved_coordinates(obj, coordinates[i])
+                entities.append(obj)
+            except Exception as e:
+                logger.exception(
+                    f"Erreur mapping vectorisé ligne {i} ({model_class.__name__}): {e}"
+                )
+        return entities
+
+    def _column_values(self, df: pd.DataFrame, column: str) -> list[Any]:
+        """Valeurs brutes d'une colonne (None partout si la colonne est absente)."""
+        if column not in df.columns:
+            return [None] * len(df)
+        return df[column].tolist()
+
+    def _build_validity_mask(self, column: pd.Series) -> np.ndarray:
+        """Équivalent colonne de is_invalid_raw_value : True pour les cellules exploitables."""
+        valid = column.notna()
+        if not pd.api.types.is_numeric_dtype(column):
+            normalized = column.astype(str).str.strip().str.lower()
+            valid &= ~normalized.isin({"", "nan", "none"})
+        return valid.to_numpy()
+
+    def _convert_error_column(self, df: pd.DataFrame, column: str) -> list[float | None]:
+        """Équivalent colonne de _parse_error_value (None si absent ou nul)."""
+        if column not in df.columns:
+            return [None] * len(df)
+        errors = df[column]
+        if not pd.api.types.is_numeric_dtype(errors) or pd.api.types.is_bool_dtype(errors):
+            return [self._parse_error_value(val) for val in errors.tolist()]
+        values = np.abs(errors.to_numpy(dtype=float, na_value=np.nan))
+        return [None if val == 0 else val for val in values.tolist()]
+
+    def _convert_nea_column(self, df: pd.DataFrame, nea_field: str, attribute: str) -> list[Any]:
+        """
+        Convertit une colonne NEA entière (avec ses colonnes _err1/_err2) en valeurs
+        prêtes à être assignées, None pour les cellules invalides.
+        """
+        raw = df[nea_field]
+        valid = self._build_validity_mask(raw)
+        numeric = pd.to_numeric(raw, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        numeric_values = numeric.tolist()
+        raw_values = raw.tolist() if not pd.api.types.is_numeric_dtype(raw) else None
+
+        err_pos = self._convert_error_column(df, f"{nea_field}_err1")
+        err_neg = self._convert_error_column(df, f"{nea_field}_err2")
+        is_integer = attribute in INTEGER_ATTRIBUTES
+        is_log10 = attribute in LOG10_ATTRIBUTES
+
+        converted: list[Any] = [None] * len(raw)
+        for i in np.flatnonzero(valid).tolist():
+            if raw_values is not None:
+                raw_value = raw_values[i]
+                if isinstance(raw_value, str) and self.is_composite_formatted_string(raw_value):
+                    converted[i] = self.parse_composite_formatted_value(raw_value)
+                    continue
+                if math.isnan(numeric_values[i]):
+                    converted[i] = raw_value  # string "pur"
+                    continue
+
+            value = numeric_values[i]
+            if is_integer:
+                converted[i] = int(value) if math.isfinite(value) else None
+                continue
+            if is_log10:
+                try:
+                    value = float(10**value)
+                except OverflowError:
+                    continue
+            converted[i] = intern_value_with_uncertainty(
+                value=value,
+                error_positive=err_pos[i],
+                error_negative=err_neg[i],
+                sign="±" if err_pos[i] or err_neg[i] else None,
+            )
+        return converted
+
+    def _resolve_coordinates_column_wise(
+        self, df: pd.DataFrame
+    ) -> list[tuple[str | None, str | None, str | None]]:
+        """Résout (ascension droite, déclinaison, constellation) pour chaque ligne."""
+        present = [field for field in COORDINATE_FIELDS if field in df.columns]
+        columns = {field: df[field].tolist() for field in present}
+        positions = []
+        for i in range(len(df)):
+            record = {field: columns[field][i] for field in present}
+            positions.append(
+                (self._resolve_right_ascension(record), self._resolve_declination(record))
+            )
+        constellations = self._resolve_constellations(positions)
+        return [
+            (right_ascension, declination, constellation)
+            for (right_ascension, declination), constellation in zip(
+                positions, constellations, strict=True
+            )
+        ]
+
+    def _resolve_constellations(
+        self, positions: list[tuple[str | None, str | None]]
+    ) -> list[str | None]:
+        """
+        Constellation de chaque position formatée, résolue en un seul lot
+        (ConstellationUtil.get_constellation_names) pour les positions distinctes.
+        """
+        distinct = {position for position in positions if position[0] and position[1]}
+        resolved: dict[tuple[str, str], str | None] = {}
+        batch_keys, batch_ra, batch_dec = [], [], []
+        for position in distinct:
+            degrees = ConstellationUtil.sexagesimal_to_degrees(*position)
+            if degrees is None:
+                resolved[position] = self.constellation_util.get_constellation_name(*position)
+                continue
+            batch_keys.append(position)
+            batch_ra.append(degrees[0])
+            batch_dec.append(degrees[1])
+
+        if batch_keys:
+            names = self.constellation_util.get_constellation_names(batch_ra, batch_dec)
+            resolved.update(zip(batch_keys, names, strict=True))
+        return [resolved.get(position) for position in positions]
+
+    def _apply_resolved_coordinates(
+        self, obj: Any, coordinates: tuple[str | None, str | None, str | None]
+    ) -> None:
+        """Applique des coordonnées et une constellation déjà résolues."""
+        right_ascension, declination, constellation = coordinates
+        if right_ascension:
+            obj.st_right_ascension = right_ascension
+        if declination:
+            obj.st_declination = declination
+        if constellation and obj.st_right_ascension and obj.st_declination:
+            obj.sy_constellation = constellation
+
     # ============================================================================
     # UTILITAIRES DE MAPPING ET DE FORMATAGE
     # ============================================================================
-    def build_reference_from_nea(self, nea_data: NEA_ENTITY, isPlanet: False) -> Reference:
+    def build_reference_from_nea(
+        self, nea_data: NEA_ENTITY, isPlanet: False, update_date: datetime | None = None
+    ) -> Reference:
         """Crée une référence NEA pour les points de données."""
+        update_date = update_date or datetime.now()
         return Reference(
             source=SourceType.NEA,
-            update_date=datetime.now(),
-            consultation_date=datetime.now(),
+            update_date=update_date,
+            consultation_date=update_date,
             star_id=nea_data.get("hostname"),
             planet_id=nea_data.get("pl_name") if isPlanet else None,
         )
 
-    def _set_right_ascension(self, obj: Any, nea_data: NEA_ENTITY) -> None:
+    def _resolve_right_ascension(self, nea_data: NEA_ENTITY) -> str | None:
+        """Ascension droite au format wiki, depuis rastr ou à défaut depuis ra (degrés)."""
         if "rastr" in nea_data and nea_data["rastr"]:
-            formatted_ra = self._format_right_ascension_str(nea_data["rastr"])
-            if formatted_ra:
-                obj.st_right_ascension = formatted_ra
-        elif "ra" in nea_data and nea_data["ra"] is not None:
+            return self._format_right_ascension_str(nea_data["rastr"]) or None
+        if "ra" in nea_data and nea_data["ra"] is not None:
             try:
-                ra_deg = float(nea_data["ra"])
-                formatted_ra_deg = self._format_right_ascension_deg(ra_deg)
-                if formatted_ra_deg:
-                    obj.st_right_ascension = formatted_ra_deg
+                return self._format_right_ascension_deg(float(nea_data["ra"])) or None
             except (ValueError, TypeError):
-                pass
+                return None
+        return None
 
-    def _set_declination(self, obj: Any, nea_data: NEA_ENTITY) -> None:
+    def _resolve_declination(self, nea_data: NEA_ENTITY) -> str | None:
+        """Déclinaison au format wiki, depuis decstr ou à défaut depuis dec (degrés)."""
         if "decstr" in nea_data and nea_data["decstr"]:
-            formatted_dec = self._format_declination_str(nea_data["decstr"])
-            if formatted_dec:
-                obj.st_declination = formatted_dec
-        elif "dec" in nea_data and nea_data["dec"] is not None:
+            return self._format_declination_str(nea_data["decstr"]) or None
+        if "dec" in nea_data and nea_data["dec"] is not None:
             try:
-                dec_deg = float(nea_data["dec"])
-                formatted_dec_deg = self._format_declination_deg(dec_deg)
-                if formatted_dec_deg:
-                    obj.st_declination = formatted_dec_deg
+                return self._format_declination_deg(float(nea_data["dec"])) or None
             except (ValueError, TypeError):
-                pass
+                return None
+        return None
+
+    def _set_right_ascension(self, obj: Any, nea_data: NEA_ENTITY) -> None:
+        formatted_ra = self._resolve_right_ascension(nea_data)
+        if formatted_ra:
+            obj.st_right_ascension = formatted_ra
+
+    def _set_declination(self, obj: Any, nea_data: NEA_ENTITY) -> None:
+        formatted_dec = self._resolve_declination(nea_data)
+        if formatted_dec:
+            obj.st_declination = formatted_dec
 
     def set_coordinates_and_constellation(
         self, obj: Any, nea_data: NEA_ENTITY, reference: Reference
@@ -194,6 +730,15 @@ class NasaExoplanetArchiveMapper:
             if constellation:
                 obj.sy_constellation = constellation
 
+    def _apply_host_record_coordinates(self, obj: Any, host_record: NeaHostRecord) -> None:
+        """Applique les coordonnées et la constellation déjà calculées pour la ligne."""
+        if host_record.right_ascension:
+            obj.st_right_ascension = host_record.right_ascension
+        if host_record.declination:
+            obj.st_declination = host_record.declination
+        if host_record.constellation and obj.st_right_ascension and obj.st_declination:
+            obj.sy_constellation = host_record.constellation
+
     def extract_star_alternative_names(self, nea_data: NEA_ENTITY) -> list | None:
         """Extrait les différentes désignations d'une étoile, en filtrant les valeurs invalides.
         Ne rajoute pas hostname (nom principal) et évite les doublons avec hostname.
@@ -256,8 +801,7 @@ class NasaExoplanetArchiveMapper:
 
     def is_composite_formatted_string(self, raw_value: str) -> bool:
         """Heuristique pour détecter si une chaîne contient une valeur composite (HTML, entités HTML, etc.)"""
-        raw_value = raw_value.strip()
-        return any(sub in raw_value for sub in ("<span", "<div", "&plusmn", "&gt", "&lt"))
+        return COMPOSITE_MARKERS.search(raw_value) is not None
 
     def _parse_plusmn_value(self, epoch_str_val: str) -> ValueWithUncertainty | None:
         try:
@@ -271,6 +815,29 @@ class NasaExoplanetArchiveMapper:
             return None
 
     def _parse_html_value(self, epoch_str_val: str) -> ValueWithUncertainty | None:
+        """
+        Parse la mise en page HTML connue (supersubNumber / superscript / subscript)
+        par expression régulière ; BeautifulSoup ne traite que les autres mises en page.
+        """
+        match = HTML_VALUE_PATTERN.fullmatch(epoch_str_val.strip())
+        if match is None:
+            return self._parse_html_value_with_soup(epoch_str_val)
+
+        val, pos, neg = match.groups()
+        try:
+            return ValueWithUncertainty(
+                value=float(val.strip()),
+                error_positive=float(pos.strip().replace("+", "")) if pos is not None else None,
+                error_negative=float(neg.strip().replace("-", "")) if neg is not None else None,
+                sign="±",
+            )
+        except ValueError:
+            return None
+
+    def _parse_html_value_with_soup(self, epoch_str_val: str) -> ValueWithUncertainty | None:
+        # Import différé : bs4 n'est chargé que pour les mises en page hors expression régulière
+        from bs4 import BeautifulSoup
+
         fixed_html_str = re.sub(r'class=(\w+)"', r'class="\1"', epoch_str_val)
         soup = BeautifulSoup(fixed_html_str, "html.parser")
 
@@ -315,10 +882,14 @@ class NasaExoplanetArchiveMapper:
         """
         Parses the composite string (pl_tranmidstr) which can be in several formats.
         Returns the formatted string or None if parsing fails.
+        Results are memoized per raw string.
         """
         if pd.isna(raw_value) or not isinstance(raw_value, str):
             return None
 
+        return self._parse_composite_memo(raw_value)
+
+    def _parse_composite_string(self, raw_value: str) -> ValueWithUncertainty | None:
         epoch_str_val = raw_value.strip()
 
         # Cas 1 : format avec &plusmn
@@ -1,11 +1,29 @@
 # src/models/entities/exoplanet_entity.py
 
+import math
 from dataclasses import dataclass, field
+from typing import Any
 
 from ..references.reference import Reference
 
+# Clé commune à tous les NaN (NaN != NaN, et hash(nan) dépend de l'objet)
+_NAN_KEY = ("nan",)
+_NEGATIVE_ZERO_KEY = ("-0.0",)
 
-@dataclass(frozen=True)
+
+def _component_key(component: Any) -> Any:
+    if component != component:  # vrai seulement pour NaN
+        return _NAN_KEY
+    if component == 0 and isinstance(component, float) and math.copysign(1.0, component) < 0:
+        return _NEGATIVE_ZERO_KEY
+    return component
+
+
+def _components_equal(left: Any, right: Any) -> bool:
+    return left == right or (left != left and right != right)  # vrai seulement pour NaN
+
+
+@dataclass(frozen=True, slots=True)
 class ValueWithUncertainty:
     """Classe pour représenter une valeur avec ses incertitudes et son signe"""
 
@@ -15,22 +33,79 @@ class ValueWithUncertainty:
     sign: str | None = None  # Ex "<", ">", "±", etc.
 
     def __hash__(self) -> int:
-        """Permet d'utiliser la classe comme clé dans un dictionnaire"""
-        return hash((self.value, self.error_positive, self.error_negative, self.sign))
+        """Permet d'utiliser la classe comme clé dans un dictionnaire (NaN compris)"""
+        return hash(
+            (
+                _component_key(self.value),
+                _component_key(self.error_positive),
+                _component_key(self.error_negative),
+                self.sign,
+            )
+        )
 
     def __eq__(self, other: object) -> bool:
-        """Permet de comparer deux instances de ValueWithUncertainty"""
+        """Permet de comparer deux instances de ValueWithUncertainty (NaN == NaN)"""
+        if self is other:
+            return True
         if not isinstance(other, ValueWithUncertainty):
             return NotImplemented
         return (
-            self.value == other.value
-            and self.error_positive == other.error_positive
-            and self.error_negative == other.error_negative
+            _components_equal(self.value, other.value)
+            and _components_equal(self.error_positive, other.error_positive)
+            and _components_equal(self.error_negative, other.error_negative)
             and self.sign == other.sign
         )
 
+    def __reduce__(self) -> tuple:
+        # Désérialisation par le constructeur : bien plus rapide que le __setstate__
+        # générique des dataclasses gelées à __slots__ (instantanés des référentiels)
+        return (
+            ValueWithUncertainty,
+            (self.value, self.error_positive, self.error_negative, self.sign),
+        )
+
+
+# Une instance par quadruplet : les mêmes valeurs reviennent d'une ligne à l'autre
+# (sy_snum = 1, excentricité nulle, valeurs stellaires répétées pour chaque planète)
+MAX_INTERNED_VALUES = 500_000
+_interned_values: dict[tuple[Any, ...], ValueWithUncertainty] = {}
+
+
+def intern_value_with_uncertainty(
+    value: int | float | None = None,
+    error_positive: int | float | None = None,
+    error_negative: int | float | None = None,
+    sign: str | None = None,
+) -> ValueWithUncertainty:
+    """
+    ValueWithUncertainty partagée (immuable) pour ces valeurs.
+
+    Le type de chaque composante fait partie de la clé : 1 et 1.0 restent distincts.
+    """
+    key = (
+        value.__class__,
+        _component_key(value),
+        error_positive.__class__,
+        _component_key(error_positive),
+        error_negative.__class__,
+        _component_key(error_negative),
+        sign,
+    )
+    interned = _interned_values.get(key)
+    if interned is None:
+        if len(_interned_values) >= MAX_INTERNED_VALUES:
+            _interned_values.clear()
+        interned = _interned_values[key] = ValueWithUncertainty(
+            value, error_positive, error_negative, sign
+        )
+    return interned
+
+
+def clear_interned_values() -> None:
+    _interned_values.clear()
+
 
-@dataclass
+@dataclass(slots=True)
 class Exoplanet:
     """
     Modèle de données pour une exoplanète.
@@ -54,6 +129,7 @@ class Exoplanet:
         st_spectral_type (str): Type spectral de l'étoile (ex: "G0V").
         st_apparent_magnitude (float): Magnitude apparente de l'étoile.
         st_luminosity (ValueWithUncertainty): Luminosité de l'étoile (L☉).
+        st_temperature (ValueWithUncertainty): Température effective de l'étoile (K).
         st_mass (ValueWithUncertainty): Masse de l'étoile (M☉).
         st_radius (ValueWithUncertainty): Rayon de l'étoile (R☉).
         st_variability (ValueWithUncertainty): Variabilité de l'étoile.
@@ -119,6 +195,7 @@ class Exoplanet:
     st_spectral_type: str | None = None
     st_apparent_magnitude: float | None = None
     st_luminosity: ValueWithUncertainty | None = None
+    st_temperature: ValueWithUncertainty | None = None
 
     # Caractéristiques orbitales
     pl_semi_major_axis: ValueWithUncertainty | None = None
@@ -5,7 +5,7 @@ from ..references.reference import Reference
 from .exoplanet_entity import ValueWithUncertainty
 
 
-@dataclass
+@dataclass(slots=True)
 class Star:
     """
     Modèle de données pour une étoile hôte.
@@ -144,6 +144,7 @@ class Star:
     st_mag_r_2: ValueWithUncertainty | None = None
     st_mag_i: ValueWithUncertainty | None = None
     st_mag_i_2: ValueWithUncertainty | None = None
+    st_mag_z: ValueWithUncertainty | None = None
     st_mag_j: ValueWithUncertainty | None = None
     st_mag_j_2: ValueWithUncertainty | None = None
     st_mag_h: ValueWithUncertainty | None = None
@@ -6,10 +6,21 @@ Ce module contient toute la logique d'orchestration du workflow principal,
 séparant les responsabilités en composants modulaires.
 """
 
+from typing import Any
+
 from src.orchestration.cli_parser import parse_cli_arguments
-from src.orchestration.pipeline_executor import execute_pipeline
 
 __all__ = [
     "parse_cli_arguments",
     "execute_pipeline",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # execute_pipeline est chargé à la demande : importer le parseur CLI ne doit pas
+    # entraîner tout le pipeline (pandas, collecteurs, générateurs)
+    if name == "execute_pipeline":
+        from src.orchestration.pipeline_executor import execute_pipeline
+
+        return execute_pipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
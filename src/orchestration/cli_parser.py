@@ -13,6 +13,9 @@ from src.core.config import (
     DEFAULT_CONSOLIDATED_DIR,
     DEFAULT_DRAFTS_DIR,
     DEFAULT_OUTPUT_DIR,
+    REPOSITORY_SNAPSHOT_PATH,
+    WIKIPEDIA_CACHE_PATH,
+    WIKIPEDIA_REQUESTS_PER_SECOND,
     logger,
 )
 
@@ -104,11 +107,139 @@ def parse_cli_arguments() -> argparse.Namespace:
         help="Ne PAS générer les brouillons d'étoiles",
     )
 
+    parser.add_argument(
+        "--compress-cache",
+        action="store_true",
+        help="Compresser en gzip les catalogues téléchargés dans le cache",
+    )
+
+    parser.add_argument(
+        "--collect-workers",
+        type=int,
+        default=1,
+        help=(
+            "Nombre de sources collectées en parallèle (threads) ; l'ingestion garde "
+            "l'ordre des sources (défaut : 1, séquentiel)"
+        ),
+    )
+
+    parser.add_argument(
+        "--revalidate-cache",
+        action="store_true",
+        help=(
+            "Revalider les caches plus anciens que leur max_age (CACHE_PATHS) par requête "
+            "HTTP conditionnelle (If-None-Match / If-Modified-Since)"
+        ),
+    )
+
+    parser.add_argument(
+        "--incremental-fetch",
+        action="store_true",
+        help=(
+            "Rafraîchir le cache NEA expiré en ne téléchargeant que les lignes modifiées "
+            "(rowupdate) puis en les fusionnant"
+        ),
+    )
+
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help=(
+            "Lire les catalogues par blocs de N lignes et ingérer chaque bloc dès sa "
+            "conversion, pour borner la mémoire (défaut : catalogue lu en une fois)"
+        ),
+    )
+
+    parser.add_argument(
+        "--entity-store",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help=(
+            "Enregistrer le catalogue consolidé dans une base SQLite, remplacé en une "
+            "transaction à la fin de la collecte"
+        ),
+    )
+
+    parser.add_argument(
+        "--reuse-entity-store",
+        action="store_true",
+        help=(
+            "Recharger les référentiels depuis --entity-store au lieu de la collecte "
+            "(collecte complète si la base est vide)"
+        ),
+    )
+
+    parser.add_argument(
+        "--resolve-entities",
+        action="store_true",
+        help=(
+            "Rapprocher les exoplanètes des différents catalogues (noms, hôte, position, "
+            "période) avant fusion ; la table de correspondance est mise en cache"
+        ),
+    )
+
+    parser.add_argument(
+        "--repository-snapshot",
+        type=str,
+        nargs="?",
+        const=REPOSITORY_SNAPSHOT_PATH,
+        default=None,
+        metavar="PATH",
+        help=(
+            "Conserver un instantané (pickle) des référentiels consolidés, rechargé au lieu "
+            "de la collecte tant que les catalogues en cache sont inchangés "
+            f'(sans PATH : "{REPOSITORY_SNAPSHOT_PATH}")'
+        ),
+    )
+
+    parser.add_argument(
+        "--rebuild-snapshot",
+        action="store_true",
+        help="Refaire la collecte et réécrire l'instantané même si les sources sont inchangées",
+    )
+
+    parser.add_argument(
+        "--wikipedia-cache",
+        type=str,
+        nargs="?",
+        const=WIKIPEDIA_CACHE_PATH,
+        default=None,
+        metavar="PATH",
+        help=(
+            "Activer le cache SQLite des réponses Wikipedia (existence des articles) : seuls "
+            "les titres absents ou expirés sont demandés à l'API "
+            f'(sans PATH : "{WIKIPEDIA_CACHE_PATH}")'
+        ),
+    )
+
+    parser.add_argument(
+        "--wikipedia-workers",
+        type=int,
+        default=1,
+        help=(
+            "Nombre de lots de 50 titres demandés en parallèle à l'API Wikipedia (threads), "
+            f"dans la limite de {WIKIPEDIA_REQUESTS_PER_SECOND:g} requêtes/s "
+            "(défaut : 1, séquentiel)"
+        ),
+    )
+
     args = parser.parse_args()
+    if args.chunk_size and args.collect_workers > 1:
+        # La collecte parallèle construit chaque catalogue complet : --chunk-size serait ignoré
+        parser.error("--chunk-size ne peut pas être combiné avec --collect-workers > 1")
     logger.info(
         f"Arguments reçus : Sources={args.sources}, Mocks={args.use_mock}, "
         f"SkipWikiCheck={args.skip_wikipedia_check}, "
         f"GenerateExoplanets={args.generate_exoplanets}, GenerateStars={args.generate_stars}, "
-        f"OutputDir={args.output_dir}, DraftsDir={args.drafts_dir}"
+        f"OutputDir={args.output_dir}, DraftsDir={args.drafts_dir}, "
+        f"CompressCache={args.compress_cache}, RevalidateCache={args.revalidate_cache}, "
+        f"CollectWorkers={args.collect_workers}, IncrementalFetch={args.incremental_fetch}, "
+        f"ChunkSize={args.chunk_size}, ResolveEntities={args.resolve_entities}, "
+        f"EntityStore={args.entity_store}, ReuseEntityStore={args.reuse_entity_store}, "
+        f"RepositorySnapshot={args.repository_snapshot}, "
+        f"RebuildSnapshot={args.rebuild_snapshot}, WikipediaCache={args.wikipedia_cache}, "
+        f"WikipediaWorkers={args.wikipedia_workers}"
     )
     return args
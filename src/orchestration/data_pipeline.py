@@ -11,51 +11,140 @@ Responsabilité :
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from src.core.config import logger
+from src.models.entities.exoplanet_entity import Exoplanet
+from src.models.entities.star_entity import Star
 from src.services.processors.data_processor import DataProcessor
 from src.services.processors.statistics_service import StatisticsService
 
 
-def fetch_and_ingest_data(collectors: dict[str, Any], processor: DataProcessor) -> None:
+def fetch_and_ingest_data(
+    collectors: dict[str, Any],
+    processor: DataProcessor,
+    max_workers: int = 1,
+    streaming: bool = False,
+) -> None:
     """
     Récupère les données des collecteurs et les ingère dans le processeur.
 
+    Avec max_workers > 1, les collectes (téléchargement et parsing) tournent en
+    parallèle dans un pool de threads ; l'ingestion reste faite dans l'ordre des
+    collecteurs, si bien que le résultat est identique à l'exécution séquentielle.
+
+    Avec streaming, chaque bloc de lignes lu par un collecteur est ingéré dès qu'il est
+    converti : la mémoire de pointe est bornée par la taille des blocs (chunk_size du
+    collecteur) plutôt que par celle du catalogue. Le pool de threads construirait au
+    contraire chaque catalogue complet en mémoire : streaming l'emporte sur max_workers
+    (avec un avertissement) et les sources sont collectées l'une après l'autre.
+
     Args:
         collectors: Dictionnaire des collecteurs {source_name: collector_instance}
         processor: Instance du DataProcessor pour l'ingestion
+        max_workers: Nombre de collectes menées en parallèle (1 = séquentiel)
+        streaming: Ingère les entités bloc par bloc (iter_entities_from_source)
 
     Raises:
         TypeError: Si les données retournées ne sont pas du bon type
     """
+    if streaming and max_workers > 1:
+        logger.warning(
+            f"Collecte par blocs : les {len(collectors)} sources sont collectées l'une après "
+            f"l'autre (max_workers={max_workers} ignoré) pour borner la mémoire."
+        )
+    elif max_workers > 1 and len(collectors) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(collectors)), thread_name_prefix="collector"
+        ) as executor:
+            futures = {
+                source_name: executor.submit(_collect_from_source, source_name, collector)
+                for source_name, collector in collectors.items()
+            }
+            for source_name, future in futures.items():
+                _ingest_source_entities(processor, source_name, future.result())
+        return
+
     for source_name, collector in collectors.items():
-        logger.info(f"Collecte des données depuis {source_name}...")
+        if streaming:
+            _stream_source_entities(processor, source_name, collector)
+            continue
+        entities = _collect_from_source(source_name, collector)
+        _ingest_source_entities(processor, source_name, entities)
 
-        try:
-            exoplanets, stars = collector.collect_entities_from_source()
 
-            # Validation des types
-            if not isinstance(exoplanets, list):
-                raise TypeError(f"Exoplanets doit être une liste, reçu {type(exoplanets)}")
+def _stream_source_entities(processor: DataProcessor, source_name: str, collector: Any) -> None:
+    """Collecte une source bloc par bloc et ingère chaque bloc dès sa conversion."""
+    logger.info(f"Collecte par blocs des données depuis {source_name}...")
+    exoplanet_count = 0
+    star_count = 0
 
-            if stars is not None and not isinstance(stars, list):
-                raise TypeError(f"Stars doit être une liste ou None, reçu {type(stars)}")
+    try:
+        for exoplanets, stars in collector.iter_entities_from_source():
+            if exoplanets:
+                processor.ingest_exoplanets_from_source(exoplanets, source_name)
+                exoplanet_count += len(exoplanets)
+            if stars:
+                processor.ingest_stars_from_source(stars, source_name)
+                star_count += len(stars)
+    except Exception as e:
+        logger.warning(f"Erreur lors de la collecte depuis {source_name}: {e}")
 
-        except Exception as e:
-            logger.warning(f"Erreur lors de la collecte depuis {source_name}: {e}")
-            continue
+    if not exoplanet_count:
+        logger.info(f"Aucune exoplanète récupérée depuis {source_name}.")
+    if not star_count:
+        logger.info(f"Aucune étoile récupérée depuis {source_name}.")
+
+
+def _collect_from_source(
+    source_name: str, collector: Any
+) -> tuple[list[Exoplanet], list[Star] | None] | None:
+    """
+    Collecte les entités d'une source et valide leurs types.
 
-        # Ingestion des données
-        if exoplanets:
-            processor.ingest_exoplanets_from_source(exoplanets, source_name)
-        else:
-            logger.info(f"Aucune exoplanète récupérée depuis {source_name}.")
+    Returns:
+        (exoplanets, stars), ou None si la collecte a échoué
+    """
+    logger.info(f"Collecte des données depuis {source_name}...")
 
-        if stars:
-            processor.ingest_stars_from_source(stars, source_name)
-        else:
-            logger.info(f"Aucune étoile récupérée depuis {source_name}.")
+    try:
+        exoplanets, stars = collector.collect_entities_from_source()
+
+        # Validation des types
+        if not isinstance(exoplanets, list):
+            raise TypeError(f"Exoplanets doit être une liste, reçu {type(exoplanets)}")
+
+        if stars is not None and not isinstance(stars, list):
+            raise TypeError(f"Stars doit être une liste ou None, reçu {type(stars)}")
+
+    except Exception as e:
+        logger.warning(f"Erreur lors de la collecte depuis {source_name}: {e}")
+        return None
+
+    return exoplanets, stars
+
+
+def _ingest_source_entities(
+    processor: DataProcessor,
+    source_name: str,
+    entities: tuple[list[Exoplanet], list[Star] | None] | None,
+) -> None:
+    """Ingère dans le processeur les entités collectées pour une source."""
+    if entities is None:
+        return
+    exoplanets, stars = entities
+
+    # Ingestion des données
+    if exoplanets:
+        processor.ingest_exoplanets_from_source(exoplanets, source_name)
+    else:
+        logger.info(f"Aucune exoplanète récupérée depuis {source_name}.")
+
+    if stars:
+        processor.ingest_stars_from_source(stars, source_name)
+    else:
+        logger.info(f"Aucune étoile récupérée depuis {source_name}.")
 
 
 def export_consolidated_data(processor: DataProcessor, output_dir: str, timestamp: str) -> None:
@@ -95,8 +184,8 @@ def generate_and_export_statistics(
     """
     # Génération des statistiques
     stats = {
-        "exoplanet": stat_service.generate_statistics_exoplanet(processor.collect_all_exoplanets()),
-        "star": stat_service.generate_statistics_star(processor.collect_all_stars()),
+        "exoplanet": stat_service.generate_statistics_exoplanet(processor.view_all_exoplanets()),
+        "star": stat_service.generate_statistics_star(processor.view_all_stars()),
     }
 
     # Affichage dans les logs
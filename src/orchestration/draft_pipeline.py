@@ -8,6 +8,8 @@ Responsabilité :
 - Persister les brouillons sur le disque
 """
 
+from collections.abc import Callable, Collection
+
 from src.core.config import logger
 from src.models.entities.exoplanet_entity import Exoplanet
 from src.models.entities.star_entity import Star
@@ -33,19 +35,10 @@ def generate_and_persist_exoplanet_drafts(
     Example:
         >>> generate_and_persist_exoplanet_drafts(processor, "data/drafts")
     """
-    exoplanets: list[Exoplanet] = processor.collect_all_exoplanets()
+    exoplanets: Collection[Exoplanet] = processor.view_all_exoplanets()
     total = len(exoplanets)
     logger.info(f"Génération de {total} brouillons d'exoplanètes...")
 
-    # Créer un index des exoplanètes par nom d'étoile hôte
-    exoplanets_by_star_name: dict[str, list[Exoplanet]] = {}
-    for exoplanet in exoplanets:
-        if isinstance(exoplanet, Exoplanet) and exoplanet.st_name:
-            star_name = str(exoplanet.st_name)
-            exoplanets_by_star_name.setdefault(star_name, []).append(exoplanet)
-
-    logger.info(f"Index créé pour {len(exoplanets_by_star_name)} systèmes planétaires")
-
     exoplanet_drafts = {}
     for idx, exoplanet in enumerate(exoplanets, 1):
         exoplanet_name: str = exoplanet.pl_name
@@ -54,10 +47,10 @@ def generate_and_persist_exoplanet_drafts(
             if idx % 100 == 0 or idx == total:
                 logger.info(f"Progression: {idx}/{total} exoplanètes traitées...")
 
-            # Récupérer les planètes du même système
+            # Récupérer les planètes du même système (index hôte du référentiel)
             system_planets = []
             if exoplanet.st_name:
-                system_planets = exoplanets_by_star_name.get(str(exoplanet.st_name), [])
+                system_planets = processor.collect_planets_for_star(str(exoplanet.st_name))
 
             exoplanet_drafts[exoplanet_name] = build_exoplanet_article_draft(
                 exoplanet, system_planets=system_planets
@@ -77,36 +70,28 @@ def generate_and_persist_exoplanet_drafts(
 def generate_and_persist_star_drafts(
     processor: DataProcessor,
     drafts_dir: str,
-    exoplanets: list[Exoplanet] = None,
+    exoplanets: list[Exoplanet] | None = None,
 ) -> None:
     """
     Génère et sauvegarde les brouillons d'articles pour les étoiles.
 
-    Si des exoplanètes sont fournies, elles seront utilisées pour enrichir
-    le contenu des étoiles (liens vers les planètes découvertes).
+    Le contenu des étoiles est enrichi par leurs exoplanètes (liens vers les planètes
+    découvertes), lues dans l'index hôte du référentiel ou, si une liste est
+    fournie, limitées à celle-ci.
 
     Args:
         processor: Instance du DataProcessor
         drafts_dir: Répertoire de sortie pour les brouillons
-        exoplanets: Liste optionnelle d'exoplanètes pour enrichissement
+        exoplanets: Liste optionnelle restreignant les exoplanètes liées
 
     Example:
-        >>> exos = processor.collect_all_exoplanets()
-        >>> generate_and_persist_star_drafts(processor, "data/drafts", exos)
+        >>> generate_and_persist_star_drafts(processor, "data/drafts")
     """
-    stars: list[Star] = processor.collect_all_stars()
+    stars: Collection[Star] = processor.view_all_stars()
     total = len(stars)
     logger.info(f"Génération de {total} brouillons d'étoiles...")
 
-    # Créer un index des exoplanètes par nom d'étoile hôte
-    exoplanets_by_star_name: dict[str, list[Exoplanet]] = {}
-    if exoplanets:
-        for exoplanet in exoplanets:
-            if hasattr(exoplanet, "st_name") and exoplanet.st_name:
-                star_name = str(exoplanet.st_name)
-                exoplanets_by_star_name.setdefault(star_name, []).append(exoplanet)
-
-        logger.info(f"Index créé pour {len(exoplanets_by_star_name)} étoiles avec exoplanètes")
+    planets_for_star = _get_planets_for_star_lookup(processor, exoplanets)
 
     star_drafts = {}
     for idx, star in enumerate(stars, 1):
@@ -116,7 +101,7 @@ def generate_and_persist_star_drafts(
             if idx % 50 == 0 or idx == total:  # Log tous les 50 étoiles au lieu de 100
                 logger.info(f"Progression: {idx}/{total} étoiles traitées...")
 
-            star_exoplanets = exoplanets_by_star_name.get(star_name, [])
+            star_exoplanets = planets_for_star(star_name)
             star_drafts[star_name] = build_star_article_draft(star, exoplanets=star_exoplanets)
         else:
             logger.warning(f"Objet ignoré (type: {type(star)}) pour {star_name}")
@@ -133,7 +118,7 @@ def generate_and_persist_star_drafts(
 def generate_and_persist_star_drafts_separated(
     processor: DataProcessor,
     drafts_dir: str,
-    exoplanets: list[Exoplanet],
+    exoplanets: list[Exoplanet] | None,
     existing_star_articles: dict,
     missing_star_articles: dict,
 ) -> None:
@@ -144,27 +129,18 @@ def generate_and_persist_star_drafts_separated(
     Args:
         processor: Instance du DataProcessor
         drafts_dir: Répertoire de sortie pour les brouillons
-        exoplanets: Liste d'exoplanètes pour enrichissement
+        exoplanets: Liste restreignant les exoplanètes liées (None : index hôte du référentiel)
         existing_star_articles: Dict des étoiles avec articles existants
         missing_star_articles: Dict des étoiles sans articles
     """
-    stars: list[Star] = processor.collect_all_stars()
-    total = len(stars)
+    total = len(processor.view_all_stars())
     logger.info(f"Génération de {total} brouillons d'étoiles (séparés par statut)...")
 
-    # Créer un index des exoplanètes par nom d'étoile hôte
-    exoplanets_by_star_name: dict[str, list[Exoplanet]] = {}
-    if exoplanets:
-        for exoplanet in exoplanets:
-            if hasattr(exoplanet, "st_name") and exoplanet.st_name:
-                star_name = str(exoplanet.st_name)
-                exoplanets_by_star_name.setdefault(star_name, []).append(exoplanet)
+    planets_for_star = _get_planets_for_star_lookup(processor, exoplanets)
 
-        logger.info(f"Index créé pour {len(exoplanets_by_star_name)} étoiles avec exoplanètes")
-
-    # Séparer les étoiles selon leur statut Wikipedia
-    stars_existing = [s for s in stars if s.st_name in existing_star_articles]
-    stars_missing = [s for s in stars if s.st_name in missing_star_articles]
+    # Séparer les étoiles selon leur statut Wikipedia (accès direct par nom)
+    stars_existing = list(processor.iter_stars_by_names(existing_star_articles))
+    stars_missing = list(processor.iter_stars_by_names(missing_star_articles))
 
     logger.info(
         f"Séparation : {len(stars_missing)} étoiles manquantes, "
@@ -182,7 +158,7 @@ def generate_and_persist_star_drafts_separated(
                 logger.info(f"  Progression manquantes: {idx}/{total_missing}")
 
             star_name = star.st_name
-            star_exoplanets = exoplanets_by_star_name.get(star_name, [])
+            star_exoplanets = planets_for_star(star_name)
             missing_drafts[star_name] = build_star_article_draft(star, exoplanets=star_exoplanets)
 
     # Générer les drafts pour les étoiles EXISTANTES (pour comparaison)
@@ -198,7 +174,7 @@ def generate_and_persist_star_drafts_separated(
                 logger.info(f"  Progression existantes: {idx}/{total_existing}")
 
             star_name = star.st_name
-            star_exoplanets = exoplanets_by_star_name.get(star_name, [])
+            star_exoplanets = planets_for_star(star_name)
             existing_drafts[star_name] = build_star_article_draft(star, exoplanets=star_exoplanets)
 
     # Sauvegarder dans les bons dossiers
@@ -213,3 +189,21 @@ def generate_and_persist_star_drafts_separated(
         f"Brouillons d'étoiles sauvegardés : {len(missing_drafts)} manquantes, "
         f"{len(existing_drafts)} existantes"
     )
+
+
+def _get_planets_for_star_lookup(
+    processor: DataProcessor, exoplanets: list[Exoplanet] | None
+) -> Callable[[str], list[Exoplanet]]:
+    """
+    Accès aux exoplanètes d'une étoile : index hôte maintenu par le référentiel, ou
+    index construit sur la liste fournie lorsque les planètes liées sont restreintes.
+    """
+    if exoplanets is None:
+        return processor.collect_planets_for_star
+
+    exoplanets_by_star_name: dict[str, list[Exoplanet]] = {}
+    for exoplanet in exoplanets:
+        if hasattr(exoplanet, "st_name") and exoplanet.st_name:
+            exoplanets_by_star_name.setdefault(str(exoplanet.st_name), []).append(exoplanet)
+    logger.info(f"Index créé pour {len(exoplanets_by_star_name)} étoiles avec exoplanètes")
+    return lambda star_name: exoplanets_by_star_name.get(star_name, [])
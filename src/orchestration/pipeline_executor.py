@@ -11,7 +11,7 @@ Responsabilité :
 import argparse
 from datetime import datetime
 
-from src.core.config import DEFAULT_CONSOLIDATED_DIR, logger
+from src.core.config import DEFAULT_CONSOLIDATED_DIR, ENTITY_MATCH_TABLE_PATH, logger
 from src.orchestration.data_pipeline import (
     export_consolidated_data,
     fetch_and_ingest_data,
@@ -26,6 +26,12 @@ from src.orchestration.service_initializer import (
     initialize_services,
 )
 from src.services.processors.data_processor import DataProcessor
+from src.services.processors.entity_resolver import EntityResolver
+from src.services.repositories.repository_snapshot import (
+    build_source_fingerprints,
+    load_repository_snapshot,
+    save_repository_snapshot,
+)
 from src.utils.directory_util import create_output_directories
 
 
@@ -55,14 +61,29 @@ def execute_pipeline(args: argparse.Namespace) -> None:
     _setup_output_directories(args)
 
     # Étape 2 : Initialisation des services et collecteurs
-    services = initialize_services()
+    services = initialize_services(
+        getattr(args, "entity_store", None),
+        getattr(args, "wikipedia_cache", None),
+        getattr(args, "wikipedia_workers", 1),
+    )
     collectors = initialize_collectors(args)
 
-    # Étape 3 : Initialisation du processeur de données
-    processor = _initialize_data_processor(services)
+    # Étape 3 : Initialisation du processeur de données (la table de correspondance
+    # n'est relue que si les catalogues en cache sont ceux qui l'ont produite)
+    entity_resolver = (
+        EntityResolver(
+            ENTITY_MATCH_TABLE_PATH, source_fingerprints=build_source_fingerprints(collectors)
+        )
+        if getattr(args, "resolve_entities", False)
+        else None
+    )
+    processor = _initialize_data_processor(services, entity_resolver)
 
-    # Étape 4 : Collecte et traitement des données
-    fetch_and_ingest_data(collectors, processor)
+    # Étape 4 : Collecte et traitement des données (ou instantané si sources inchangées,
+    # ou catalogue enregistré avec --reuse-entity-store)
+    if not _load_repositories_from_entity_store(args, processor):
+        _collect_or_restore_repositories(args, collectors, processor, entity_resolver)
+        _save_repositories_to_entity_store(args, processor)
 
     # Étape 5 : Export des données consolidées
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -85,8 +106,7 @@ def execute_pipeline(args: argparse.Namespace) -> None:
             logger.info("Génération des exoplanètes désactivée (--no-generate-exoplanets)")
 
         if args.generate_stars:
-            exoplanets = processor.collect_all_exoplanets()
-            generate_and_persist_star_drafts(processor, args.drafts_dir, exoplanets)
+            generate_and_persist_star_drafts(processor, args.drafts_dir)
         else:
             logger.info("Génération des étoiles désactivée (--no-generate-stars)")
     else:
@@ -104,24 +124,10 @@ def execute_pipeline(args: argparse.Namespace) -> None:
                 f"{len(missing_articles)} exoplanètes sans articles"
             )
 
-            # Récupérer toutes les exoplanètes et créer l'index par système
-            all_exoplanets = processor.collect_all_exoplanets()
-
-            from src.models.entities.exoplanet_entity import Exoplanet
-
-            exoplanets_by_star_name: dict[str, list[Exoplanet]] = {}
-            for exoplanet in all_exoplanets:
-                if isinstance(exoplanet, Exoplanet) and exoplanet.st_name:
-                    star_name = str(exoplanet.st_name)
-                    exoplanets_by_star_name.setdefault(star_name, []).append(exoplanet)
-
-            logger.info(f"Index créé pour {len(exoplanets_by_star_name)} systèmes planétaires")
-
-            # Séparer les exoplanètes selon leur statut Wikipedia
-            exoplanets_missing = [exo for exo in all_exoplanets if exo.pl_name in missing_articles]
-            exoplanets_existing = [
-                exo for exo in all_exoplanets if exo.pl_name in existing_articles
-            ]
+            # Séparer les exoplanètes selon leur statut Wikipedia, par accès direct au
+            # référentiel (les systèmes viennent de son index hôte, maintenu à l'ingestion)
+            exoplanets_missing = list(processor.iter_exoplanets_by_names(missing_articles))
+            exoplanets_existing = list(processor.iter_exoplanets_by_names(existing_articles))
 
             logger.info(
                 f"Génération des brouillons : {len(exoplanets_missing)} manquants, "
@@ -145,7 +151,7 @@ def execute_pipeline(args: argparse.Namespace) -> None:
 
                     system_planets = []
                     if exoplanet.st_name:
-                        system_planets = exoplanets_by_star_name.get(str(exoplanet.st_name), [])
+                        system_planets = processor.collect_planets_for_star(str(exoplanet.st_name))
 
                     missing_drafts[exoplanet.pl_name] = build_exoplanet_article_draft(
                         exoplanet, system_planets=system_planets
@@ -165,7 +171,7 @@ def execute_pipeline(args: argparse.Namespace) -> None:
 
                     system_planets = []
                     if exoplanet.st_name:
-                        system_planets = exoplanets_by_star_name.get(str(exoplanet.st_name), [])
+                        system_planets = processor.collect_planets_for_star(str(exoplanet.st_name))
 
                     existing_drafts[exoplanet.pl_name] = build_exoplanet_article_draft(
                         exoplanet, system_planets=system_planets
@@ -198,13 +204,9 @@ def execute_pipeline(args: argparse.Namespace) -> None:
                 f"{len(missing_star_articles)} sans articles"
             )
 
-            # Générer les drafts pour les étoiles (séparés par statut)
-            all_exoplanets_to_draft = exoplanets_missing + exoplanets_existing
-            if all_exoplanets_to_draft or not args.generate_exoplanets:
-                # Si on ne génère pas les exoplanètes, récupérer toutes les exoplanètes quand même
-                if not args.generate_exoplanets:
-                    all_exoplanets_to_draft = processor.collect_all_exoplanets()
-
+            # Générer les drafts pour les étoiles (séparés par statut) ; leurs exoplanètes
+            # sont lues dans l'index hôte du référentiel
+            if exoplanets_missing or exoplanets_existing or not args.generate_exoplanets:
                 from src.orchestration.draft_pipeline import (
                     generate_and_persist_star_drafts_separated,
                 )
@@ -212,7 +214,7 @@ def execute_pipeline(args: argparse.Namespace) -> None:
                 generate_and_persist_star_drafts_separated(
                     processor,
                     args.drafts_dir,
-                    all_exoplanets_to_draft,
+                    None,
                     existing_star_articles,
                     missing_star_articles,
                 )
@@ -222,6 +224,84 @@ def execute_pipeline(args: argparse.Namespace) -> None:
     logger.info("Pipeline terminé avec succès !")
 
 
+def _collect_or_restore_repositories(
+    args: argparse.Namespace,
+    collectors: dict,
+    processor: DataProcessor,
+    entity_resolver: EntityResolver | None,
+) -> None:
+    """
+    Remplit les référentiels : depuis l'instantané s'il correspond aux catalogues en
+    cache (et que --rebuild-snapshot n'est pas demandé), sinon par la collecte, après
+    laquelle l'instantané est réécrit.
+    """
+    snapshot_path = getattr(args, "repository_snapshot", None)
+    settings = {"resolve_entities": entity_resolver is not None}
+    if snapshot_path and not getattr(args, "rebuild_snapshot", False):
+        fingerprints = build_source_fingerprints(collectors, **settings)
+        if fingerprints is not None and load_repository_snapshot(
+            snapshot_path,
+            processor.exoplanet_repository,
+            processor.star_repository,
+            fingerprints,
+        ):
+            return
+
+    fetch_and_ingest_data(
+        collectors,
+        processor,
+        getattr(args, "collect_workers", 1),
+        streaming=bool(getattr(args, "chunk_size", None)),
+    )
+    if entity_resolver is not None:
+        # Empreintes prises après la collecte : celles des catalogues effectivement résolus
+        entity_resolver.save_match_table(build_source_fingerprints(collectors))
+
+    if snapshot_path:
+        # Empreintes prises après la collecte : les caches viennent d'être rafraîchis
+        fingerprints = build_source_fingerprints(collectors, **settings)
+        if fingerprints is not None:
+            save_repository_snapshot(
+                snapshot_path,
+                processor.exoplanet_repository,
+                processor.star_repository,
+                fingerprints,
+            )
+
+
+def _load_repositories_from_entity_store(
+    args: argparse.Namespace, processor: DataProcessor
+) -> bool:
+    """
+    Recharge les référentiels depuis --entity-store au lieu de la collecte, si
+    --reuse-entity-store est demandé et que la base contient un catalogue.
+
+    Returns:
+        True si les référentiels ont été rechargés
+    """
+    if not getattr(args, "entity_store", None) or not getattr(args, "reuse_entity_store", False):
+        return False
+    store = processor.exoplanet_repository.store
+    if store.count_exoplanets() == 0:
+        logger.warning(f"Aucun catalogue enregistré dans {store.db_path} : collecte complète.")
+        return False
+    processor.exoplanet_repository.load_from_store()
+    processor.star_repository.load_from_store()
+    return True
+
+
+def _save_repositories_to_entity_store(args: argparse.Namespace, processor: DataProcessor) -> None:
+    """
+    Réécrit le catalogue consolidé dans --entity-store, exoplanètes et étoiles en une
+    seule transaction : une exécution interrompue laisse le catalogue précédent intact.
+    """
+    if not getattr(args, "entity_store", None):
+        return
+    with processor.exoplanet_repository.store.transaction():
+        processor.exoplanet_repository.save_to_store()
+        processor.star_repository.save_to_store()
+
+
 def _setup_output_directories(args: argparse.Namespace) -> None:
     """
     Crée les répertoires de sortie nécessaires.
@@ -233,12 +313,15 @@ def _setup_output_directories(args: argparse.Namespace) -> None:
     create_output_directories(args.output_dir, args.drafts_dir, consolidated_dir)
 
 
-def _initialize_data_processor(services: tuple) -> DataProcessor:
+def _initialize_data_processor(
+    services: tuple, entity_resolver: EntityResolver | None = None
+) -> DataProcessor:
     """
     Initialise le DataProcessor avec tous les services.
 
     Args:
         services: Tuple contenant (exo_repo, star_repo, stat_service, wiki_service, export_service)
+        entity_resolver: Résolution inter-catalogues appliquée à l'ingestion (optionnelle)
 
     Returns:
         DataProcessor: Instance configurée du processeur
@@ -257,6 +340,7 @@ def _initialize_data_processor(services: tuple) -> DataProcessor:
         stat_service=stat_service,
         wiki_service=wiki_service,
         export_service=export_service,
+        entity_resolver=entity_resolver,
     )
 
     logger.info("DataProcessor initialisé.")
@@ -5,34 +5,39 @@ Module d'initialisation des services et collecteurs.
 Responsabilité :
 - Initialiser tous les services (repositories, statistics, wikipedia, export)
 - Initialiser les collecteurs de données
-- Factory pattern pour les collecteurs
+- Factory pattern pour les collecteurs (classes chargées via le registre)
 """
 
 import argparse
 import os
 from typing import Any
 
-from src.collectors.implementations.exoplanet_eu_collector import ExoplanetEUCollector
-from src.collectors.implementations.nasa_exoplanet_archive_collector import (
-    NasaExoplanetArchiveCollector,
-)
-from src.collectors.implementations.open_exoplanet_catalogue_collector import (
-    OpenExoplanetCatalogueCollector,
-)
+from src.collectors.registry import COLLECTOR_REGISTRY, load_collector_class
 from src.core.config import (
     CACHE_PATHS,
     DEFAULT_WIKI_USER_AGENT,
+    WIKIPEDIA_CACHE_NEGATIVE_TTL,
+    WIKIPEDIA_CACHE_POSITIVE_TTL,
+    WIKIPEDIA_MAXLAG,
+    WIKIPEDIA_REQUESTS_PER_SECOND,
     logger,
 )
 from src.services.external.export_service import ExportService
 from src.services.external.wikipedia_service import WikipediaService
 from src.services.processors.statistics_service import StatisticsService
 from src.services.repositories.exoplanet_repository import ExoplanetRepository
+from src.services.repositories.sqlite_entity_store import SqliteEntityStore
 from src.services.repositories.star_repository import StarRepository
+from src.utils.wikipedia.token_bucket import TokenBucket
 from src.utils.wikipedia.wikipedia_checker import WikipediaChecker
+from src.utils.wikipedia.wikipedia_existence_cache import WikipediaExistenceCache
 
 
-def initialize_services() -> tuple[
+def initialize_services(
+    entity_store_path: str | None = None,
+    wikipedia_cache_path: str | None = None,
+    wikipedia_workers: int = 1,
+) -> tuple[
     ExoplanetRepository,
     StarRepository,
     StatisticsService,
@@ -42,6 +47,11 @@ def initialize_services() -> tuple[
     """
     Initialise et retourne tous les services principaux.
 
+    Args:
+        entity_store_path: Base SQLite partagée par les repositories (None : en mémoire)
+        wikipedia_cache_path: Cache SQLite des réponses Wikipedia (None : sans cache)
+        wikipedia_workers: Lots de titres demandés en parallèle à l'API Wikipedia
+
     Returns:
         Tuple contenant :
         - ExoplanetRepository: Repository pour les exoplanètes
@@ -53,8 +63,9 @@ def initialize_services() -> tuple[
     Example:
         >>> repos, star_repo, stats, wiki, export = initialize_services()
     """
-    exoplanet_repository = ExoplanetRepository()
-    star_repository = StarRepository()
+    entity_store = SqliteEntityStore(entity_store_path) if entity_store_path else None
+    exoplanet_repository = ExoplanetRepository(store=entity_store)
+    star_repository = StarRepository(store=entity_store)
     stat_service = StatisticsService()
 
     # Configuration du Wikipedia User-Agent
@@ -66,8 +77,25 @@ def initialize_services() -> tuple[
             f"Using Wikipedia User-Agent from environment variable WIKI_USER_AGENT: {wiki_user_agent}"
         )
 
-    wikipedia_checker = WikipediaChecker(user_agent=wiki_user_agent)
-    wiki_service = WikipediaService(wikipedia_checker=wikipedia_checker)
+    wikipedia_cache = (
+        WikipediaExistenceCache(
+            wikipedia_cache_path,
+            positive_ttl=WIKIPEDIA_CACHE_POSITIVE_TTL,
+            negative_ttl=WIKIPEDIA_CACHE_NEGATIVE_TTL,
+        )
+        if wikipedia_cache_path
+        else None
+    )
+    wikipedia_checker = WikipediaChecker(
+        user_agent=wiki_user_agent,
+        cache=wikipedia_cache,
+        rate_limiter=TokenBucket(WIKIPEDIA_REQUESTS_PER_SECOND, capacity=wikipedia_workers),
+        maxlag=WIKIPEDIA_MAXLAG,
+        max_connections=wikipedia_workers,
+    )
+    wiki_service = WikipediaService(
+        wikipedia_checker=wikipedia_checker, max_workers=wikipedia_workers
+    )
     export_service = ExportService()
 
     logger.info("Services initialisés.")
@@ -96,19 +124,26 @@ def initialize_collectors(args: argparse.Namespace) -> dict[str, Any]:
     """
     collectors = {}
     mock_sources = args.use_mock
+    compress_cache = getattr(args, "compress_cache", False)
+    revalidate_cache = getattr(args, "revalidate_cache", False)
+    incremental_fetch = getattr(args, "incremental_fetch", False)
+    chunk_size = getattr(args, "chunk_size", None)
 
-    # Sources de données disponibles
-    data_sources = [
-        "nasa_exoplanet_archive",
-        "exoplanet_eu",
-        "open_exoplanet",
-    ]
-
-    for source in data_sources:
+    # Sources de données disponibles (seuls les collecteurs sélectionnés sont importés)
+    for source in COLLECTOR_REGISTRY:
         if source in args.sources:
             use_mock = source in mock_sources
             cache_path = CACHE_PATHS[source]["mock" if use_mock else "real"]
-            collector = _get_collector_instance(source, use_mock, cache_path)
+            collector = _get_collector_instance(
+                source,
+                use_mock,
+                cache_path,
+                compress_cache=compress_cache,
+                revalidate_cache=revalidate_cache,
+                cache_max_age=CACHE_PATHS[source].get("max_age"),
+                incremental_fetch=incremental_fetch,
+                chunk_size=chunk_size,
+            )
             collectors[source] = collector
             _log_collector_initialization(source, use_mock, cache_path)
 
@@ -116,14 +151,29 @@ def initialize_collectors(args: argparse.Namespace) -> dict[str, Any]:
     return collectors
 
 
-def _get_collector_instance(source: str, use_mock: bool, cache_path: str) -> Any:
+def _get_collector_instance(
+    source: str,
+    use_mock: bool,
+    cache_path: str,
+    compress_cache: bool = False,
+    revalidate_cache: bool = False,
+    cache_max_age: float | None = None,
+    incremental_fetch: bool = False,
+    chunk_size: int | None = None,
+) -> Any:
     """
-    Factory pour créer une instance du collecteur approprié.
+    Factory pour créer une instance du collecteur approprié, dont la classe est
+    importée à la demande depuis le registre des collecteurs.
 
     Args:
         source: Nom de la source de données
         use_mock: Utiliser les données mockées ou non
         cache_path: Chemin du fichier de cache
+        compress_cache: Compresser en gzip le cache téléchargé
+        revalidate_cache: Revalider le cache par requête HTTP conditionnelle
+        cache_max_age: Durée (secondes) de réutilisation du cache sans revalidation
+        incremental_fetch: Rafraîchir le cache NEA par lignes modifiées (rowupdate)
+        chunk_size: Lire le cache par blocs de chunk_size lignes (None : en une fois)
 
     Returns:
         Instance du collecteur approprié
@@ -131,17 +181,21 @@ def _get_collector_instance(source: str, use_mock: bool, cache_path: str) -> Any
     Raises:
         ValueError: Si la source est inconnue
     """
+    cache_options = {
+        "compress_cache": compress_cache,
+        "revalidate_cache": revalidate_cache,
+        "cache_max_age": cache_max_age,
+        "chunk_size": chunk_size,
+    }
+    collector_class = load_collector_class(source)
     if source == "nasa_exoplanet_archive":
-        return NasaExoplanetArchiveCollector(
+        return collector_class(
             use_mock_data=use_mock,
             custom_cache_filename=cache_path,
+            incremental_fetch=incremental_fetch,
+            **cache_options,
         )
-    elif source == "exoplanet_eu":
-        return ExoplanetEUCollector(cache_dir=cache_path, use_mock_data=use_mock)
-    elif source == "open_exoplanet":
-        return OpenExoplanetCatalogueCollector(cache_dir=cache_path, use_mock_data=use_mock)
-    else:
-        raise ValueError(f"Source inconnue : {source}")
+    return collector_class(cache_dir=cache_path, use_mock_data=use_mock, **cache_options)
 
 
 def _log_collector_initialization(source: str, use_mock: bool, cache_path: str) -> None:
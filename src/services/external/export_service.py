@@ -2,6 +2,7 @@
 import csv
 import json
 import logging
+from collections.abc import Collection
 from typing import Any
 
 from src.models.entities.exoplanet_entity import Exoplanet
@@ -106,7 +107,7 @@ class ExportService:
         }
         return data
 
-    def export_exoplanets_to_csv(self, filename: str, exoplanets: list[Exoplanet]) -> None:
+    def export_exoplanets_to_csv(self, filename: str, exoplanets: Collection[Exoplanet]) -> None:
         """Exporte les exoplanètes vers un fichier CSV"""
         logger.info(f"Exporting {len(exoplanets)} exoplanets to CSV: {filename}")
         if not exoplanets:
@@ -116,7 +117,7 @@ class ExportService:
         try:
             with open(filename, "w", newline="", encoding="utf-8") as f:
                 writer = csv.DictWriter(
-                    f, fieldnames=self._exoplanet_to_dict_flat(exoplanets[0]).keys()
+                    f, fieldnames=self._exoplanet_to_dict_flat(next(iter(exoplanets))).keys()
                 )
                 writer.writeheader()
                 writer.writerows(
@@ -126,7 +127,7 @@ class ExportService:
         except Exception as e:
             logger.error(f"Error exporting exoplanets to CSV {filename}: {e}")
 
-    def export_exoplanets_to_json(self, filename: str, exoplanets: list[Exoplanet]) -> None:
+    def export_exoplanets_to_json(self, filename: str, exoplanets: Collection[Exoplanet]) -> None:
         """Exporte les exoplanètes vers un fichier JSON"""
         logger.info(f"Exporting {len(exoplanets)} exoplanets to JSON: {filename}")
         if not exoplanets:
@@ -1,5 +1,7 @@
 # src/services/external/wikipedia_service.py
 import logging
+from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from src.models.entities.exoplanet_entity import Exoplanet
@@ -9,13 +11,47 @@ from src.utils.wikipedia.wikipedia_checker import WikiArticleInfo, WikipediaChec
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+# Limite de l'API MediaWiki par requête
+BATCH_SIZE = 50
+
+
 class WikipediaService:
-    def __init__(self, wikipedia_checker: WikipediaChecker):
+    def __init__(self, wikipedia_checker: WikipediaChecker, max_workers: int = 1):
+        """
+        Args:
+            wikipedia_checker: Client de l'API MediaWiki
+            max_workers: Nombre de lots de 50 titres interrogés en parallèle (threads) ;
+                les résultats sont identiques à l'exécution séquentielle
+        """
         self.wikipedia_checker: WikipediaChecker = wikipedia_checker
+        self.max_workers: int = max_workers
         logger.info("WikipediaService initialized.")
 
+    def _check_batches(
+        self, batches: list[tuple[list[str], dict[str, dict[str, Any]] | None]]
+    ) -> list[dict[str, WikiArticleInfo]]:
+        """
+        Vérifie chaque lot (titres, contexte) et retourne les résultats dans l'ordre des
+        lots, que les requêtes soient séquentielles ou parallèles.
+        """
+        if self.max_workers > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(batches)), thread_name_prefix="wikipedia"
+            ) as executor:
+                return list(executor.map(lambda batch: self._check_batch(*batch), batches))
+        return [self._check_batch(titles, context) for titles, context in batches]
+
+    def _check_batch(
+        self, titles: list[str], context: dict[str, dict[str, Any]] | None
+    ) -> dict[str, WikiArticleInfo]:
+        if context is None:
+            return self.wikipedia_checker.check_article_existence_batch(titles)
+        return self.wikipedia_checker.check_article_existence_batch(
+            titles, exoplanet_context=context
+        )
+
     def fetch_articles_for_exoplanet_batch(
-        self, exoplanets: list[Exoplanet]
+        self, exoplanets: Collection[Exoplanet]
     ) -> dict[str, dict[str, Any]]:
         """
         Vérifie l'existence des articles Wikipedia pour les exoplanètes.
@@ -47,17 +83,13 @@ class WikipediaService:
                 }
 
         # Check in batches
-        batch_size = 50
-        for i in range(0, len(titles_to_check), batch_size):
-            batch_titles = titles_to_check[i : i + batch_size]
+        batches = []
+        for i in range(0, len(titles_to_check), BATCH_SIZE):
+            batch_titles = titles_to_check[i : i + BATCH_SIZE]
             batch_context = {title: context_for_titles[title] for title in batch_titles}
+            batches.append((batch_titles, batch_context))
 
-            batch_results: dict[str, WikiArticleInfo] = (
-                self.wikipedia_checker.check_article_existence_batch(
-                    batch_titles, exoplanet_context=batch_context
-                )
-            )
-
+        for batch_results in self._check_batches(batches):
             # Now, map these flat results back to the per-exoplanet structure
             for queried_title, wiki_info in batch_results.items():
                 exoplanet_name_origin = context_for_titles[queried_title]["exoplanet_name"]
@@ -70,7 +102,7 @@ class WikipediaService:
 
         return all_results
 
-    def fetch_articles_for_star_batch(self, stars: list[Star]) -> dict[str, dict[str, Any]]:
+    def fetch_articles_for_star_batch(self, stars: Collection[Star]) -> dict[str, dict[str, Any]]:
         """
         Vérifie l'existence des articles Wikipedia pour les étoiles.
         Returns a dictionary mapping Star name to a dictionary of its article infos (name -> info dict).
@@ -94,14 +126,12 @@ class WikipediaService:
             }
 
         # Check in batches
-        batch_size = 50
-        for i in range(0, len(titles_to_check), batch_size):
-            batch_titles = titles_to_check[i : i + batch_size]
-
-            batch_results: dict[str, WikiArticleInfo] = (
-                self.wikipedia_checker.check_article_existence_batch(batch_titles)
-            )
+        batches = [
+            (titles_to_check[i : i + BATCH_SIZE], None)
+            for i in range(0, len(titles_to_check), BATCH_SIZE)
+        ]
 
+        for batch_results in self._check_batches(batches):
             # Map results back to the per-star structure
             for queried_title, wiki_info in batch_results.items():
                 star_name_origin = context_for_titles[queried_title]["star_name"]
@@ -161,7 +191,7 @@ class WikipediaService:
 
     def format_article_links_for_export(
         self,
-        exoplanets: list[Exoplanet],
+        exoplanets: Collection[Exoplanet],
         exoplanet_articles_info: dict[str, dict[str, Any]],
         only_existing: bool = False,  # If true, only format for exoplanets with at least one existing article
         only_missing: bool = False,  # If true, only format for exoplanets with no existing articles
@@ -1,5 +1,6 @@
 # src/utils/data_processor.py
 import logging
+from collections.abc import Collection, Iterable, Iterator
 from typing import Any
 
 from src.mappers.nasa_exoplanet_archive_mapper import NasaExoplanetArchiveMapper
@@ -7,6 +8,7 @@ from src.models.entities.exoplanet_entity import Exoplanet
 from src.models.entities.star_entity import Star
 from src.services.external.export_service import ExportService
 from src.services.external.wikipedia_service import WikipediaService
+from src.services.processors.entity_resolver import EntityResolver
 from src.services.processors.statistics_service import StatisticsService
 from src.services.repositories.exoplanet_repository import ExoplanetRepository
 from src.services.repositories.star_repository import StarRepository
@@ -30,12 +32,14 @@ class DataProcessor:
         stat_service: StatisticsService,
         wiki_service: WikipediaService,
         export_service: ExportService,
+        entity_resolver: EntityResolver | None = None,
     ):
         self.exoplanet_repository = exoplanet_repository
         self.star_repository = star_repository
         self.stat_service = stat_service
         self.wiki_service = wiki_service
         self.export_service = export_service
+        self.entity_resolver = entity_resolver
         self.nea_mapper = NasaExoplanetArchiveMapper()
         logger.info("DataProcessor initialized with all services.")
 
@@ -43,11 +47,15 @@ class DataProcessor:
     # INGESTION DES DONNÉES DEPUIS LES SOURCES EXTERNES
     # ============================================================================
 
-    def ingest_exoplanets_from_source(self, exoplanets: list[Exoplanet], source_name: str) -> None:
-        """Ajoute ou fusionne les exoplanètes dans le référentiel."""
+    def ingest_exoplanets_from_source(
+        self, exoplanets: Iterable[Exoplanet], source_name: str
+    ) -> None:
+        """Ajoute ou fusionne les exoplanètes (après résolution inter-catalogues si active)."""
+        if self.entity_resolver is not None:
+            exoplanets = self.entity_resolver.resolve_exoplanets(exoplanets)
         self.exoplanet_repository.add_exoplanets(exoplanets, source_name)
 
-    def ingest_stars_from_source(self, stars: list[Star], source_name: str) -> None:
+    def ingest_stars_from_source(self, stars: Iterable[Star], source_name: str) -> None:
         """Ajoute ou fusionne les étoiles dans le référentiel."""
         self.star_repository.add_stars(stars, source_name)
 
@@ -59,10 +67,30 @@ class DataProcessor:
         """Récupère toutes les exoplanètes consolidées."""
         return self.exoplanet_repository.get_all_exoplanets()
 
+    def view_all_exoplanets(self) -> Collection[Exoplanet]:
+        """Vue sans copie sur les exoplanètes consolidées (taille et parcours)."""
+        return self.exoplanet_repository.exoplanets_view()
+
+    def iter_exoplanets_by_names(self, names: Iterable[str]) -> Iterator[Exoplanet]:
+        """Exoplanètes dont le nom figure dans names (ex. articles manquants)."""
+        return self.exoplanet_repository.iter_exoplanets_by_names(names)
+
+    def collect_planets_for_star(self, star_name: str) -> list[Exoplanet]:
+        """Récupère les exoplanètes d'une étoile hôte (index du référentiel)."""
+        return self.exoplanet_repository.get_planets_for_star(star_name)
+
     def collect_all_stars(self) -> list[Star]:
         """Récupère toutes les étoiles consolidées."""
         return self.star_repository.get_all_stars()
 
+    def view_all_stars(self) -> Collection[Star]:
+        """Vue sans copie sur les étoiles consolidées (taille et parcours)."""
+        return self.star_repository.stars_view()
+
+    def iter_stars_by_names(self, names: Iterable[str]) -> Iterator[Star]:
+        """Étoiles dont le nom figure dans names (ex. articles existants)."""
+        return self.star_repository.iter_stars_by_names(names)
+
     # ============================================================================
     # ANALYSE ET STATISTIQUES DES DONNÉES
     # ============================================================================
@@ -75,12 +103,12 @@ class DataProcessor:
 
     def compute_exoplanet_statistics(self) -> dict[str, Any]:
         """Retourne des statistiques sur les données collectées."""
-        all_exoplanets: list[Exoplanet] = self.exoplanet_repository.get_all_exoplanets()
+        all_exoplanets: Collection[Exoplanet] = self.exoplanet_repository.exoplanets_view()
         return self.stat_service.generate_statistics_exoplanet(all_exoplanets)
 
     def compute_star_statistics(self) -> dict[str, Any]:
         """Retourne des statistiques sur les données collectées."""
-        all_stars: list[Star] = self.star_repository.get_all_stars()
+        all_stars: Collection[Star] = self.star_repository.stars_view()
         return self.stat_service.generate_statistics_star(all_stars)
 
     # ============================================================================
@@ -116,7 +144,7 @@ class DataProcessor:
         """
         Récupère les informations des articles Wikipedia pour toutes les exoplanètes du référentiel.
         """
-        all_exoplanets: list[Exoplanet] = self.exoplanet_repository.get_all_exoplanets()
+        all_exoplanets: Collection[Exoplanet] = self.exoplanet_repository.exoplanets_view()
         if not all_exoplanets:
             logger.warning("No exoplanets in exoplanet_repository to check Wikipedia for.")
             return {}
@@ -152,7 +180,7 @@ class DataProcessor:
         """
         Récupère les informations des articles Wikipedia pour toutes les étoiles du référentiel.
         """
-        all_stars: list[Star] = self.star_repository.get_all_stars()
+        all_stars: Collection[Star] = self.star_repository.stars_view()
         if not all_stars:
             logger.warning("No stars in star_repository to check Wikipedia for.")
             return {}
@@ -164,7 +192,7 @@ class DataProcessor:
 
     def export_all_exoplanets(self, format_type: str, filename: str) -> None:
         """Exporte toutes les données d'exoplanètes."""
-        all_exoplanets: list[Exoplanet] = self.exoplanet_repository.get_all_exoplanets()
+        all_exoplanets: Collection[Exoplanet] = self.exoplanet_repository.exoplanets_view()
         if format_type.lower() == "csv":
             self.export_service.export_exoplanets_to_csv(filename, all_exoplanets)
         elif format_type.lower() == "json":
@@ -187,8 +215,8 @@ class DataProcessor:
         logger.info(
             f"Preparing to export Wikipedia links data for status: {status_description_for_filename}"
         )
-        all_exoplanets_from_repo: list[Exoplanet] = (
-            self.exoplanet_repository.get_all_exoplanets()
+        all_exoplanets_from_repo: Collection[Exoplanet] = (
+            self.exoplanet_repository.exoplanets_view()
         )  # Still needed for context in format_wiki_links_data_for_export
         if not all_exoplanets_from_repo:
             logger.warning(
@@ -0,0 +1,343 @@
+# src/services/processors/entity_resolver.py
+"""
+Résolution inter-catalogues des exoplanètes (NEA, Exoplanet.eu, OEC).
+
+Chaque planète reçue est rapprochée des planètes déjà vues sous un nom canonique
+("Kepler-452 b", "KOI-7016.01" et "Kepler-452b" désignent le même objet). Pour éviter
+une comparaison de toutes les paires, les candidats sont d'abord regroupés par blocs
+(étoile hôte normalisée, préfixe de catalogue + numéro, cellule de ciel) et seules les
+paires d'un même bloc sont évaluées. Les correspondances obtenues forment une table
+persistée en JSON que les exécutions suivantes relisent sans recalcul, tant que les
+catalogues sources (empreintes get_cache_fingerprint des collecteurs) sont inchangés.
+"""
+
+import json
+import logging
+import math
+import os
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.models.entities.exoplanet_entity import Exoplanet
+from src.services.repositories.entity_merge import get_entity_source, normalize_designation
+from src.utils.astro.constellation_util import ConstellationUtil
+from src.utils.wikipedia.draft_util import split_catalog_prefix
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Score minimal pour rattacher une planète à une planète déjà résolue
+MATCH_THRESHOLD = 0.8
+# Côté (degrés) des cellules de ciel ; les 3 × 3 cellules voisines sont interrogées
+SKY_CELL_DEG = 0.1
+# Séparation maximale (degrés) pour considérer deux positions comme identiques (~10")
+SKY_MATCH_RADIUS_DEG = 10 / 3600
+# Écart relatif de période orbitale : concordance en deçà, veto au-delà
+PERIOD_MATCH_TOLERANCE = 0.01
+PERIOD_VETO_TOLERANCE = 0.1
+# À incrémenter à chaque changement des clés de la table (normalisation des noms, score)
+MATCH_TABLE_FORMAT_VERSION = 1
+
+_CATALOG_NUMBER_PATTERN = re.compile(r"\d+")
+_PLANET_LETTER_PATTERN = re.compile(r"[\s\-]?([b-z])$")
+
+
+@dataclass
+class ResolvedPlanet:
+    """Planète résolue : nom canonique et caractéristiques utilisées pour le score."""
+
+    canonical_name: str
+    designations: set[str] = field(default_factory=set)
+    sources: set[str | None] = field(default_factory=set)
+    host_key: str | None = None
+    catalog_keys: set[tuple[str, int]] = field(default_factory=set)
+    letter: str | None = None
+    orbital_period: float | None = None
+    position: tuple[float, float] | None = None
+
+
+class EntityResolver:
+    """
+    Étape de résolution entre les collecteurs et les dépôts : une planète reconnue reçoit
+    le nom canonique dans pl_altname, ce qui permet au dépôt de la fusionner.
+    """
+
+    def __init__(
+        self,
+        match_table_path: str | None = None,
+        threshold: float = MATCH_THRESHOLD,
+        sky_cell_deg: float = SKY_CELL_DEG,
+        source_fingerprints: dict | None = None,
+    ):
+        """
+        Args:
+            match_table_path: Table de correspondance persistée (None : non persistée)
+            threshold: Score minimal d'un rattachement
+            sky_cell_deg: Côté (degrés) des cellules de ciel
+            source_fingerprints: Empreintes des catalogues sources (build_source_fingerprints) ;
+                la table enregistrée n'est relue que si elles sont identiques (None : jamais)
+        """
+        self.match_table_path = match_table_path
+        self.threshold = threshold
+        self.sky_cell_deg = sky_cell_deg
+        self.match_table: dict[str, str] = self._load_match_table(source_fingerprints)
+        self.comparisons = 0
+        self._planets: list[ResolvedPlanet] = []
+        self._by_designation: dict[str, int] = {}
+        self._blocks: dict[tuple, set[int]] = defaultdict(set)
+        self._table_updated = False
+
+    # ============================================================================
+    # RÉSOLUTION
+    # ============================================================================
+
+    def resolve_exoplanets(self, exoplanets: Iterable[Exoplanet]) -> Iterator[Exoplanet]:
+        """Résout les exoplanètes au fil de l'eau (compatible avec l'ingestion par blocs)."""
+        for exoplanet in exoplanets:
+            yield self.resolve_exoplanet(exoplanet)
+
+    def resolve_exoplanet(self, exoplanet: Exoplanet) -> Exoplanet:
+        """Rattache l'exoplanète à son nom canonique (ajouté à pl_altname s'il diffère)."""
+        name_key = normalize_designation(exoplanet.pl_name)
+        if name_key is None:
+            return exoplanet
+
+        source = get_entity_source(exoplanet)
+        table_key = f"{source}:{name_key}"
+        candidate = self._describe(exoplanet, source)
+
+        canonical_name = self.match_table.get(table_key)
+        if canonical_name is not None:
+            index = self._by_designation.get(normalize_designation(canonical_name))
+        else:
+            index = self._find_match(candidate)
+            canonical_name = (
+                self._planets[index].canonical_name if index is not None else exoplanet.pl_name
+            )
+            self.match_table[table_key] = canonical_name
+            self._table_updated = True
+
+        if index is None:
+            candidate.canonical_name = canonical_name
+            candidate.designations.add(normalize_designation(canonical_name))
+            self._register(candidate)
+        else:
+            self._absorb(index, candidate)
+
+        if normalize_designation(canonical_name) != name_key:
+            if exoplanet.pl_altname is None:
+                exoplanet.pl_altname = []
+            known = {normalize_designation(name) for name in exoplanet.pl_altname}
+            if normalize_designation(canonical_name) not in known:
+                exoplanet.pl_altname.append(canonical_name)
+        return exoplanet
+
+    def _find_match(self, candidate: ResolvedPlanet) -> int | None:
+        for designation in candidate.designations:
+            if designation in self._by_designation:
+                return self._by_designation[designation]
+
+        best_index, best_score = None, self.threshold
+        for index in self._candidate_indices(candidate):
+            self.comparisons += 1
+            score = self.score_pair(candidate, self._planets[index])
+            if score >= best_score:
+                best_index, best_score = index, score
+        return best_index
+
+    def _candidate_indices(self, candidate: ResolvedPlanet) -> set[int]:
+        indices: set[int] = set()
+        for block_key in self._query_block_keys(candidate):
+            indices.update(self._blocks.get(block_key, ()))
+        # Deux planètes d'une même source ne sont jamais rapprochées par score
+        return {index for index in indices if not candidate.sources & self._planets[index].sources}
+
+    def score_pair(self, candidate: ResolvedPlanet, resolved: ResolvedPlanet) -> float:
+        """Score de concordance (0 à 1) entre deux planètes d'un même bloc."""
+        if candidate.designations & resolved.designations:
+            return 1.0
+
+        period_match = False
+        if candidate.orbital_period and resolved.orbital_period:
+            deviation = abs(candidate.orbital_period - resolved.orbital_period) / max(
+                candidate.orbital_period, resolved.orbital_period
+            )
+            if deviation > PERIOD_VETO_TOLERANCE:
+                return 0.0
+            period_match = deviation <= PERIOD_MATCH_TOLERANCE
+
+        same_sky = (
+            candidate.position is not None
+            and resolved.position is not None
+            and _angular_distance(candidate.position, resolved.position) <= SKY_MATCH_RADIUS_DEG
+        )
+        same_host = candidate.host_key is not None and candidate.host_key == resolved.host_key
+        same_letter = candidate.letter is not None and candidate.letter == resolved.letter
+
+        if period_match and same_sky:
+            return 0.95
+        if period_match and same_host:
+            return 0.9
+        if same_letter and same_host:
+            return 0.85
+        if same_letter and same_sky:
+            return 0.8
+        return 0.5 if same_host or same_sky else 0.0
+
+    # ============================================================================
+    # BLOCS
+    # ============================================================================
+
+    def _describe(self, exoplanet: Exoplanet, source: str | None) -> ResolvedPlanet:
+        names = [str(name) for name in (exoplanet.pl_name, *(exoplanet.pl_altname or []))]
+        letter_match = _PLANET_LETTER_PATTERN.search(str(exoplanet.pl_name).strip())
+        period = getattr(exoplanet.pl_orbital_period, "value", exoplanet.pl_orbital_period)
+        return ResolvedPlanet(
+            canonical_name=exoplanet.pl_name,
+            designations={key for key in map(normalize_designation, names) if key is not None},
+            sources={source},
+            host_key=normalize_designation(exoplanet.st_name),
+            catalog_keys={key for key in map(_catalog_key, names) if key is not None},
+            letter=letter_match.group(1) if letter_match else None,
+            orbital_period=float(period) if isinstance(period, int | float) else None,
+            position=_parse_position(exoplanet.st_right_ascension, exoplanet.st_declination),
+        )
+
+    def _block_keys(self, planet: ResolvedPlanet) -> set[tuple]:
+        keys: set[tuple] = {("catalog", *key) for key in planet.catalog_keys}
+        if planet.host_key is not None:
+            keys.add(("host", planet.host_key))
+        if planet.position is not None:
+            keys.add(("sky", *self._sky_cell(planet.position)))
+        return keys
+
+    def _query_block_keys(self, candidate: ResolvedPlanet) -> set[tuple]:
+        keys = {key for key in self._block_keys(candidate) if key[0] != "sky"}
+        if candidate.position is not None:
+            ra_cell, dec_cell = self._sky_cell(candidate.position)
+            n_ra_cells = math.ceil(360 / self.sky_cell_deg)
+            for d_ra in (-1, 0, 1):
+                for d_dec in (-1, 0, 1):
+                    keys.add(("sky", (ra_cell + d_ra) % n_ra_cells, dec_cell + d_dec))
+        return keys
+
+    def _sky_cell(self, position: tuple[float, float]) -> tuple[int, int]:
+        return (
+            math.floor(position[0] / self.sky_cell_deg),
+            math.floor(position[1] / self.sky_cell_deg),
+        )
+
+    def _register(self, planet: ResolvedPlanet) -> None:
+        index = len(self._planets)
+        self._planets.append(planet)
+        self._index(index, planet)
+
+    def _absorb(self, index: int, candidate: ResolvedPlanet) -> None:
+        """Complète la planète résolue avec les désignations et mesures du candidat."""
+        resolved = self._planets[index]
+        resolved.designations |= candidate.designations
+        resolved.sources |= candidate.sources
+        resolved.catalog_keys |= candidate.catalog_keys
+        resolved.host_key = resolved.host_key or candidate.host_key
+        resolved.letter = resolved.letter or candidate.letter
+        resolved.orbital_period = resolved.orbital_period or candidate.orbital_period
+        resolved.position = resolved.position or candidate.position
+        self._index(index, resolved)
+
+    def _index(self, index: int, planet: ResolvedPlanet) -> None:
+        for designation in planet.designations:
+            self._by_designation.setdefault(designation, index)
+        for block_key in self._block_keys(planet):
+            self._blocks[block_key].add(index)
+
+    # ============================================================================
+    # TABLE DE CORRESPONDANCE
+    # ============================================================================
+
+    def _load_match_table(self, source_fingerprints: dict | None) -> dict[str, str]:
+        if not self.match_table_path or not os.path.exists(self.match_table_path):
+            return {}
+        try:
+            with open(self.match_table_path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Table de correspondance illisible ({self.match_table_path}) : {e}")
+            return {}
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format_version") != MATCH_TABLE_FORMAT_VERSION
+            or source_fingerprints is None
+            or payload.get("sources") != source_fingerprints
+        ):
+            logger.info(
+                f"Catalogues sources modifiés ou à rafraîchir : table de correspondance "
+                f"reconstruite ({self.match_table_path})"
+            )
+            return {}
+        match_table = payload.get("matches", {})
+        logger.info(
+            f"Table de correspondance chargée : {len(match_table)} entrées "
+            f"({self.match_table_path})"
+        )
+        return match_table
+
+    def save_match_table(self, source_fingerprints: dict | None = None) -> None:
+        """
+        Écrit la table de correspondance, associée aux empreintes des catalogues sources
+        utilisés (prises après la collecte). Sans empreintes, la table n'est pas écrite :
+        elle ne pourrait pas être validée à l'exécution suivante.
+        """
+        if not self.match_table_path or not self._table_updated:
+            return
+        if source_fingerprints is None:
+            logger.info(
+                "Empreintes des catalogues indisponibles : table de correspondance non sauvegardée."
+            )
+            return
+        os.makedirs(os.path.dirname(self.match_table_path) or ".", exist_ok=True)
+        payload = {
+            "format_version": MATCH_TABLE_FORMAT_VERSION,
+            "sources": source_fingerprints,
+            "matches": self.match_table,
+        }
+        tmp_path = f"{self.match_table_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=0, sort_keys=True)
+        os.replace(tmp_path, self.match_table_path)
+        self._table_updated = False
+        logger.info(
+            f"Table de correspondance sauvegardée : {len(self.match_table)} entrées, "
+            f"{self.comparisons} paires évaluées ({self.match_table_path})"
+        )
+
+
+def _catalog_key(name: str) -> tuple[str, int] | None:
+    """
+    Préfixe de catalogue et numéro qui le suit ("KOI-7016.01" -> ("koi", 7016),
+    "K2-18 b" -> ("k2", 18)), None si inconnu.
+    """
+    prefix, designation = split_catalog_prefix(name)
+    number = _CATALOG_NUMBER_PATTERN.search(designation)
+    if prefix == "autre" or number is None:
+        return None
+    return prefix, int(number.group())
+
+
+def _parse_position(right_ascension: Any, declination: Any) -> tuple[float, float] | None:
+    """Position (ra, dec) en degrés depuis des degrés ou le format "HH/MM/SS" / "+DD/MM/SS"."""
+    if right_ascension is None or declination is None:
+        return None
+    if isinstance(right_ascension, int | float) and isinstance(declination, int | float):
+        if math.isnan(right_ascension) or math.isnan(declination):
+            return None
+        return float(right_ascension), float(declination)
+    return ConstellationUtil.sexagesimal_to_degrees(right_ascension, declination)
+
+
+def _angular_distance(first: tuple[float, float], second: tuple[float, float]) -> float:
+    """Séparation approchée (degrés), suffisante aux petites distances comparées ici."""
+    d_ra = abs(first[0] - second[0])
+    d_ra = min(d_ra, 360 - d_ra) * math.cos(math.radians((first[1] + second[1]) / 2))
+    return math.hypot(d_ra, first[1] - second[1])
@@ -1,5 +1,6 @@
 # src/services/processors/statistics_service.py
 import logging
+from collections.abc import Collection
 from typing import Any
 
 from src.models.entities.exoplanet_entity import Exoplanet
@@ -34,7 +35,7 @@ class StatisticsService:
         else:
             ranges_dict["10+"] += 1
 
-    def generate_statistics_exoplanet(self, exoplanets: list[Exoplanet]) -> dict[str, Any]:
+    def generate_statistics_exoplanet(self, exoplanets: Collection[Exoplanet]) -> dict[str, Any]:
         """Génère les statistiques pour les exoplanètes"""
         logger.info(f"Generating statistics for {len(exoplanets)} exoplanets.")
         stats = {
@@ -507,7 +508,7 @@ class StatisticsService:
         else:
             distribution_dict["4+"] += 1
 
-    def generate_statistics_star(self, stars: list[Star]) -> dict[str, Any]:
+    def generate_statistics_star(self, stars: Collection[Star]) -> dict[str, Any]:
         """
         Retourne des statistiques sur les données collectées pour les étoiles.
         """
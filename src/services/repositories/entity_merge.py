@@ -0,0 +1,160 @@
+# src/services/repositories/entity_merge.py
+"""
+Fusion champ par champ des entités issues de plusieurs sources, et index des
+désignations (nom principal, alias, identifiants) permettant de les rapprocher.
+"""
+
+import dataclasses
+import math
+import re
+from collections.abc import Iterable
+from typing import Any
+
+from src.core.config import FIELD_SOURCE_PRIORITY, SOURCE_PRIORITY
+
+# Séparateurs ignorés pour comparer deux désignations ("Kepler-1 b" == "KEPLER 1b")
+_DESIGNATION_SEPARATORS = re.compile(r"[\s\-_.]+")
+# Séparateurs entre deux nombres, conservés comme frontière ("KOI-10.01" != "KOI-1001")
+_DIGIT_BOUNDARY = re.compile(r"(?<=\d)[\s\-_.]+(?=\d)")
+
+# Champs jamais remplacés par la fusion
+_IDENTITY_FIELDS: frozenset[str] = frozenset({"pl_name", "st_name", "reference"})
+
+
+def normalize_designation(name: Any) -> str | None:
+    """
+    Forme canonique d'une désignation : casse et séparateurs ignorés, sauf entre deux
+    nombres où ils deviennent une espace (None si vide).
+    """
+    if is_empty_value(name):
+        return None
+    parts = _DIGIT_BOUNDARY.split(str(name).casefold())
+    key = " ".join(_DESIGNATION_SEPARATORS.sub("", part) for part in parts).strip()
+    return key or None
+
+
+def is_empty_value(value: Any) -> bool:
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return True
+    return isinstance(value, str | list) and not value
+
+
+def get_entity_source(entity: Any) -> str | None:
+    """Source (valeur de SourceType) de la référence d'une entité."""
+    source = getattr(getattr(entity, "reference", None), "source", None)
+    return getattr(source, "value", source)
+
+
+def get_source_rank(source: str | None, field_name: str) -> int:
+    """Rang de la source pour ce champ (0 = prioritaire ; inconnue = dernière)."""
+    priority = FIELD_SOURCE_PRIORITY.get(field_name, SOURCE_PRIORITY)
+    return priority.index(source) if source in priority else len(priority)
+
+
+class DesignationIndex:
+    """Index en mémoire : désignation normalisée -> clé de l'entité dans le dépôt."""
+
+    def __init__(self):
+        self._keys: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def find(self, designations: Iterable[Any]) -> str | None:
+        """Clé de la première désignation connue (None si aucune)."""
+        for designation in designations:
+            key = normalize_designation(designation)
+            if key is not None and key in self._keys:
+                return self._keys[key]
+        return None
+
+    def add(self, designations: Iterable[Any], entity_key: str) -> None:
+        """Associe les désignations à l'entité ; une désignation déjà prise est conservée."""
+        for designation in designations:
+            key = normalize_designation(designation)
+            if key is not None:
+                self._keys.setdefault(key, entity_key)
+
+
+def merge_entity_fields(
+    target: Any,
+    incoming: Any,
+    field_sources: dict[str, str | None],
+    name_field: str,
+    altname_field: str,
+) -> int:
+    """
+    Fusionne incoming dans target, champ par champ.
+
+    Un champ vide de target est complété ; un champ renseigné n'est remplacé que si la
+    source d'incoming est prioritaire pour ce champ (SOURCE_PRIORITY /
+    FIELD_SOURCE_PRIORITY). Les listes sont réunies et le nom principal d'incoming
+    rejoint les alias de target. field_sources (champ -> source de la valeur retenue)
+    est mis à jour.
+
+    Returns:
+        Nombre de champs modifiés
+    """
+    incoming_source = get_entity_source(incoming)
+    updated = 0
+
+    for entity_field in dataclasses.fields(target):
+        name = entity_field.name
+        if name in _IDENTITY_FIELDS:
+            continue
+        new_value = getattr(incoming, name, None)
+        if is_empty_value(new_value):
+            continue
+        current = getattr(target, name)
+        if isinstance(current, list) and isinstance(new_value, list):
+            if name == altname_field:
+                # Le nom principal de target ne figure pas parmi ses propres alias
+                target_key = normalize_designation(getattr(target, name_field))
+                new_value = [v for v in new_value if normalize_designation(v) != target_key]
+            updated += _extend_unique(current, new_value)
+            continue
+        if is_empty_value(current) or get_source_rank(incoming_source, name) < get_source_rank(
+            field_sources.get(name), name
+        ):
+            if current != new_value:
+                setattr(target, name, new_value)
+                updated += 1
+            field_sources[name] = incoming_source
+
+    target_name = getattr(target, name_field)
+    incoming_name = getattr(incoming, name_field)
+    if normalize_designation(incoming_name) not in (None, normalize_designation(target_name)):
+        if getattr(target, altname_field) is None:
+            setattr(target, altname_field, [])
+        updated += _extend_unique(getattr(target, altname_field), [incoming_name])
+
+    if incoming.reference is not None and get_source_rank(
+        incoming_source, "reference"
+    ) < get_source_rank(field_sources.get("reference"), "reference"):
+        target.reference = incoming.reference
+        field_sources["reference"] = incoming_source
+    return updated
+
+
+def get_field_sources(entity: Any) -> dict[str, str | None]:
+    """Provenance initiale : chaque champ renseigné vient de la source de l'entité."""
+    source = get_entity_source(entity)
+    field_sources = {
+        entity_field.name: source
+        for entity_field in dataclasses.fields(entity)
+        if not is_empty_value(getattr(entity, entity_field.name))
+    }
+    field_sources["reference"] = source
+    return field_sources
+
+
+def _extend_unique(values: list[Any], new_values: list[Any]) -> int:
+    known = {normalize_designation(value) for value in values}
+    added = 0
+    for value in new_values:
+        key = normalize_designation(value)
+        if key not in known:
+            values.append(value)
+            known.add(key)
+            added += 1
+    return added
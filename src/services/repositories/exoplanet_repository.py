@@ -1,40 +1,183 @@
 # src/services/repositories/exoplanet_repository.py
 import logging
+import re
+from collections.abc import Iterable, Iterator, ValuesView
+from typing import Any
 
 from src.models.entities.exoplanet_entity import Exoplanet
+from src.services.repositories.entity_merge import (
+    DesignationIndex,
+    get_field_sources,
+    merge_entity_fields,
+)
+from src.services.repositories.sqlite_entity_store import SqliteEntityStore
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Lettre finale d'une désignation de planète ("HD 209458 b" -> "b")
+_PLANET_LETTER = re.compile(r"\s([a-z])$")
+
+# Identifiants de l'étoile hôte portés par l'exoplanète
+HOST_ID_FIELDS: tuple[str, ...] = ("hd_name", "hip_name", "tic_id", "gaia_id")
+
 
 class ExoplanetRepository:
-    def __init__(self):
+    def __init__(self, store: SqliteEntityStore | None = None):
         self.exoplanets: dict[str, Exoplanet] = {}
+        # Désignations normalisées (nom, alias, identifiants hôte + lettre) -> pl_name
+        self._designation_index = DesignationIndex()
+        # Source de chaque champ des exoplanètes fusionnées (créée à la première fusion)
+        self._field_sources: dict[str, dict[str, str | None]] = {}
+        # Index secondaire : nom de l'étoile hôte -> pl_name de ses planètes (ordre d'ajout)
+        self._planets_by_star: dict[str, list[str]] = {}
+        # Stockage persistant optionnel : relu par load_from_store, réécrit par save_to_store
+        self.store = store
         logger.info("ExoplanetRepository initialized.")
 
-    def add_exoplanets(self, exoplanets: list[Exoplanet], source_system: str) -> None:
+    def add_exoplanets(self, exoplanets: Iterable[Exoplanet], source_system: str) -> None:
         """
         Ajoute ou fusionne les exoplanètes dans le dictionnaire.
         Le paramètre 'source_system' indique le système ou le lot d'où proviennent ces données.
+        'exoplanets' peut être un itérable quelconque (ex. générateur), parcouru une seule fois.
+
+        Une exoplanète déjà connue sous l'une de ses désignations (nom ou alias
+        normalisés, identifiant HD/HIP/TIC/Gaia de l'hôte suivi de la lettre) est
+        fusionnée champ par champ selon la priorité des sources (SOURCE_PRIORITY).
         """
-        logger.info(
-            f"Attempting to add {len(exoplanets)} exoplanets from source system: {source_system}..."
-        )
+        logger.info(f"Attempting to add exoplanets from source system: {source_system}...")
         added_count = 0
         merged_count = 0
         for exoplanet in exoplanets:
             if not exoplanet.pl_name:
                 logger.warning("Skipping exoplanet with no name.")
                 continue
-            if exoplanet.pl_name in self.exoplanets:
-                logger.debug(f"Merging data for existing exoplanet: {exoplanet.pl_name}")
+            designations = self._get_designations(exoplanet)
+            existing_name = self._designation_index.find(designations)
+            if existing_name is not None:
+                logger.debug(f"Merging data for existing exoplanet: {existing_name}")
+                self._merge_exoplanet(existing_name, exoplanet)
                 merged_count += 1
             else:
                 logger.debug(f"Adding new exoplanet: {exoplanet.pl_name}")
-                self.exoplanets[exoplanet.pl_name] = exoplanet
+                existing_name = exoplanet.pl_name
+                self.exoplanets[existing_name] = exoplanet
+                self._index_host_star(exoplanet)
                 added_count += 1
+            self._designation_index.add(designations, existing_name)
         logger.info(
             f"Addition from {source_system} complete. Added: {added_count}, Merged: {merged_count}. Total exoplanets: {len(self.exoplanets)}"
         )
 
+    def find_exoplanet(self, designation: str) -> Exoplanet | None:
+        """Exoplanète connue sous cette désignation (nom, alias ou identifiant)."""
+        pl_name = self._designation_index.find([designation])
+        return self.exoplanets.get(pl_name) if pl_name is not None else None
+
     def get_all_exoplanets(self) -> list[Exoplanet]:
         return list(self.exoplanets.values())
+
+    def iter_exoplanets(self) -> Iterator[Exoplanet]:
+        """Parcourt les exoplanètes sans copier le référentiel."""
+        return iter(self.exoplanets.values())
+
+    def exoplanets_view(self) -> ValuesView[Exoplanet]:
+        """Vue en lecture seule (taille, parcours) sur les exoplanètes, sans copie."""
+        return self.exoplanets.values()
+
+    def iter_exoplanets_by_names(self, names: Iterable[str]) -> Iterator[Exoplanet]:
+        """Exoplanètes des pl_name donnés (ex. statut Wikipedia) ; noms inconnus ignorés."""
+        for name in names:
+            exoplanet = self.exoplanets.get(name)
+            if exoplanet is not None:
+                yield exoplanet
+
+    def get_planets_for_star(self, star_name: str) -> list[Exoplanet]:
+        """Planètes de l'étoile hôte (nom exact), dans l'ordre d'ajout."""
+        return [self.exoplanets[name] for name in self._planets_by_star.get(star_name, ())]
+
+    def iter_systems(self) -> Iterator[tuple[str, list[Exoplanet]]]:
+        """Parcourt les systèmes planétaires : (nom de l'étoile hôte, planètes)."""
+        for star_name in self._planets_by_star:
+            yield star_name, self.get_planets_for_star(star_name)
+
+    def get_snapshot_state(self) -> dict[str, Any]:
+        """État complet du référentiel (entités et index), pour repository_snapshot."""
+        return {
+            "exoplanets": self.exoplanets,
+            "designation_index": self._designation_index,
+            "field_sources": self._field_sources,
+            "planets_by_star": self._planets_by_star,
+        }
+
+    def restore_snapshot_state(self, state: dict[str, Any]) -> None:
+        """Remplace le contenu du référentiel par un état de get_snapshot_state."""
+        self.exoplanets = state["exoplanets"]
+        self._designation_index = state["designation_index"]
+        self._field_sources = state["field_sources"]
+        self._planets_by_star = state["planets_by_star"]
+        logger.info(f"{len(self.exoplanets)} exoplanets restored from snapshot.")
+
+    def load_from_store(self) -> int:
+        """
+        Remplace le contenu du référentiel par le catalogue du stockage persistant
+        (exoplanètes, provenance des champs, index), sans collecte.
+
+        Returns:
+            Nombre d'exoplanètes chargées
+
+        Raises:
+            ValueError: Si le référentiel n'a pas de stockage persistant
+        """
+        store = self._require_store()
+        self.exoplanets = {}
+        self._designation_index = DesignationIndex()
+        self._planets_by_star = {}
+        for exoplanet in store.load_exoplanets():
+            self.exoplanets[exoplanet.pl_name] = exoplanet
+            self._designation_index.add(self._get_designations(exoplanet), exoplanet.pl_name)
+            self._index_host_star(exoplanet)
+        self._field_sources = store.load_exoplanet_field_sources()
+        logger.info(f"{len(self.exoplanets)} exoplanets loaded from {store.db_path}.")
+        return len(self.exoplanets)
+
+    def save_to_store(self) -> int:
+        """
+        Remplace le catalogue du stockage persistant par le contenu du référentiel, en
+        une seule transaction (les exoplanètes absentes du référentiel sont supprimées).
+
+        Raises:
+            ValueError: Si le référentiel n'a pas de stockage persistant
+        """
+        store = self._require_store()
+        saved = store.replace_exoplanets(self.exoplanets.values(), self._field_sources)
+        logger.info(f"{saved} exoplanets saved to {store.db_path}.")
+        return saved
+
+    def _require_store(self) -> SqliteEntityStore:
+        if self.store is None:
+            raise ValueError("ExoplanetRepository has no persistent store.")
+        return self.store
+
+    def _index_host_star(self, exoplanet: Exoplanet) -> None:
+        # st_name n'est jamais modifié par la fusion : seul l'ajout alimente l'index
+        if exoplanet.st_name:
+            self._planets_by_star.setdefault(str(exoplanet.st_name), []).append(exoplanet.pl_name)
+
+    def _merge_exoplanet(self, pl_name: str, incoming: Exoplanet) -> None:
+        existing = self.exoplanets[pl_name]
+        field_sources = self._field_sources.get(pl_name)
+        if field_sources is None:
+            field_sources = self._field_sources[pl_name] = get_field_sources(existing)
+        merge_entity_fields(existing, incoming, field_sources, "pl_name", "pl_altname")
+
+    @staticmethod
+    def _get_designations(exoplanet: Exoplanet) -> list[str]:
+        designations = [exoplanet.pl_name, *(exoplanet.pl_altname or [])]
+        letter = _PLANET_LETTER.search(exoplanet.pl_name)
+        if letter:
+            designations.extend(
+                f"{host_id} {letter.group(1)}"
+                for host_id in (getattr(exoplanet, field) for field in HOST_ID_FIELDS)
+                if host_id
+            )
+        return designations
@@ -0,0 +1,148 @@
+# src/services/repositories/repository_snapshot.py
+"""
+Instantané binaire (pickle) des référentiels consolidés.
+
+Une exécution relancée sur les mêmes catalogues en cache recharge l'instantané au
+lieu de relire, mapper et fusionner les CSV. Le fichier commence par un en-tête
+(version de format, hash du schéma des entités, empreintes des sources) lu seul :
+l'état des référentiels n'est désérialisé que si l'en-tête correspond.
+
+Le fichier est relu avec pickle : il ne doit provenir que de ce pipeline. L'instantané
+n'est utilisé que sur demande (--repository-snapshot), dans le répertoire de cache local.
+"""
+
+import dataclasses
+import gc
+import hashlib
+import logging
+import os
+import pickle  # nosec B403
+from datetime import datetime
+from typing import Any
+
+from src.core.config import FIELD_SOURCE_PRIORITY, SOURCE_PRIORITY
+from src.models.entities.exoplanet_entity import Exoplanet, ValueWithUncertainty
+from src.models.entities.star_entity import Star
+from src.models.references.reference import Reference
+from src.services.repositories.exoplanet_repository import ExoplanetRepository
+from src.services.repositories.star_repository import StarRepository
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# À incrémenter à chaque changement du mapping, de la fusion ou de l'état des
+# référentiels qui ne se voit pas dans les champs des entités
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+def compute_entity_schema_hash() -> str:
+    """Hash des champs des entités, de la version de format et des priorités de fusion."""
+    description = repr(
+        (
+            SNAPSHOT_FORMAT_VERSION,
+            [
+                (cls.__name__, [(f.name, str(f.type)) for f in dataclasses.fields(cls)])
+                for cls in (Exoplanet, Star, ValueWithUncertainty, Reference)
+            ],
+            SOURCE_PRIORITY,
+            sorted(FIELD_SOURCE_PRIORITY.items()),
+        )
+    )
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+
+def build_source_fingerprints(collectors: dict[str, Any], **settings: Any) -> dict | None:
+    """
+    Empreintes des fichiers sources de chaque collecteur, et options de l'exécution
+    qui influent sur la consolidation (ex. resolve_entities).
+
+    None si une source doit être (re)téléchargée : l'instantané ne peut alors pas
+    être réutilisé.
+    """
+    sources = {}
+    for source_name, collector in collectors.items():
+        fingerprint = collector.get_cache_fingerprint()
+        if fingerprint is None:
+            logger.info(f"Cache de {source_name} absent ou à revalider : pas d'instantané.")
+            return None
+        sources[source_name] = fingerprint
+    return {"sources": sources, "settings": settings}
+
+
+def save_repository_snapshot(
+    path: str,
+    exoplanet_repository: ExoplanetRepository,
+    star_repository: StarRepository,
+    fingerprints: dict,
+) -> None:
+    """Écrit l'instantané (fichier temporaire puis renommage)."""
+    header = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "schema_hash": compute_entity_schema_hash(),
+        "fingerprints": fingerprints,
+        "created_at": datetime.now().isoformat(),
+    }
+    state = {
+        "exoplanets": exoplanet_repository.get_snapshot_state(),
+        "stars": star_repository.get_snapshot_state(),
+    }
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"Instantané des référentiels non écrit ({path}) : {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return
+    logger.info(f"Instantané des référentiels écrit : {path}")
+
+
+def load_repository_snapshot(
+    path: str,
+    exoplanet_repository: ExoplanetRepository,
+    star_repository: StarRepository,
+    fingerprints: dict,
+) -> bool:
+    """
+    Restaure les référentiels depuis l'instantané s'il correspond aux sources et au
+    schéma courants.
+
+    Returns:
+        True si les référentiels ont été restaurés, False s'il faut refaire la collecte
+    """
+    try:
+        with open(path, "rb") as f:
+            # Fichier écrit par save_repository_snapshot dans le cache local, sur demande
+            header = pickle.load(f)  # nosec B301
+            if header.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+                logger.info(f"Instantané {path} d'un autre format : reconstruction.")
+                return False
+            if header.get("schema_hash") != compute_entity_schema_hash():
+                logger.info(f"Instantané {path} d'un autre schéma d'entités : reconstruction.")
+                return False
+            if header.get("fingerprints") != fingerprints:
+                logger.info(f"Sources modifiées depuis l'instantané {path} : reconstruction.")
+                return False
+            # Le ramasse-miettes cyclique, déclenché par les allocations, double sinon
+            # le temps de chargement des ~100 000 objets de l'état
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                state = pickle.load(f)  # nosec B301
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+    except FileNotFoundError:
+        return False
+    except Exception as e:
+        logger.warning(f"Instantané illisible ({path}) : {e}")
+        return False
+
+    exoplanet_repository.restore_snapshot_state(state["exoplanets"])
+    star_repository.restore_snapshot_state(state["stars"])
+    logger.info(f"Référentiels restaurés depuis l'instantané {path} ({header['created_at']}).")
+    return True
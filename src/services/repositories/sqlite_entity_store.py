@@ -0,0 +1,317 @@
+# src/services/repositories/sqlite_entity_store.py
+"""
+Stockage persistant (SQLite) des exoplanètes et étoiles consolidées.
+
+Chaque entité est conservée sous forme JSON (colonne data) à côté de colonnes indexées
+(nom, étoile hôte, année, méthode et installation de découverte) : les outils et les
+requêtes ad hoc (sqlite3, json_extract) relisent le catalogue consolidé sans nouvelle
+collecte.
+
+Le contenu est remplacé en fin d'exécution, en une seule transaction : une exécution
+interrompue laisse le catalogue précédent intact, et une planète retirée des catalogues
+disparaît de la base. La provenance des champs fusionnés (colonne field_sources) est
+conservée, pour que les repositories rechargés fusionnent comme avant l'écriture.
+"""
+
+import dataclasses
+import json
+import logging
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any
+
+from src.models.entities.exoplanet_entity import Exoplanet, ValueWithUncertainty
+from src.models.entities.star_entity import Star
+from src.models.references.reference import Reference, SourceType
+from src.services.repositories.entity_merge import get_entity_source
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# À incrémenter à chaque changement du schéma ou de l'encodage JSON des entités
+ENTITY_STORE_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS exoplanets (
+    name TEXT PRIMARY KEY,
+    host_star TEXT,
+    disc_year INTEGER,
+    disc_method TEXT,
+    disc_facility TEXT,
+    source TEXT,
+    data TEXT NOT NULL,
+    field_sources TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_exoplanets_host_star ON exoplanets (host_star);
+CREATE INDEX IF NOT EXISTS idx_exoplanets_disc_year ON exoplanets (disc_year);
+CREATE INDEX IF NOT EXISTS idx_exoplanets_disc_method ON exoplanets (disc_method);
+CREATE INDEX IF NOT EXISTS idx_exoplanets_disc_facility ON exoplanets (disc_facility);
+CREATE TABLE IF NOT EXISTS stars (
+    name TEXT PRIMARY KEY,
+    source TEXT,
+    data TEXT NOT NULL,
+    field_sources TEXT
+);
+"""
+
+# Critères acceptés par query_exoplanets (colonnes indexées)
+EXOPLANET_QUERY_COLUMNS: tuple[str, ...] = (
+    "host_star",
+    "disc_year",
+    "disc_method",
+    "disc_facility",
+)
+
+
+class SqliteEntityStore:
+    """Base SQLite partagée par ExoplanetRepository et StarRepository."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._connection = sqlite3.connect(db_path)
+        self._in_transaction = False
+        self._initialize_schema()
+        logger.info(f"SqliteEntityStore ouvert : {db_path}")
+
+    def _initialize_schema(self) -> None:
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, ENTITY_STORE_SCHEMA_VERSION):
+            logger.warning(
+                f"Schéma de {self.db_path} obsolète (v{version}, attendu "
+                f"v{ENTITY_STORE_SCHEMA_VERSION}) : la base est reconstruite."
+            )
+            with self._connection:
+                self._connection.execute("DROP TABLE IF EXISTS exoplanets")
+                self._connection.execute("DROP TABLE IF EXISTS stars")
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(f"PRAGMA user_version = {ENTITY_STORE_SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self._connection.close()
+
+    # ============================================================================
+    # ÉCRITURE
+    # ============================================================================
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Regroupe les écritures du bloc en une seule transaction, validée à la sortie
+        (annulée sur exception) ; sans effet à l'intérieur d'une transaction déjà ouverte.
+        """
+        if self._in_transaction:
+            yield
+            return
+        self._in_transaction = True
+        try:
+            with self._connection:
+                yield
+        finally:
+            self._in_transaction = False
+
+    def upsert_exoplanets(self, exoplanets: Iterable[Exoplanet]) -> int:
+        """Insère ou remplace les exoplanètes, en une seule transaction."""
+        return self._write_exoplanets(exoplanets, {}, replace_all=False)
+
+    def replace_exoplanets(
+        self,
+        exoplanets: Iterable[Exoplanet],
+        field_sources: Mapping[str, dict[str, str | None]] | None = None,
+    ) -> int:
+        """
+        Remplace tout le contenu de la table par ces exoplanètes, en une seule transaction.
+        field_sources : provenance des champs par pl_name (exoplanètes fusionnées).
+        """
+        return self._write_exoplanets(exoplanets, field_sources or {}, replace_all=True)
+
+    def upsert_stars(self, stars: Iterable[Star]) -> int:
+        """Insère ou remplace les étoiles, en une seule transaction."""
+        return self._write_stars(stars, {}, replace_all=False)
+
+    def replace_stars(
+        self,
+        stars: Iterable[Star],
+        field_sources: Mapping[str, dict[str, str | None]] | None = None,
+    ) -> int:
+        """
+        Remplace tout le contenu de la table par ces étoiles, en une seule transaction.
+        field_sources : provenance des champs par st_name (étoiles fusionnées).
+        """
+        return self._write_stars(stars, field_sources or {}, replace_all=True)
+
+    def _write_exoplanets(
+        self,
+        exoplanets: Iterable[Exoplanet],
+        field_sources: Mapping[str, dict[str, str | None]],
+        replace_all: bool,
+    ) -> int:
+        rows = [
+            (
+                exoplanet.pl_name,
+                exoplanet.st_name,
+                _to_plain(exoplanet.disc_year),
+                exoplanet.disc_method,
+                exoplanet.disc_facility,
+                get_entity_source(exoplanet),
+                _encode_entity(exoplanet),
+                _encode_field_sources(field_sources.get(exoplanet.pl_name)),
+            )
+            for exoplanet in exoplanets
+        ]
+        with self.transaction():
+            if replace_all:
+                self._connection.execute("DELETE FROM exoplanets")
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO exoplanets (name, host_star, disc_year, disc_method, "
+                "disc_facility, source, data, field_sources) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def _write_stars(
+        self,
+        stars: Iterable[Star],
+        field_sources: Mapping[str, dict[str, str | None]],
+        replace_all: bool,
+    ) -> int:
+        rows = [
+            (
+                star.st_name,
+                get_entity_source(star),
+                _encode_entity(star),
+                _encode_field_sources(field_sources.get(star.st_name)),
+            )
+            for star in stars
+        ]
+        with self.transaction():
+            if replace_all:
+                self._connection.execute("DELETE FROM stars")
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO stars (name, source, data, field_sources) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    # ============================================================================
+    # LECTURE
+    # ============================================================================
+
+    def load_exoplanets(self) -> list[Exoplanet]:
+        rows = self._connection.execute("SELECT data FROM exoplanets ORDER BY rowid")
+        return [_decode_entity(Exoplanet, data) for (data,) in rows]
+
+    def load_stars(self) -> list[Star]:
+        rows = self._connection.execute("SELECT data FROM stars ORDER BY rowid")
+        return [_decode_entity(Star, data) for (data,) in rows]
+
+    def load_exoplanet_field_sources(self) -> dict[str, dict[str, str | None]]:
+        """Provenance des champs enregistrée, par pl_name (exoplanètes fusionnées seulement)."""
+        return self._load_field_sources("exoplanets")
+
+    def load_star_field_sources(self) -> dict[str, dict[str, str | None]]:
+        """Provenance des champs enregistrée, par st_name (étoiles fusionnées seulement)."""
+        return self._load_field_sources("stars")
+
+    def _load_field_sources(self, table: str) -> dict[str, dict[str, str | None]]:
+        rows = self._connection.execute(
+            f"SELECT name, field_sources FROM {table} WHERE field_sources IS NOT NULL"
+        )
+        return {name: json.loads(field_sources) for name, field_sources in rows}
+
+    def query_exoplanets(self, **criteria: Any) -> list[Exoplanet]:
+        """
+        Exoplanètes dont les colonnes indexées valent les critères donnés,
+        ex. query_exoplanets(host_star="Kepler-452", disc_method="Transit").
+
+        Raises:
+            ValueError: Si un critère ne correspond pas à une colonne indexée
+        """
+        unknown = set(criteria) - set(EXOPLANET_QUERY_COLUMNS)
+        if unknown:
+            raise ValueError(f"Critères inconnus : {sorted(unknown)}")
+        where = " AND ".join(f"{column} = ?" for column in criteria) or "1"
+        rows = self._connection.execute(
+            f"SELECT data FROM exoplanets WHERE {where} ORDER BY rowid",
+            tuple(criteria.values()),
+        )
+        return [_decode_entity(Exoplanet, data) for (data,) in rows]
+
+    def count_exoplanets(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM exoplanets").fetchone()[0]
+
+    def count_stars(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM stars").fetchone()[0]
+
+
+# ============================================================================
+# ENCODAGE JSON DES ENTITÉS
+# ============================================================================
+
+
+def _to_plain(value: Any) -> Any:
+    """Scalaire NumPy (ex. np.int64 issu de pandas) -> type Python natif."""
+    return value.item() if hasattr(value, "item") and not isinstance(value, str) else value
+
+
+def _encode_entity(entity: Any) -> str:
+    attributes = {f.name: getattr(entity, f.name) for f in dataclasses.fields(entity)}
+    return json.dumps(
+        {name: value for name, value in attributes.items() if value is not None},
+        default=_encode_value,
+        ensure_ascii=False,
+    )
+
+
+def _encode_field_sources(field_sources: dict[str, str | None] | None) -> str | None:
+    return json.dumps(field_sources, ensure_ascii=False) if field_sources is not None else None
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, ValueWithUncertainty):
+        return {"__vwu__": dataclasses.astuple(value)}
+    if isinstance(value, Reference):
+        return {
+            "__ref__": {
+                "source": value.source.value,
+                "update_date": value.update_date.isoformat(),
+                "consultation_date": value.consultation_date.isoformat(),
+                "star_id": value.star_id,
+                "planet_id": value.planet_id,
+            }
+        }
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Valeur non sérialisable : {type(value).__name__}")
+
+
+def _decode_value(obj: dict[str, Any]) -> Any:
+    if "__vwu__" in obj:
+        return ValueWithUncertainty(*obj["__vwu__"])
+    if "__ref__" in obj:
+        ref = obj["__ref__"]
+        return Reference(
+            source=SourceType(ref["source"]),
+            update_date=datetime.fromisoformat(ref["update_date"]),
+            consultation_date=datetime.fromisoformat(ref["consultation_date"]),
+            star_id=ref["star_id"],
+            planet_id=ref["planet_id"],
+        )
+    if "__datetime__" in obj:
+        return datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+
+def _decode_entity(entity_class: type, data: str) -> Any:
+    attributes = json.loads(data, object_hook=_decode_value)
+    # Entités à __slots__ : un attribut inconnu (base écrite par une version antérieure)
+    # est ignoré
+    field_names = {f.name for f in dataclasses.fields(entity_class)}
+    return entity_class(**{k: v for k, v in attributes.items() if k in field_names})
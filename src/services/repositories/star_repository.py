@@ -1,39 +1,143 @@
 # src/services/repositories/star_repository.py
 import logging
+from collections.abc import Iterable, Iterator, ValuesView
+from typing import Any
 
 from src.models.entities.star_entity import Star
+from src.services.repositories.entity_merge import (
+    DesignationIndex,
+    get_field_sources,
+    merge_entity_fields,
+)
+from src.services.repositories.sqlite_entity_store import SqliteEntityStore
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
 class StarRepository:
-    def __init__(self):
+    def __init__(self, store: SqliteEntityStore | None = None):
         self.stars: dict[str, Star] = {}
+        # Désignations normalisées (nom, alias dont HD/HIP/TIC) -> st_name
+        self._designation_index = DesignationIndex()
+        # Source de chaque champ des étoiles fusionnées (créée à la première fusion)
+        self._field_sources: dict[str, dict[str, str | None]] = {}
+        # Stockage persistant optionnel : relu par load_from_store, réécrit par save_to_store
+        self.store = store
         logger.info("StarRepository initialized.")
 
-    def add_stars(self, stars: list[Star], source_system: str) -> None:
+    def add_stars(self, stars: Iterable[Star], source_system: str) -> None:
         """
         Ajoute ou fusionne les exoplanètes dans le dictionnaire.
         Le paramètre 'source_system' indique le système ou le lot d'où proviennent ces données,
         pas nécessairement la 'SourceType' d'une donnée individuelle.
+        'stars' peut être un itérable quelconque (ex. générateur), parcouru une seule fois.
+
+        Une étoile déjà connue sous l'une de ses désignations (nom ou alias normalisés)
+        est fusionnée champ par champ selon la priorité des sources (SOURCE_PRIORITY).
         """
-        logger.info(f"Attempting to add {len(stars)} stars from source system: {source_system}...")
+        logger.info(f"Attempting to add stars from source system: {source_system}...")
         added_count = 0
         merged_count = 0
         for star in stars:
             if not star.st_name:
                 logger.warning("Skipping star with no name.")
                 continue
-            if star.st_name in self.stars:
-                logger.debug(f"Merging data for existing star: {star.st_name}")
+            designations = [star.st_name, *(star.st_altname or [])]
+            existing_name = self._designation_index.find(designations)
+            if existing_name is not None:
+                logger.debug(f"Merging data for existing star: {existing_name}")
+                self._merge_star(existing_name, star)
                 merged_count += 1
             else:
                 logger.debug(f"Adding new star: {star.st_name}")
-                self.stars[star.st_name] = star
+                existing_name = star.st_name
+                self.stars[existing_name] = star
                 added_count += 1
+            self._designation_index.add(designations, existing_name)
         logger.info(
             f"Addition from {source_system} complete. Added: {added_count}, Merged: {merged_count}. Total stars: {len(self.stars)}"
         )
 
+    def find_star(self, designation: str) -> Star | None:
+        """Étoile connue sous cette désignation (nom ou alias)."""
+        st_name = self._designation_index.find([designation])
+        return self.stars.get(st_name) if st_name is not None else None
+
     def get_all_stars(self) -> list[Star]:
         return list(self.stars.values())
+
+    def iter_stars(self) -> Iterator[Star]:
+        """Parcourt les étoiles sans copier le référentiel."""
+        return iter(self.stars.values())
+
+    def stars_view(self) -> ValuesView[Star]:
+        """Vue en lecture seule (taille, parcours) sur les étoiles, sans copie."""
+        return self.stars.values()
+
+    def iter_stars_by_names(self, names: Iterable[str]) -> Iterator[Star]:
+        """Étoiles des st_name donnés (ex. statut Wikipedia) ; noms inconnus ignorés."""
+        for name in names:
+            star = self.stars.get(name)
+            if star is not None:
+                yield star
+
+    def get_snapshot_state(self) -> dict[str, Any]:
+        """État complet du référentiel (entités et index), pour repository_snapshot."""
+        return {
+            "stars": self.stars,
+            "designation_index": self._designation_index,
+            "field_sources": self._field_sources,
+        }
+
+    def restore_snapshot_state(self, state: dict[str, Any]) -> None:
+        """Remplace le contenu du référentiel par un état de get_snapshot_state."""
+        self.stars = state["stars"]
+        self._designation_index = state["designation_index"]
+        self._field_sources = state["field_sources"]
+        logger.info(f"{len(self.stars)} stars restored from snapshot.")
+
+    def load_from_store(self) -> int:
+        """
+        Remplace le contenu du référentiel par le catalogue du stockage persistant
+        (étoiles, provenance des champs, index), sans collecte.
+
+        Returns:
+            Nombre d'étoiles chargées
+
+        Raises:
+            ValueError: Si le référentiel n'a pas de stockage persistant
+        """
+        store = self._require_store()
+        self.stars = {}
+        self._designation_index = DesignationIndex()
+        for star in store.load_stars():
+            self.stars[star.st_name] = star
+            self._designation_index.add([star.st_name, *(star.st_altname or [])], star.st_name)
+        self._field_sources = store.load_star_field_sources()
+        logger.info(f"{len(self.stars)} stars loaded from {store.db_path}.")
+        return len(self.stars)
+
+    def save_to_store(self) -> int:
+        """
+        Remplace le catalogue du stockage persistant par le contenu du référentiel, en
+        une seule transaction (les étoiles absentes du référentiel sont supprimées).
+
+        Raises:
+            ValueError: Si le référentiel n'a pas de stockage persistant
+        """
+        store = self._require_store()
+        saved = store.replace_stars(self.stars.values(), self._field_sources)
+        logger.info(f"{saved} stars saved to {store.db_path}.")
+        return saved
+
+    def _require_store(self) -> SqliteEntityStore:
+        if self.store is None:
+            raise ValueError("StarRepository has no persistent store.")
+        return self.store
+
+    def _merge_star(self, st_name: str, incoming: Star) -> None:
+        existing = self.stars[st_name]
+        field_sources = self._field_sources.get(st_name)
+        if field_sources is None:
+            field_sources = self._field_sources[st_name] = get_field_sources(existing)
+        merge_entity_fields(existing, incoming, field_sources, "st_name", "st_altname")
@@ -1,22 +1,130 @@
 # src/utils/astro/constellation_util.py
-import astropy.units as u
-from astropy.coordinates import SkyCoord
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
 
 from src.constants.wikipedia_field_config import WIKIPEDIA_CONSTELLATION_ENG_TO_FR
 from src.utils.formatters.article_formatter import ArticleFormatter
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+CONSTELLATION_BOUNDARIES_PATH = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "constants", "constellation_boundaries.npz")
+)
+
+
+class ConstellationBoundaryTable:
+    """
+    Table hors ligne des limites IAU des constellations (générée par
+    tools/build_constellation_boundaries.py).
+
+    Les limites étant des segments d'ascension droite et de déclinaison constantes en
+    B1875, le ciel est découpé en une grille de cellules ; une position J2000 est
+    ramenée en B1875 (aberration + précession figées à J2000) puis localisée par deux
+    recherches dichotomiques.
+    """
+
+    def __init__(
+        self,
+        rotation: np.ndarray,
+        aberration: np.ndarray,
+        ra_edges: np.ndarray,
+        dec_edges: np.ndarray,
+        cells: np.ndarray,
+        names: np.ndarray,
+    ):
+        self.rotation = rotation
+        self.aberration = aberration
+        self.ra_edges = ra_edges
+        self.dec_edges = dec_edges
+        self.cells = cells
+        self.names = names
+
+    @classmethod
+    def load(cls, path: str = CONSTELLATION_BOUNDARIES_PATH) -> "ConstellationBoundaryTable":
+        with np.load(path, allow_pickle=False) as archive:
+            return cls(**{key: archive[key] for key in archive.files})
+
+    def lookup(self, ra_deg: np.ndarray, dec_deg: np.ndarray) -> np.ndarray:
+        """Noms anglais (IAU) des constellations pour des positions ICRS finies, en degrés."""
+        ra_rad = np.radians(np.asarray(ra_deg, dtype=float))
+        dec_rad = np.radians(np.asarray(dec_deg, dtype=float))
+        directions = np.stack(
+            [np.cos(dec_rad) * np.cos(ra_rad), np.cos(dec_rad) * np.sin(ra_rad), np.sin(dec_rad)]
+        )
+        directions = directions + self.aberration[:, None]
+        directions = self.rotation @ (directions / np.linalg.norm(directions, axis=0))
+
+        ra_hours = np.degrees(np.arctan2(directions[1], directions[0])) % 360.0 / 15.0
+        dec_b1875 = np.degrees(np.arcsin(np.clip(directions[2], -1.0, 1.0)))
+
+        ra_cell = np.searchsorted(self.ra_edges, ra_hours, side="left") - 1
+        dec_cell = np.searchsorted(self.dec_edges, dec_b1875, side="left") - 1
+        ra_cell = np.clip(ra_cell, 0, self.cells.shape[0] - 1)
+        dec_cell = np.clip(dec_cell, 0, self.cells.shape[1] - 1)
+        return self.names[self.cells[ra_cell, dec_cell]]
+
+
+@lru_cache(maxsize=1)
+def load_constellation_boundaries() -> ConstellationBoundaryTable | None:
+    """Charge (une seule fois) la table hors ligne ; None si le fichier est absent."""
+    try:
+        return ConstellationBoundaryTable.load()
+    except (OSError, KeyError, ValueError) as e:
+        logger.warning(
+            f"Table des constellations indisponible ({CONSTELLATION_BOUNDARIES_PATH}) : {e}. "
+            "Repli sur astropy."
+        )
+        return None
+
 
 class ConstellationUtil:
     """
     Classe utilitaire pour décrire et caractériser les étoiles hôtes des exoplanètes,
     avec descriptions et liens Wikipedia en français vers le type d'astre correspondant.
+
+    Les constellations sont lues dans la table hors ligne des limites IAU. Avec
+    validate_with_astropy=True (ou si la table est absente), elles sont calculées par
+    astropy ; ces résultats sont mémorisés (cache borné, partagé entre instances) sur
+    des coordonnées arrondies, et les écarts avec la table sont signalés.
     """
 
-    def __init__(self):
+    # Arrondi des clés du cache, en degrés (1e-5 deg ≈ 0.04")
+    CACHE_KEY_DECIMALS = 5
+    CACHE_MAX_SIZE = 100_000
+
+    _cache: "OrderedDict[tuple[float, float], str | None]" = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    def __init__(self, validate_with_astropy: bool = False):
         self.article_util = ArticleFormatter()
+        self.validate_with_astropy = validate_with_astropy
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Vide le cache des constellations résolues par astropy."""
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    @classmethod
+    def cache_size(cls) -> int:
+        return len(cls._cache)
 
     def get_constellation_name(self, right_ascension, declination) -> str:
         """Trouve la constellation"""
+        degrees = self.sexagesimal_to_degrees(right_ascension, declination)
+        if degrees is not None:
+            return self.get_constellation_names([degrees[0]], [degrees[1]])[0]
+
+        # Format non reconnu : on laisse astropy interpréter les chaînes
+        import astropy.units as u
+        from astropy.coordinates import SkyCoord
+
         right_ascension = right_ascension.replace("/", " ")
         declination = declination.replace("/", " ")
 
@@ -26,3 +134,121 @@ class ConstellationUtil:
         constellation_en = coord.get_constellation()
 
         return WIKIPEDIA_CONSTELLATION_ENG_TO_FR.get(constellation_en, constellation_en)
+
+    def get_constellation_names(
+        self, ra_deg: Sequence[float], dec_deg: Sequence[float]
+    ) -> list[str | None]:
+        """
+        Résout les constellations (noms français) d'un lot de coordonnées ICRS en degrés.
+        Une coordonnée non finie donne None.
+        """
+        ra_values = np.asarray(ra_deg, dtype=float)
+        dec_values = np.asarray(dec_deg, dtype=float)
+        if ra_values.shape != dec_values.shape:
+            raise ValueError("ra_deg et dec_deg doivent avoir la même longueur")
+
+        results: list[str | None] = [None] * len(ra_values)
+        finite = np.flatnonzero(np.isfinite(ra_values) & np.isfinite(dec_values))
+        if not len(finite):
+            return results
+
+        boundary_table = load_constellation_boundaries()
+        if boundary_table is not None:
+            offline_names = boundary_table.lookup(ra_values[finite], dec_values[finite])
+        if boundary_table is None or self.validate_with_astropy:
+            names = self._resolve_with_astropy(ra_values[finite], dec_values[finite])
+            if boundary_table is not None:
+                self._report_mismatches(ra_values[finite], dec_values[finite], offline_names, names)
+        else:
+            names = offline_names.tolist()
+
+        for i, name in zip(finite.tolist(), names, strict=True):
+            results[i] = WIKIPEDIA_CONSTELLATION_ENG_TO_FR.get(name, name)
+        return results
+
+    def _resolve_with_astropy(
+        self, ra_values: np.ndarray, dec_values: np.ndarray
+    ) -> list[str | None]:
+        """
+        Noms anglais calculés par astropy ; les positions absentes du cache sont
+        résolues en un seul SkyCoord vectorisé.
+        """
+        keys = [
+            (round(ra, self.CACHE_KEY_DECIMALS), round(dec, self.CACHE_KEY_DECIMALS))
+            for ra, dec in zip(ra_values.tolist(), dec_values.tolist(), strict=True)
+        ]
+        results: list[str | None] = [None] * len(keys)
+
+        missing: dict[tuple[float, float], int] = {}
+        with self._cache_lock:
+            for i, key in enumerate(keys):
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    results[i] = self._cache[key]
+                elif key not in missing:
+                    missing[key] = i
+
+        if missing:
+            positions = list(missing.values())
+            resolved = dict(
+                zip(
+                    missing,
+                    self._astropy_constellations(ra_values[positions], dec_values[positions]),
+                    strict=True,
+                )
+            )
+            with self._cache_lock:
+                self._cache.update(resolved)
+                while len(self._cache) > self.CACHE_MAX_SIZE:
+                    self._cache.popitem(last=False)
+
+            for i, key in enumerate(keys):
+                if key in resolved:
+                    results[i] = resolved[key]
+
+        return results
+
+    @staticmethod
+    def _astropy_constellations(ra_values: np.ndarray, dec_values: np.ndarray) -> list[str]:
+        import astropy.units as u
+        from astropy.coordinates import SkyCoord
+
+        coords = SkyCoord(ra=ra_values * u.deg, dec=dec_values * u.deg, frame="icrs")
+        return coords.get_constellation().tolist()
+
+    @staticmethod
+    def _report_mismatches(
+        ra_values: np.ndarray,
+        dec_values: np.ndarray,
+        offline_names: np.ndarray,
+        astropy_names: list[str | None],
+    ) -> None:
+        for ra, dec, offline, expected in zip(
+            ra_values, dec_values, offline_names, astropy_names, strict=True
+        ):
+            if offline != expected:
+                logger.warning(
+                    f"Constellation hors ligne divergente en ({ra:.6f}, {dec:.6f}) : "
+                    f"{offline} (table) vs {expected} (astropy)"
+                )
+
+    @staticmethod
+    def sexagesimal_to_degrees(right_ascension, declination) -> tuple[float, float] | None:
+        """
+        Convertit "HH/MM/SS.ss" et "+DD/MM/SS.ss" en degrés (ra, dec).
+        Retourne None si l'une des chaînes n'est pas dans ce format.
+        """
+        try:
+            ra_parts = [float(part) for part in str(right_ascension).strip().split("/")]
+            dec_text = str(declination).strip()
+            dec_parts = [abs(float(part)) for part in dec_text.split("/")]
+        except ValueError:
+            return None
+        if not (1 <= len(ra_parts) <= 3 and 1 <= len(dec_parts) <= 3):
+            return None
+
+        ra_hours = sum(part / 60**k for k, part in enumerate(ra_parts))
+        dec_degrees = sum(part / 60**k for k, part in enumerate(dec_parts))
+        if dec_text.startswith("-"):
+            dec_degrees = -dec_degrees
+        return ra_hours * 15.0, dec_degrees
@@ -42,6 +42,36 @@ def sanitize_draft_filename(filename: str) -> str:
     return filename
 
 
+# Préfixes de catalogues connus (ordre important pour éviter les conflits)
+_CATALOG_PREFIXES: list[tuple[str, str]] = [
+    ("KEPLER-", "kepler"),
+    ("K2-", "k2"),
+    ("KOI-", "koi"),
+    ("TOI-", "toi"),
+    ("TIC ", "tic"),
+    ("WASP-", "wasp"),
+    ("HAT-P-", "hat"),
+    ("HATS-", "hats"),
+    ("TRES-", "tres"),
+    ("XO-", "xo"),
+    ("QATAR-", "qatar"),
+    ("KELT-", "kelt"),
+    ("OGLE-", "ogle"),
+    ("MOA-", "moa"),
+    ("TRAPPIST-", "trappist"),
+    ("COROT-", "corot"),
+    ("HD ", "hd"),
+    ("HIP ", "hip"),
+    ("HR ", "hr"),
+    ("GJ ", "gj"),
+    ("GLIESE ", "gliese"),
+    ("LHS ", "lhs"),
+    ("2MASS ", "2mass"),
+    ("WISE ", "wise"),
+    ("GAIA ", "gaia"),
+]
+
+
 def extract_catalog_prefix(name: str) -> str:
     """
     Extrait le préfixe du catalogue à partir du nom d'une entité.
@@ -52,46 +82,28 @@ def extract_catalog_prefix(name: str) -> str:
     Returns:
         Le préfixe du catalogue (kepler, k2, toi, wasp, etc.) ou 'autre' si aucun préfixe reconnu
     """
+    return split_catalog_prefix(name)[0]
+
+
+def split_catalog_prefix(name: str) -> tuple[str, str]:
+    """
+    Sépare le préfixe du catalogue du reste du nom ("K2-18 b" -> ("k2", "18 b")).
+
+    Returns:
+        (préfixe du catalogue ou 'autre', reste du nom ; le nom entier si aucun préfixe)
+    """
     if not name:
-        return "autre"
+        return "autre", ""
 
     # Convertir en majuscules pour la comparaison
-    name_upper = name.upper().strip()
-
-    # Liste des préfixes de catalogues connus (ordre important pour éviter les conflits)
-    catalog_prefixes = [
-        ("KEPLER-", "kepler"),
-        ("K2-", "k2"),
-        ("KOI-", "koi"),
-        ("TOI-", "toi"),
-        ("TIC ", "tic"),
-        ("WASP-", "wasp"),
-        ("HAT-P-", "hat"),
-        ("HATS-", "hats"),
-        ("TRES-", "tres"),
-        ("XO-", "xo"),
-        ("QATAR-", "qatar"),
-        ("KELT-", "kelt"),
-        ("OGLE-", "ogle"),
-        ("MOA-", "moa"),
-        ("TRAPPIST-", "trappist"),
-        ("COROT-", "corot"),
-        ("HD ", "hd"),
-        ("HIP ", "hip"),
-        ("HR ", "hr"),
-        ("GJ ", "gj"),
-        ("GLIESE ", "gliese"),
-        ("LHS ", "lhs"),
-        ("2MASS ", "2mass"),
-        ("WISE ", "wise"),
-        ("GAIA ", "gaia"),
-    ]
-
-    for prefix, folder_name in catalog_prefixes:
+    name = name.strip()
+    name_upper = name.upper()
+
+    for prefix, folder_name in _CATALOG_PREFIXES:
         if name_upper.startswith(prefix):
-            return folder_name
+            return folder_name, name[len(prefix) :]
 
-    return "autre"
+    return "autre", name
 
 
 # ============================================================================
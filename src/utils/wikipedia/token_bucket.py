@@ -0,0 +1,51 @@
+# src/utils/wikipedia/token_bucket.py
+"""
+Limiteur de débit (seau à jetons) partagé par les threads qui interrogent l'API MediaWiki.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    """
+    Seau de `capacity` jetons rechargé à `rate` jetons par seconde : chaque requête
+    consomme un jeton, et attend qu'un jeton soit disponible si le seau est vide.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("Le débit doit être strictement positif.")
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Consomme un jeton, en attendant si nécessaire.
+
+        Returns:
+            Durée d'attente (secondes)
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            # Le jeton manquant est réservé tout de suite : les threads suivants attendent
+            # derrière celui-ci au lieu de se réveiller ensemble
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
@@ -1,17 +1,30 @@
 # src/utils/wikipedia/wikipedia_checker.py
 import logging
 import re
+import threading
+import time
 import unicodedata
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
 
 import requests
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    from src.utils.wikipedia.token_bucket import TokenBucket
+    from src.utils.wikipedia.wikipedia_existence_cache import WikipediaExistenceCache
 
 # =============================
 # Logger / Configuration
 # =============================
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Réponses après lesquelles la requête est retentée (trop de requêtes, serveur surchargé)
+RETRYABLE_STATUS_CODES: tuple[int, ...] = (429, 503)
+# Attente (secondes) si le serveur ne précise pas de Retry-After, et attente maximale
+DEFAULT_RETRY_DELAY = 5.0
+MAX_RETRY_DELAY = 60.0
+
 
 # =============================
 # Dataclasses
@@ -36,11 +49,53 @@ class WikipediaChecker:
 
     BASE_URL = "https://fr.wikipedia.org/w/api.php"
 
-    def __init__(self, user_agent: str = "AstroWikiBuilder/1.0 (bot; machichiotte@gmail.com)"):
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": user_agent})  # Utiliser le user_agent fourni
+    def __init__(
+        self,
+        user_agent: str = "AstroWikiBuilder/1.0 (bot; machichiotte@gmail.com)",
+        cache: "WikipediaExistenceCache | None" = None,
+        rate_limiter: "TokenBucket | None" = None,
+        maxlag: int | None = 5,
+        max_retries: int = 3,
+        base_url: str | None = None,
+        max_connections: int = 1,
+    ):
+        """
+        Args:
+            user_agent: User-Agent envoyé à l'API
+            cache: Réponses déjà obtenues lors d'exécutions précédentes : seuls les titres
+                absents ou expirés sont demandés à l'API
+            rate_limiter: Débit maximal des requêtes, partagé entre threads
+            maxlag: Retard de réplication (secondes) au-delà duquel MediaWiki refuse la
+                requête ; elle est alors retentée après Retry-After (None : désactivé)
+            max_retries: Nombre de nouvelles tentatives (maxlag, 429, 503)
+            base_url: Point d'accès de l'API (défaut : BASE_URL)
+            max_connections: Connexions conservées ouvertes (une par thread qui interroge
+                l'API en parallèle)
+        """
+        self.user_agent = user_agent
+        # requests.Session n'est pas sûre entre threads : une session par thread, qui
+        # partagent le même pool de connexions (urllib3, lui, l'est)
+        self._adapter = HTTPAdapter(pool_maxsize=max(max_connections, 1))
+        self._local = threading.local()
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.maxlag = maxlag
+        self.max_retries = max_retries
+        self.base_url = base_url or self.BASE_URL
         logger.info(f"WikipediaChecker initialized with User-Agent: {user_agent}")
 
+    @property
+    def session(self) -> requests.Session:
+        """Session HTTP du thread courant (créée au premier appel)."""
+        session: requests.Session | None = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({"User-Agent": self.user_agent})
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            self._local.session = session
+        return session
+
     def _normalize_title(self, title: str) -> str:
         title = title.lower()
         title = unicodedata.normalize("NFKD", title).encode("ASCII", "ignore").decode("ASCII")
@@ -63,26 +118,43 @@ class WikipediaChecker:
             titles_to_check
         )
 
+        cached: dict[str, WikiArticleInfo] = (
+            self.cache.get_many(titles_to_check) if self.cache else {}
+        )
+        for title, info in cached.items():
+            initial_results[title] = self._apply_host_star_context(info, exoplanet_context)
+        titles_to_fetch = [title for title in titles_to_check if title not in cached]
+        if not titles_to_fetch:
+            return initial_results
+
         try:
-            data: dict[str, Any] = self.fetch_raw_article_query_from_mediawiki(titles_to_check)
+            data: dict[str, Any] = self.fetch_raw_article_query_from_mediawiki(titles_to_fetch)
         except requests.RequestException as e:
             logger.error(f"Erreur Wikipedia API: {e}")
-            for title in titles_to_check:
+            for title in titles_to_fetch:
                 initial_results[title].url = f"Erreur API: {e}"
             return initial_results
 
         normalized_map, redirect_map, resolved_map = (
-            self.build_title_normalization_and_redirect_maps(data, titles_to_check)
+            self.build_title_normalization_and_redirect_maps(data, titles_to_fetch)
         )
 
+        # Résolution brute (sans contexte), seule mise en cache : le conflit avec l'étoile
+        # hôte est appliqué ensuite, comme pour les réponses lues dans le cache
+        fetched: dict[str, WikiArticleInfo] = {}
         self.resolve_article_existence_from_pages(
             data,
             resolved_map,
             redirect_map,
             normalized_map,
-            initial_results,
-            exoplanet_context,
+            fetched,
+            None,
         )
+        if self.cache and fetched:
+            self.cache.put_many(fetched.values())
+
+        for title, info in fetched.items():
+            initial_results[title] = self._apply_host_star_context(info, exoplanet_context)
 
         return initial_results
 
@@ -102,9 +174,39 @@ class WikipediaChecker:
             "redirects": 1,
             "utf8": 1,
         }
-        response: requests.Response = self.session.get(self.BASE_URL, params=params, timeout=10)
-        response.raise_for_status()
-        return response.json().get("query", {})
+        if self.maxlag is not None:
+            params["maxlag"] = self.maxlag
+
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            response: requests.Response = self.session.get(self.base_url, params=params, timeout=10)
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                reason = f"HTTP {response.status_code}"
+            else:
+                response.raise_for_status()
+                payload: dict[str, Any] = response.json()
+                error: dict[str, Any] = payload.get("error", {})
+                if error.get("code") != "maxlag":
+                    return payload.get("query", {})
+                reason = f"maxlag ({error.get('info', '')})"
+
+            if attempt == self.max_retries:
+                raise requests.RequestException(
+                    f"API indisponible après {attempt + 1} tentatives : {reason}"
+                )
+            delay: float = self._get_retry_delay(response)
+            logger.warning(f"Wikipedia API : {reason}, nouvelle tentative dans {delay:.1f} s")
+            time.sleep(delay)
+        return {}
+
+    def _get_retry_delay(self, response: requests.Response) -> float:
+        """Attente demandée par l'en-tête Retry-After (en secondes), bornée."""
+        try:
+            delay = float(response.headers.get("Retry-After", DEFAULT_RETRY_DELAY))
+        except (TypeError, ValueError):
+            delay = DEFAULT_RETRY_DELAY
+        return min(max(delay, 0.0), MAX_RETRY_DELAY)
 
     def build_title_normalization_and_redirect_maps(
         self, data: dict[str, Any], queried_titles: list[str]
@@ -155,31 +257,32 @@ class WikipediaChecker:
 
         is_redirect: bool = original in redirect_map
         redirect_target: str | None = redirect_map.get(original) if is_redirect else None
-        host_star: Any | None = (
-            exoplanet_context.get(original, {}).get("st_name") if exoplanet_context else None
-        )
-
-        # Check for host star conflict
-        if host_star and self._normalize_title(api_title) == self._normalize_title(host_star):
-            return WikiArticleInfo(
-                exists=False,
-                title=api_title,
-                queried_title=original,
-                is_redirect=is_redirect,
-                redirect_target=redirect_target,
-                url=page.get("fullurl"),
-                host_star=host_star,
-            )
 
-        return WikiArticleInfo(
+        info = WikiArticleInfo(
             exists=True,
             title=api_title,
             queried_title=original,
             is_redirect=is_redirect,
             redirect_target=redirect_target,
             url=page.get("fullurl"),
-            host_star=host_star,
         )
+        return self._apply_host_star_context(info, exoplanet_context)
+
+    def _apply_host_star_context(
+        self,
+        info: WikiArticleInfo,
+        exoplanet_context: dict[str, dict[str, Any]] | None,
+    ) -> WikiArticleInfo:
+        """Un article existant qui est celui de l'étoile hôte ne compte pas pour la planète."""
+        if not info.exists or not exoplanet_context:
+            return info
+        host_star: Any | None = exoplanet_context.get(info.queried_title, {}).get("st_name")
+        if not host_star:
+            return info
+
+        # Check for host star conflict
+        conflict = self._normalize_title(info.title) == self._normalize_title(host_star)
+        return replace(info, exists=not conflict, host_star=host_star)
 
     def resolve_article_existence_from_pages(
         self,
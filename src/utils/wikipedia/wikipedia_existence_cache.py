@@ -0,0 +1,137 @@
+# src/utils/wikipedia/wikipedia_existence_cache.py
+"""
+Cache persistant (SQLite) des réponses de l'API MediaWiki sur l'existence des articles.
+
+Chaque titre interrogé est conservé avec la résolution obtenue (titre final, redirection,
+URL) et sa date de récupération. Une réponse n'est réutilisée que pendant sa durée de
+validité : courte pour les articles absents (ils peuvent être créés entre deux
+exécutions), longue pour les articles existants.
+
+Le cache stocke la résolution brute de la page : le conflit avec l'étoile hôte dépend
+du contexte de l'exoplanète et est réévalué par WikipediaChecker à chaque lecture.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+
+from src.utils.wikipedia.wikipedia_checker import WikiArticleInfo
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# À incrémenter à chaque changement du schéma de la table
+WIKIPEDIA_CACHE_SCHEMA_VERSION = 1
+
+# Limite de variables par requête des anciennes versions de SQLite
+_SQLITE_MAX_VARIABLES = 900
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    queried_title TEXT PRIMARY KEY,
+    article_exists INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    is_redirect INTEGER NOT NULL,
+    redirect_target TEXT,
+    url TEXT,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+class WikipediaExistenceCache:
+    """Réponses MediaWiki par titre interrogé, avec durées de validité positive et négative."""
+
+    def __init__(self, db_path: str, positive_ttl: float, negative_ttl: float):
+        """
+        Args:
+            db_path: Chemin de la base SQLite
+            positive_ttl: Validité (secondes) d'une réponse « l'article existe »
+            negative_ttl: Validité (secondes) d'une réponse « l'article n'existe pas »
+        """
+        self.db_path = db_path
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # Connexion partagée entre threads, sérialisée par le verrou
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._initialize_schema()
+        logger.info(f"Cache Wikipedia ouvert : {db_path}")
+
+    def _initialize_schema(self) -> None:
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, WIKIPEDIA_CACHE_SCHEMA_VERSION):
+            logger.warning(
+                f"Schéma de {self.db_path} obsolète (v{version}, attendu "
+                f"v{WIKIPEDIA_CACHE_SCHEMA_VERSION}) : le cache est vidé."
+            )
+            with self._connection:
+                self._connection.execute("DROP TABLE IF EXISTS articles")
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(f"PRAGMA user_version = {WIKIPEDIA_CACHE_SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def get_many(
+        self, titles: Iterable[str], now: float | None = None
+    ) -> dict[str, WikiArticleInfo]:
+        """
+        Réponses encore valides pour les titres donnés (titre interrogé -> info).
+        Les titres absents ou expirés ne figurent pas dans le résultat.
+        """
+        now = time.time() if now is None else now
+        titles = list(dict.fromkeys(titles))
+        results: dict[str, WikiArticleInfo] = {}
+        with self._lock:
+            for i in range(0, len(titles), _SQLITE_MAX_VARIABLES):
+                chunk = titles[i : i + _SQLITE_MAX_VARIABLES]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    "SELECT queried_title, article_exists, title, is_redirect, redirect_target, "
+                    f"url FROM articles WHERE queried_title IN ({placeholders}) "
+                    "AND fetched_at >= CASE WHEN article_exists THEN ? ELSE ? END",
+                    (*chunk, now - self.positive_ttl, now - self.negative_ttl),
+                )
+                for queried_title, exists, title, is_redirect, redirect_target, url in rows:
+                    results[queried_title] = WikiArticleInfo(
+                        exists=bool(exists),
+                        title=title,
+                        queried_title=queried_title,
+                        is_redirect=bool(is_redirect),
+                        redirect_target=redirect_target,
+                        url=url,
+                    )
+        return results
+
+    def put_many(self, infos: Iterable[WikiArticleInfo], now: float | None = None) -> int:
+        """Enregistre (ou remplace) les réponses, en une seule transaction."""
+        now = time.time() if now is None else now
+        rows = [
+            (
+                info.queried_title,
+                int(info.exists),
+                info.title,
+                int(info.is_redirect),
+                info.redirect_target,
+                info.url,
+                now,
+            )
+            for info in infos
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO articles (queried_title, article_exists, title, "
+                "is_redirect, redirect_target, url, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
@@ -1,6 +1,9 @@
 """Tests pour BaseCollector."""
 
+import json
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -48,6 +51,53 @@ class ConcreteCollector(BaseCollector):
         return Star(st_name=str(hostname))
 
 
+def _streaming_response(
+    body: bytes,
+    status_code: int = 200,
+    fail_after: int | None = None,
+    headers: dict[str, str] | None = None,
+):
+    """Réponse requests simulée, servie en morceaux via iter_content."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.raise_for_status = Mock()
+
+    def iter_content(chunk_size=1):
+        for start in range(0, len(body), 4):
+            if fail_after is not None and start >= fail_after:
+                raise requests.exceptions.ConnectionError("Connexion interrompue")
+            yield body[start : start + 4]
+
+    response.iter_content = Mock(side_effect=iter_content)
+    return response
+
+
+class _CatalogHandler(BaseHTTPRequestHandler):
+    """Serveur de catalogue local gérant ETag / Last-Modified (réponses 304)."""
+
+    body = b"name,mass\ntest,1.0\n"
+    etag = '"v1"'
+    last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+    requests_seen: list[dict[str, str]] = []
+
+    def do_GET(self):
+        type(self).requests_seen.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Last-Modified", self.last_modified)
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
 class TestBaseCollector:
     """Tests pour BaseCollector."""
 
@@ -136,16 +186,15 @@ class TestBaseCollector:
     @patch("requests.get")
     def test_fetch_and_cache_csv_data_success(self, mock_get, collector):
         """Test de téléchargement et mise en cache réussis."""
-        mock_response = Mock()
-        mock_response.text = "name,mass\ntest,1.0"
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _streaming_response(b"name,mass\ntest,1.0")
 
         result = collector.fetch_and_cache_csv_data()
 
         assert result is not None
         assert len(result) == 1
         assert os.path.exists(collector.cache_path)
+        assert not os.path.exists(f"{collector.cache_path}.part")
+        assert mock_get.call_args.kwargs["stream"] is True
 
     @patch("requests.get")
     def test_fetch_and_cache_csv_data_http_error(self, mock_get, collector):
@@ -179,16 +228,142 @@ class TestBaseCollector:
     @patch("requests.get")
     def test_load_source_dataframe_download_on_cache_miss(self, mock_get, collector):
         """Test de téléchargement en cas de cache manquant."""
-        mock_response = Mock()
-        mock_response.text = "name,mass\ntest,1.0"
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _streaming_response(b"name,mass\ntest,1.0")
 
         result = collector.load_source_dataframe()
 
         assert result is not None
         assert len(result) == 1
 
+    @patch("requests.get")
+    def test_interrupted_download_keeps_previous_cache(self, mock_get, collector):
+        """Un téléchargement interrompu ne touche pas au cache et laisse un .part à reprendre."""
+        with open(collector.cache_path, "w") as f:
+            f.write("name,mass\nold,1.0")
+        mock_get.return_value = _streaming_response(b"name,mass\nnew,2.0\n", fail_after=8)
+
+        assert collector.fetch_and_cache_csv_data() is None
+
+        with open(collector.cache_path) as f:
+            assert f.read() == "name,mass\nold,1.0"
+        with open(f"{collector.cache_path}.part", "rb") as f:
+            assert f.read() == b"name,mas"
+
+    @staticmethod
+    def _write_partial_download(collector, content: bytes, url: str, etag: str = '"v1"'):
+        with open(f"{collector.cache_path}.part", "wb") as f:
+            f.write(content)
+        with open(f"{collector.cache_path}.part.meta.json", "w") as f:
+            json.dump({"url": url, "etag": etag, "last_modified": None}, f)
+
+    @patch("requests.get")
+    def test_interrupted_download_records_part_origin(self, mock_get, collector):
+        """Le .part d'un téléchargement interrompu est accompagné de son URL et de son ETag."""
+        mock_get.return_value = _streaming_response(
+            b"name,mass\nnew,2.0\n", fail_after=8, headers={"ETag": '"v2"'}
+        )
+
+        assert collector.fetch_and_cache_csv_data() is None
+
+        with open(f"{collector.cache_path}.part.meta.json") as f:
+            assert json.load(f) == {
+                "url": "https://example.com/data.csv",
+                "etag": '"v2"',
+                "last_modified": None,
+            }
+
+    @patch("requests.get")
+    def test_download_resumes_partial_file_with_range(self, mock_get, collector):
+        """Un .part existant est complété via Range / If-Range (réponse 206)."""
+        self._write_partial_download(collector, b"name,mass\n", "https://example.com/data.csv")
+        mock_get.return_value = _streaming_response(
+            b"test,1.0\n", status_code=206, headers={"Content-Range": "bytes 10-18/19"}
+        )
+
+        result = collector.fetch_and_cache_csv_data()
+
+        assert mock_get.call_args.kwargs["headers"]["Range"] == "bytes=10-"
+        assert mock_get.call_args.kwargs["headers"]["If-Range"] == '"v1"'
+        assert result["name"].tolist() == ["test"]
+        assert not os.path.exists(f"{collector.cache_path}.part")
+        assert not os.path.exists(f"{collector.cache_path}.part.meta.json")
+
+    @patch("requests.get")
+    def test_partial_file_from_another_url_is_discarded(self, mock_get, collector):
+        """Un .part téléchargé depuis une autre URL n'est pas repris."""
+        self._write_partial_download(collector, b"old,columns\n", "https://example.com/old.csv")
+        mock_get.return_value = _streaming_response(b"name,mass\ntest,1.0\n")
+
+        result = collector.fetch_and_cache_csv_data()
+
+        assert "Range" not in mock_get.call_args.kwargs["headers"]
+        assert result["name"].tolist() == ["test"]
+
+    @patch("requests.get")
+    def test_partial_file_without_origin_is_discarded(self, mock_get, collector):
+        """Un .part sans URL ni validateur enregistrés n'est pas repris."""
+        with open(f"{collector.cache_path}.part", "wb") as f:
+            f.write(b"garbage")
+        mock_get.return_value = _streaming_response(b"name,mass\ntest,1.0\n")
+
+        result = collector.fetch_and_cache_csv_data()
+
+        assert "Range" not in mock_get.call_args.kwargs["headers"]
+        assert result["name"].tolist() == ["test"]
+
+    @patch("requests.get")
+    def test_download_restarts_when_range_is_ignored(self, mock_get, collector):
+        """Ressource modifiée (If-Range) ou Range ignoré : réponse 200, le .part est réécrit."""
+        self._write_partial_download(collector, b"garbage", "https://example.com/data.csv")
+        mock_get.return_value = _streaming_response(b"name,mass\ntest,1.0\n")
+
+        result = collector.fetch_and_cache_csv_data()
+
+        assert result["name"].tolist() == ["test"]
+
+    @patch("requests.get")
+    def test_download_restarts_when_content_range_does_not_match(self, mock_get, collector):
+        """Une réponse 206 sur une autre plage que celle demandée n'est pas ajoutée au .part."""
+        self._write_partial_download(collector, b"name,mass\n", "https://example.com/data.csv")
+        mock_get.side_effect = [
+            _streaming_response(b"xx", status_code=206, headers={"Content-Range": "bytes 0-1/2"}),
+            _streaming_response(b"name,mass\ntest,1.0\n"),
+        ]
+
+        result = collector.fetch_and_cache_csv_data()
+
+        assert result["name"].tolist() == ["test"]
+        assert "Range" not in mock_get.call_args.kwargs["headers"]
+
+    @patch("requests.get")
+    def test_download_restarts_when_range_is_not_satisfiable(self, mock_get, collector):
+        """Une réponse 416 supprime le .part et relance un téléchargement complet."""
+        self._write_partial_download(collector, b"stale content", "https://example.com/data.csv")
+        mock_get.side_effect = [
+            _streaming_response(b"", status_code=416),
+            _streaming_response(b"name,mass\ntest,1.0\n"),
+        ]
+
+        result = collector.fetch_and_cache_csv_data()
+
+        assert result["name"].tolist() == ["test"]
+        assert "Range" not in mock_get.call_args.kwargs["headers"]
+
+    @patch("requests.get")
+    def test_download_with_compressed_cache(self, mock_get, temp_cache_dir):
+        """Avec compress_cache, le cache est écrit en gzip et relu de façon transparente."""
+        import gzip
+
+        collector = ConcreteCollector(cache_dir=temp_cache_dir, compress_cache=True)
+        mock_get.return_value = _streaming_response(b"name,mass\ntest,1.0\n")
+
+        result = collector.fetch_and_cache_csv_data()
+
+        assert collector.cache_path.endswith(".csv.gz")
+        with gzip.open(collector.cache_path, "rb") as f:
+            assert f.read() == b"name,mass\ntest,1.0\n"
+        assert result["mass"].tolist() == [1.0]
+
     def test_load_source_dataframe_use_existing_cache(self, collector, temp_cache_dir):
         """Test d'utilisation du cache existant."""
         csv_path = collector.cache_path
@@ -217,6 +392,27 @@ class TestBaseCollector:
         assert exoplanets[0].pl_name == "Planet1"
         assert stars[0].st_name == "Star1"
 
+    def test_transform_row_to_entities_delegates_to_separate_transforms(self, collector):
+        """Par défaut, la conversion combinée délègue aux deux conversions."""
+        row = pd.Series({"name": "Planet1", "hostname": "Star1"})
+
+        exoplanet, star = collector.transform_row_to_entities(row)
+
+        assert exoplanet.pl_name == "Planet1"
+        assert star.st_name == "Star1"
+
+    def test_extract_entities_only_builds_selected_star_rows(self, collector):
+        """Les étoiles ne sont construites que pour les lignes retenues par select_host_star_rows."""
+        df = pd.DataFrame(
+            {"name": ["Planet1", "Planet2"], "hostname": ["Star1", "Star1"], "mass": [1.0, 2.0]}
+        )
+
+        with patch.object(collector, "select_host_star_rows", return_value=[1]):
+            exoplanets, stars = collector.extract_entities_from_dataframe(df)
+
+        assert len(exoplanets) == 2
+        assert len(stars) == 1
+
     def test_collect_entities_from_source_no_data(self, collector):
         """Test de collecte sans données disponibles."""
         exoplanets, stars = collector.collect_entities_from_source()
@@ -239,10 +435,7 @@ class TestBaseCollector:
     @patch("requests.get")
     def test_fetch_and_cache_csv_data_write_error(self, mock_get, collector):
         """Test de gestion d'erreur d'écriture du cache."""
-        mock_response = Mock()
-        mock_response.text = "name,mass\\ntest,1.0"
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _streaming_response(b"name,mass\ntest,1.0")
 
         # Simuler une erreur d'écriture
         with patch("builtins.open", side_effect=OSError("Write error")):
@@ -270,10 +463,7 @@ class TestBaseCollector:
         with open(csv_path, "w") as f:
             f.write("corrupted data")
 
-        mock_response = Mock()
-        mock_response.text = "name,mass\\ntest,1.0"
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _streaming_response(b"name,mass\ntest,1.0")
 
         # Le cache existe mais est corrompu, donc on télécharge
         with patch.object(collector, "read_csv_file", return_value=None):
@@ -329,3 +519,230 @@ class TestBaseCollector:
 
         assert exoplanets == []
         assert stars == []
+
+    @pytest.fixture
+    def catalog_server(self):
+        """Serveur HTTP local servant un petit catalogue CSV."""
+        _CatalogHandler.requests_seen = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _CatalogHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}/catalog.csv"
+        server.shutdown()
+        server.server_close()
+
+    def _revalidating_collector(self, temp_cache_dir, url, cache_max_age=None):
+        collector = ConcreteCollector(
+            cache_dir=temp_cache_dir, revalidate_cache=True, cache_max_age=cache_max_age
+        )
+        collector.get_data_download_url = lambda: url
+        return collector
+
+    def test_download_writes_cache_metadata(self, temp_cache_dir, catalog_server):
+        """Le téléchargement enregistre ETag, Last-Modified, SHA-256 et date de récupération."""
+        import hashlib
+
+        collector = self._revalidating_collector(temp_cache_dir, catalog_server)
+
+        collector.fetch_and_cache_csv_data()
+
+        with open(collector.cache_metadata_path) as f:
+            metadata = json.load(f)
+        assert metadata["etag"] == '"v1"'
+        assert metadata["last_modified"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+        assert metadata["sha256"] == hashlib.sha256(_CatalogHandler.body).hexdigest()
+        assert metadata["url"] == catalog_server
+        assert collector.get_cache_age() < 60
+
+    def test_revalidation_not_modified_keeps_cache(self, temp_cache_dir, catalog_server):
+        """Un cache expiré est revalidé ; sur 304 il n'est ni retéléchargé ni réécrit."""
+        collector = self._revalidating_collector(temp_cache_dir, catalog_server, cache_max_age=0)
+        collector.fetch_and_cache_csv_data()
+        os.utime(collector.cache_path, (0, 0))
+        metadata = collector.read_cache_metadata()
+        metadata["fetched_at"] = "2025-01-01T00:00:00+00:00"
+        collector._save_cache_metadata(metadata)
+
+        result = collector.load_source_dataframe()
+
+        assert result["name"].tolist() == ["test"]
+        last_request = _CatalogHandler.requests_seen[-1]
+        assert last_request["If-None-Match"] == '"v1"'
+        assert last_request["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+        assert os.path.getmtime(collector.cache_path) == 0
+        assert collector.get_cache_age() < 60
+
+    def test_revalidation_downloads_changed_catalog(self, temp_cache_dir, catalog_server):
+        """Si l'ETag a changé, le serveur renvoie 200 et le cache est remplacé."""
+        collector = self._revalidating_collector(temp_cache_dir, catalog_server, cache_max_age=0)
+        collector.fetch_and_cache_csv_data()
+
+        with (
+            patch.object(_CatalogHandler, "etag", '"v2"'),
+            patch.object(_CatalogHandler, "body", b"name,mass\nnew,2.0\n"),
+        ):
+            result = collector.load_source_dataframe()
+
+        assert result["name"].tolist() == ["new"]
+        assert collector.read_cache_metadata()["etag"] == '"v2"'
+
+    def test_fresh_cache_skips_revalidation(self, temp_cache_dir, catalog_server):
+        """Un cache plus récent que max_age est lu sans aucune requête."""
+        collector = self._revalidating_collector(temp_cache_dir, catalog_server, cache_max_age=3600)
+        collector.fetch_and_cache_csv_data()
+
+        result = collector.load_source_dataframe()
+
+        assert result["name"].tolist() == ["test"]
+        assert len(_CatalogHandler.requests_seen) == 1
+
+    def test_cache_without_revalidation_is_reused_forever(self, collector):
+        """Sans revalidate_cache, un cache existant est toujours réutilisé tel quel."""
+        with open(collector.cache_path, "w") as f:
+            f.write("name,mass\nold,1.0")
+        os.utime(collector.cache_path, (0, 0))
+
+        assert collector.is_cache_fresh() is True
+        assert collector.load_source_dataframe()["name"].tolist() == ["old"]
+
+    def test_parsed_cache_is_reused_while_raw_file_unchanged(self, collector):
+        """Le second chargement lit la copie Feather, identique au CSV, sans re-parser."""
+        pytest.importorskip("pyarrow")
+        with open(collector.cache_path, "w") as f:
+            f.write("name,mass,note\nA,1.0,x\nB,,\n")
+        expected = pd.read_csv(collector.cache_path)
+
+        collector.load_source_dataframe()
+        assert os.path.exists(collector.parsed_cache_path)
+
+        with patch.object(collector, "read_csv_file") as mock_read_csv:
+            result = collector.load_source_dataframe()
+
+        mock_read_csv.assert_not_called()
+        pd.testing.assert_frame_equal(result, expected)
+        assert isinstance(result["note"].iloc[1], float)
+
+    def test_parsed_cache_invalidated_by_raw_change(self, collector):
+        """Un CSV brut modifié (hash différent) est re-parsé."""
+        pytest.importorskip("pyarrow")
+        with open(collector.cache_path, "w") as f:
+            f.write("name,mass\nold,1.0\n")
+        collector.load_source_dataframe()
+
+        with open(collector.cache_path, "w") as f:
+            f.write("name,mass\nnew,2.0\n")
+        result = collector.load_source_dataframe()
+
+        assert result["name"].tolist() == ["new"]
+
+    def test_parsed_cache_invalidated_by_schema_version(self, collector):
+        """Un changement de PARSED_CACHE_SCHEMA_VERSION invalide la copie parsée."""
+        pytest.importorskip("pyarrow")
+        with open(collector.cache_path, "w") as f:
+            f.write("name,mass\ntest,1.0\n")
+        collector.load_source_dataframe()
+
+        collector.PARSED_CACHE_SCHEMA_VERSION = 2
+        with patch.object(collector, "read_csv_file", wraps=collector.read_csv_file) as mock_read:
+            collector.load_source_dataframe()
+
+        mock_read.assert_called_once()
+
+    def test_cache_fingerprint_follows_raw_file(self, collector):
+        """Empreinte absente sans cache, puis modifiée avec le contenu du fichier brut."""
+        assert collector.get_cache_fingerprint() is None
+
+        with open(collector.cache_path, "w") as f:
+            f.write("name,mass\ntest,1.0\n")
+        fingerprint = collector.get_cache_fingerprint()
+        assert fingerprint["sha256"] == collector._hash_cache_file()
+        assert collector.get_cache_fingerprint() == fingerprint
+
+        with open(collector.cache_path, "w") as f:
+            f.write("name,mass\ntest,2.0\n")
+        assert collector.get_cache_fingerprint() != fingerprint
+
+    def test_cache_fingerprint_none_when_cache_must_be_revalidated(self, temp_cache_dir):
+        collector = ConcreteCollector(cache_dir=temp_cache_dir, revalidate_cache=True)
+        with open(collector.cache_path, "w") as f:
+            f.write("name,mass\ntest,1.0\n")
+
+        assert collector.get_cache_fingerprint() is None
+
+    def test_read_cache_file_without_pyarrow(self, collector):
+        """Sans pyarrow, le CSV est relu et aucune copie parsée n'est écrite."""
+        with open(collector.cache_path, "w") as f:
+            f.write("name,mass\ntest,1.0\n")
+
+        with patch("src.collectors.base_collector.HAS_PYARROW", False):
+            result = collector.read_cache_file()
+
+        assert result["name"].tolist() == ["test"]
+        assert not os.path.exists(collector.parsed_cache_path)
+
+    def test_read_csv_file_prunes_unused_columns(self, collector, temp_cache_dir):
+        """Seules les colonnes utilisées (et requises) sont lues ; le bilan est mémorisé."""
+        csv_path = os.path.join(temp_cache_dir, "wide.csv")
+        pd.DataFrame(
+            {"name": ["a", "b"], "mass": [1.0, 2.0], "hostname": ["S", "S"], "unused": [3, 4]}
+        ).to_csv(csv_path, index=False)
+
+        with (
+            patch.object(collector, "get_used_csv_columns", return_value={"hostname"}),
+            patch.object(collector, "get_csv_column_dtypes", return_value={"hostname": "str"}),
+        ):
+            result = collector.read_csv_file(csv_path)
+
+        assert sorted(result.columns) == ["hostname", "mass", "name"]
+        assert result["hostname"].dtype == object
+        assert collector.column_pruning_report["total_columns"] == 4
+        assert collector.column_pruning_report["skipped_columns"] == 1
+        assert collector.column_pruning_report["skipped_bytes"] > 0
+
+    def test_read_csv_file_without_used_columns_reads_everything(self, collector, temp_cache_dir):
+        """Sans get_used_csv_columns, toutes les colonnes sont lues et aucun bilan n'est fait."""
+        csv_path = os.path.join(temp_cache_dir, "wide.csv")
+        pd.DataFrame({"name": ["a"], "mass": [1.0], "unused": [3]}).to_csv(csv_path, index=False)
+
+        result = collector.read_csv_file(csv_path)
+
+        assert list(result.columns) == ["name", "mass", "unused"]
+        assert collector.column_pruning_report is None
+
+    def test_chunked_collection_matches_full_read(self, temp_cache_dir):
+        """Lecture par blocs : mêmes entités que la lecture complète, un bloc à la fois."""
+        full = ConcreteCollector(cache_dir=temp_cache_dir)
+        pd.DataFrame(
+            {
+                "name": [f"p{i}" for i in range(7)],
+                "mass": [float(i) for i in range(7)],
+                "hostname": [f"S{i // 2}" for i in range(7)],
+            }
+        ).to_csv(full.cache_path, index=False)
+        chunked = ConcreteCollector(cache_dir=temp_cache_dir, chunk_size=3)
+
+        blocks = list(chunked.iter_entities_from_source())
+        exoplanets, stars = chunked.collect_entities_from_source()
+
+        assert [len(block_exoplanets) for block_exoplanets, _ in blocks] == [3, 3, 1]
+        expected_exoplanets, expected_stars = full.collect_entities_from_source()
+        assert [e.pl_name for e in exoplanets] == [e.pl_name for e in expected_exoplanets]
+        assert [s.st_name for s in stars] == [s.st_name for s in expected_stars]
+
+    def test_chunked_collection_checks_required_columns(self, temp_cache_dir):
+        """Un cache sans les colonnes requises ne produit aucun bloc."""
+        collector = ConcreteCollector(cache_dir=temp_cache_dir, chunk_size=2)
+        pd.DataFrame({"wrong_column": ["a", "b", "c"]}).to_csv(collector.cache_path, index=False)
+
+        assert list(collector.iter_entities_from_source()) == []
+
+    @patch("requests.get")
+    def test_chunked_collection_downloads_missing_cache(self, mock_get, temp_cache_dir):
+        """Sans cache, le catalogue est téléchargé puis lu par blocs."""
+        mock_get.return_value = _streaming_response(b"name,mass\na,1.0\nb,2.0\nc,3.0\n")
+        collector = ConcreteCollector(cache_dir=temp_cache_dir, chunk_size=2)
+
+        exoplanets, _ = collector.collect_entities_from_source()
+
+        assert [e.pl_name for e in exoplanets] == ["a", "b", "c"]
+        assert mock_get.call_count == 1
@@ -0,0 +1,55 @@
+"""Tests du registre des collecteurs (chargement à la demande)."""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from src.collectors import registry
+from src.collectors.implementations.exoplanet_eu_collector import ExoplanetEUCollector
+from src.collectors.registry import COLLECTOR_REGISTRY, load_collector_class, register_collector
+
+
+class TestCollectorRegistry:
+    def test_registry_covers_available_sources(self):
+        from src.core.config import AVAILABLE_SOURCES
+
+        assert list(COLLECTOR_REGISTRY) == AVAILABLE_SOURCES
+
+    def test_load_collector_class_imports_on_first_use(self):
+        with patch.dict(registry._loaded_collectors, clear=True):
+            with patch.dict(sys.modules):
+                sys.modules.pop("src.collectors.implementations.exoplanet_eu_collector")
+
+                collector_class = load_collector_class("exoplanet_eu")
+
+                assert collector_class.__name__ == "ExoplanetEUCollector"
+                assert "src.collectors.implementations.exoplanet_eu_collector" in sys.modules
+
+    def test_load_collector_class_caches_class(self):
+        with patch.dict(registry._loaded_collectors, clear=True):
+            assert load_collector_class("exoplanet_eu") is ExoplanetEUCollector
+            with patch("src.collectors.registry.importlib.import_module") as mock_import:
+                load_collector_class("exoplanet_eu")
+            mock_import.assert_not_called()
+
+    def test_load_collector_class_unknown_source(self):
+        with pytest.raises(ValueError, match="Source inconnue"):
+            load_collector_class("unknown_source")
+
+    def test_register_collector(self):
+        with (
+            patch.dict(COLLECTOR_REGISTRY),
+            patch.dict(registry._loaded_collectors, clear=True),
+        ):
+            register_collector(
+                "eu_mirror",
+                "src.collectors.implementations.exoplanet_eu_collector:ExoplanetEUCollector",
+            )
+            assert load_collector_class("eu_mirror") is ExoplanetEUCollector
+
+        assert "eu_mirror" not in COLLECTOR_REGISTRY
+
+    def test_register_collector_rejects_invalid_spec(self):
+        with pytest.raises(ValueError, match="module:Classe"):
+            register_collector("broken", "src.collectors.implementations")
@@ -139,6 +139,10 @@ class TestExoplanetEUCollector:
         assert exoplanet.pl_name == "51 Peg b"
         assert exoplanet.st_name == "51 Peg"
         assert len(exoplanet.pl_altname) == 2
+        assert exoplanet.pl_orbital_period.value == 4.230785
+        assert exoplanet.pl_mass.value == 0.468
+        assert exoplanet.st_temperature.value == 5793
+        assert exoplanet.st_spectral_type == "G5V"
 
     @patch("src.services.processors.reference_manager.ReferenceManager.create_reference")
     def test_transform_row_to_exoplanet_with_partial_data(self, mock_create_ref):
@@ -243,3 +247,12 @@ class TestExoplanetEUCollector:
         ):
             result = collector.transform_row_to_exoplanet(mock_row)
             assert result is None
+
+    def test_used_csv_columns_cover_mapped_and_required_fields(self):
+        """Les colonnes lues couvrent les champs mappés ; les requises sont ajoutées à la lecture."""
+        collector = ExoplanetEUCollector(use_mock_data=True)
+
+        used_columns = collector.get_used_csv_columns()
+
+        assert {"name", "star_name", "alt_names", "orbital_period", "star_mass"} <= used_columns
+        assert set(collector.get_required_csv_columns()) <= collector._get_kept_csv_columns()
@@ -3,16 +3,48 @@
 Tests pour NasaExoplanetArchiveCollector.
 """
 
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
 
 import pandas as pd
+import pytest
 
 from src.collectors.implementations.nasa_exoplanet_archive_collector import (
     NasaExoplanetArchiveCollector,
 )
+from src.core.config import CACHE_PATHS
 from src.models.references.reference import SourceType
 
 
+class _TapHandler(BaseHTTPRequestHandler):
+    """Serveur TAP local : exécute "select <colonnes> from PSCompPars [where rowupdate >= 'd']"."""
+
+    table = pd.DataFrame()
+    queries: list[str] = []
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)["query"][0]
+        type(self).queries.append(query)
+        match = re.fullmatch(
+            r"select (\S+) from PSCompPars(?: where rowupdate >= '([\d-]+)')?", query
+        )
+        columns = match.group(1).split(",")
+        result = self.table
+        if match.group(2):
+            result = result[result["rowupdate"] >= match.group(2)]
+        body = result[columns].to_csv(index=False).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
 class TestNasaExoplanetArchiveCollector:
     """Tests du collecteur NASA."""
 
@@ -276,3 +308,258 @@ class TestNasaExoplanetArchiveCollector:
         ):
             result = collector.transform_row_to_star(row)
             assert result is None
+
+    def test_extract_entities_uses_vectorized_mapper_by_default(self):
+        """Le mapping vectorisé est utilisé par défaut."""
+        collector = NasaExoplanetArchiveCollector(use_mock_data=True)
+        df = pd.DataFrame({"pl_name": ["Test b"], "hostname": ["Test"]})
+
+        with patch.object(
+            collector.mapper, "map_entities_from_nea_dataframe", return_value=([], [])
+        ) as mock_vectorized:
+            collector.extract_entities_from_dataframe(df)
+
+        mock_vectorized.assert_called_once_with(df, star_rows=[0])
+
+    def test_extract_entities_row_by_row_mode(self):
+        """Le parcours ligne par ligne reste disponible."""
+        collector = NasaExoplanetArchiveCollector(use_mock_data=True, use_vectorized_mapping=False)
+        df = pd.DataFrame({"pl_name": ["Test b"], "hostname": ["Test"]})
+
+        with patch.object(collector.mapper, "map_entities_from_nea_dataframe") as mock_vectorized:
+            exoplanets, stars = collector.extract_entities_from_dataframe(df)
+
+        mock_vectorized.assert_not_called()
+        assert [e.pl_name for e in exoplanets] == ["Test b"]
+        assert [s.st_name for s in stars] == ["Test"]
+
+    def test_transform_row_to_entities_single_mapper_call(self):
+        """La planète et son étoile sont construites en un seul appel au mapper."""
+        from src.models.entities.exoplanet_entity import Exoplanet
+        from src.models.entities.star_entity import Star
+
+        collector = NasaExoplanetArchiveCollector(use_mock_data=True)
+        row = pd.Series({"pl_name": "Kepler-186 f", "hostname": "Kepler-186"})
+        entities = (Exoplanet(pl_name="Kepler-186 f"), Star(st_name="Kepler-186"))
+
+        with patch.object(
+            collector.mapper, "map_entities_from_nea_record", return_value=entities
+        ) as mock_combined:
+            result = collector.transform_row_to_entities(row)
+
+        assert result == entities
+        mock_combined.assert_called_once_with(
+            {"pl_name": "Kepler-186 f", "hostname": "Kepler-186"},
+            with_exoplanet=True,
+            with_star=True,
+            plans=collector.mapper.get_record_plans(row.index),
+        )
+
+    def test_transform_row_to_entities_missing_planet_name(self):
+        """Une ligne sans pl_name produit uniquement l'étoile."""
+        collector = NasaExoplanetArchiveCollector(use_mock_data=True)
+        row = pd.Series({"pl_name": None, "hostname": "Kepler-186"})
+
+        exoplanet, star = collector.transform_row_to_entities(row)
+
+        assert exoplanet is None
+        assert star.st_name == "Kepler-186"
+
+    def test_transform_row_to_entities_mapper_exception(self):
+        """Une erreur du mapper ignore la ligne."""
+        collector = NasaExoplanetArchiveCollector(use_mock_data=True)
+        row = pd.Series({"pl_name": "Test b", "hostname": "Test"})
+
+        with patch.object(
+            collector.mapper,
+            "map_entities_from_nea_record",
+            side_effect=Exception("Mapper error"),
+        ):
+            assert collector.transform_row_to_entities(row) == (None, None)
+
+    def test_select_host_star_rows_keeps_best_populated_row(self):
+        """Une seule ligne par hostname : celle dont les colonnes stellaires sont les plus remplies."""
+        collector = NasaExoplanetArchiveCollector(use_mock_data=True)
+        df = pd.DataFrame(
+            {
+                "pl_name": ["Sys b", "Other b", "Sys c", "Sys d"],
+                "hostname": ["Sys", "Other", "Sys", "Sys"],
+                "st_teff": [None, 4800.0, 5700.0, 5700.0],
+                "st_mass": [None, 0.8, 1.0, 1.0],
+                "pl_orbper": [3.0, 4.0, 5.0, 6.0],
+            },
+            index=[10, 11, 12, 13],
+        )
+
+        assert collector.select_host_star_rows(df) == [1, 2]
+
+    def test_select_host_star_rows_without_hostname_column(self):
+        """Sans colonne hostname, aucune sélection n'est faite."""
+        collector = NasaExoplanetArchiveCollector(use_mock_data=True)
+        assert collector.select_host_star_rows(pd.DataFrame({"pl_name": ["A b"]})) is None
+
+    @pytest.mark.parametrize("use_vectorized_mapping", [True, False])
+    def test_extract_entities_maps_each_host_star_once(self, use_vectorized_mapping):
+        """Les deux modes de mapping produisent une étoile par hostname, issue de la ligne retenue."""
+        collector = NasaExoplanetArchiveCollector(
+            use_mock_data=True, use_vectorized_mapping=use_vectorized_mapping
+        )
+        df = pd.DataFrame(
+            {
+                "pl_name": ["Sys b", "Sys c", "Other b"],
+                "hostname": ["Sys", "Sys", "Other"],
+                "st_teff": [None, 5700.0, 4800.0],
+            }
+        )
+
+        exoplanets, stars = collector.extract_entities_from_dataframe(df)
+
+        assert [e.pl_name for e in exoplanets] == ["Sys b", "Sys c", "Other b"]
+        assert [s.st_name for s in stars] == ["Sys", "Other"]
+        assert stars[0].st_temperature.value == 5700.0
+
+    def test_read_csv_prunes_columns_without_changing_entities(self, tmp_path):
+        """Les colonnes non mappées ne sont pas lues et les entités restent identiques."""
+        from dataclasses import replace
+
+        collector = NasaExoplanetArchiveCollector(
+            cache_dir=str(tmp_path), custom_cache_filename="nea.csv"
+        )
+        df = pd.DataFrame(
+            {
+                "pl_name": ["Sys b", "Sys c"],
+                "hostname": ["Sys", "Sys"],
+                "hip_name": ["HIP 1", "HIP 1"],
+                "pl_orbper": [3.5, "&lt10"],
+                "pl_orbper_err1": [0.1, None],
+                "st_teff": [5700.0, 5700.0],
+                "pl_orbperlim": [0, 0],
+                "st_teff_reflink": ["<a>ref</a>", "<a>ref</a>"],
+            }
+        )
+        df.to_csv(collector.cache_path, index=False)
+
+        pruned = collector.read_csv_file(collector.cache_path)
+        with patch.object(collector, "get_used_csv_columns", return_value=None):
+            full = collector.read_csv_file(collector.cache_path)
+
+        assert "pl_orbperlim" not in pruned.columns
+        assert "st_teff_reflink" not in pruned.columns
+        assert collector.column_pruning_report["skipped_columns"] == 2
+
+        def comparable(entities):
+            return [repr(replace(entity, reference=None)) for entity in entities]
+
+        for pruned_entities, full_entities in zip(
+            collector.extract_entities_from_dataframe(pruned),
+            collector.extract_entities_from_dataframe(full),
+            strict=True,
+        ):
+            assert comparable(pruned_entities) == comparable(full_entities)
+
+
+class TestNasaTapQueries:
+    """Requêtes TAP limitées aux colonnes utiles et mise à jour incrémentale."""
+
+    @staticmethod
+    def _archive(rows):
+        columns = NasaExoplanetArchiveCollector(use_mock_data=True).get_tap_columns()
+        return pd.DataFrame(rows).reindex(columns=columns)
+
+    @pytest.fixture
+    def tap_server(self):
+        _TapHandler.queries = []
+        _TapHandler.table = self._archive(
+            [
+                {"pl_name": "A b", "hostname": "A", "pl_orbper": 1.5, "rowupdate": "2025-01-01"},
+                {"pl_name": "B b", "hostname": "B", "pl_orbper": 2.5, "rowupdate": "2025-01-02"},
+            ]
+        )
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _TapHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}/TAP/sync"
+        server.shutdown()
+        server.server_close()
+
+    def test_tap_query_selects_only_existing_used_columns(self):
+        """La requête ne porte que sur des colonnes lues par le mapping et présentes dans PSCompPars."""
+        collector = NasaExoplanetArchiveCollector(use_mock_data=True)
+
+        query = collector.build_tap_query()
+
+        columns = query.removeprefix("select ").split(" from ")[0].split(",")
+        assert query.endswith(" from PSCompPars")
+        assert {"pl_name", "hostname", "pl_orbper", "rowupdate"} <= set(columns)
+        assert "pl_altname" not in columns  # absente de PSCompPars
+        assert "pl_orbper_err1" not in columns
+        assert set(columns) <= NasaExoplanetArchiveCollector.NEARCHIVE_COLUMNS
+
+    def test_incremental_fetch_merges_changed_rows(self, tmp_path, tap_server):
+        """Un cache expiré n'est complété que des lignes modifiées, fusionnées par pl_name."""
+        collector = NasaExoplanetArchiveCollector(
+            cache_dir=str(tmp_path),
+            custom_cache_filename="nea.csv",
+            incremental_fetch=True,
+            cache_max_age=0,
+        )
+        collector.NEARCHIVE_TAP_SYNC_URL = tap_server
+
+        first = collector.load_source_dataframe()
+        assert first["pl_name"].tolist() == ["A b", "B b"]
+        assert _TapHandler.queries[-1].endswith("from PSCompPars")
+
+        _TapHandler.table = self._archive(
+            [
+                {"pl_name": "A b", "hostname": "A", "pl_orbper": 1.5, "rowupdate": "2025-01-01"},
+                {"pl_name": "B b", "hostname": "B", "pl_orbper": 2.6, "rowupdate": "2025-02-01"},
+                {"pl_name": "C b", "hostname": "C", "pl_orbper": 9.0, "rowupdate": "2025-02-01"},
+            ]
+        )
+        refreshed = collector.load_source_dataframe()
+
+        assert _TapHandler.queries[-1].endswith("where rowupdate >= '2025-01-02'")
+        assert refreshed["pl_name"].tolist() == ["A b", "B b", "C b"]
+        assert refreshed["pl_orbper"].tolist() == [1.5, 2.6, 9.0]
+        raw = pd.read_csv(collector.cache_path, dtype=str, keep_default_na=False)
+        assert raw["rowupdate"].tolist() == ["2025-01-01", "2025-02-01", "2025-02-01"]
+
+    def test_incremental_fetch_reuses_fresh_cache_without_request(self, tmp_path, tap_server):
+        """Sans cache_max_age explicite, un cache récent est relu sans requête TAP."""
+        collector = NasaExoplanetArchiveCollector(
+            cache_dir=str(tmp_path), custom_cache_filename="nea.csv", incremental_fetch=True
+        )
+        collector.NEARCHIVE_TAP_SYNC_URL = tap_server
+        collector.load_source_dataframe()
+
+        cached = collector.load_source_dataframe()
+
+        assert collector.cache_max_age == CACHE_PATHS["nasa_exoplanet_archive"]["max_age"]
+        assert len(_TapHandler.queries) == 1
+        assert cached["pl_name"].tolist() == ["A b", "B b"]
+
+    def test_incremental_fetch_is_ignored_with_mock_data(self, caplog):
+        """Le mode incrémental est désactivé, avec un avertissement, en mode mock."""
+        collector = NasaExoplanetArchiveCollector(use_mock_data=True, incremental_fetch=True)
+
+        assert collector.incremental_fetch is False
+        assert "incrémentale ignorée" in caplog.text
+
+    def test_incremental_fetch_falls_back_to_full_download(self, tmp_path, tap_server):
+        """Un cache aux colonnes différentes (ancien select *) est retéléchargé en entier."""
+        collector = NasaExoplanetArchiveCollector(
+            cache_dir=str(tmp_path),
+            custom_cache_filename="nea.csv",
+            incremental_fetch=True,
+            cache_max_age=0,
+        )
+        collector.NEARCHIVE_TAP_SYNC_URL = tap_server
+        pd.DataFrame({"pl_name": ["Old b"], "hostname": ["Old"], "extra": [1]}).to_csv(
+            collector.cache_path, index=False
+        )
+
+        result = collector.load_source_dataframe()
+
+        assert len(_TapHandler.queries) == 1
+        assert "where" not in _TapHandler.queries[0]
+        assert result["pl_name"].tolist() == ["A b", "B b"]
@@ -26,7 +26,6 @@ class TestIntroductionSection:
         section.planet_type_util.determine_exoplanet_classification.return_value = "Géante gazeuse"
         section.star_type_util = Mock()
         section.star_type_util.determine_star_types_from_properties.return_value = []
-        section.constellation_util = Mock()
         return section
 
     def test_generate_basic(self, section):
@@ -7,16 +7,38 @@ Ce module teste la transformation des données NEA vers les modèles Exoplanet e
 from datetime import datetime
 from unittest.mock import Mock, patch
 
+import pandas as pd
 import pytest
 
 from src.mappers.nasa_exoplanet_archive_mapper import (
     NasaExoplanetArchiveMapper,
+    NeaFieldPlan,
     is_invalid_raw_value,
 )
 from src.models.entities.exoplanet_entity import Exoplanet, ValueWithUncertainty
+from src.models.entities.nea_entity import NEA_TO_EXOPLANET_MAPPING, NEA_TO_STAR_MAPPING
 from src.models.entities.star_entity import Star
 from src.models.references.reference import SourceType
 
+# Cellules composites des colonnes *str de PSCompPars (exemples de
+# data/notes/correspondances_notes.md et mises en page HTML de l'archive)
+COMPOSITE_CORPUS: list[str] = [
+    "2454966.7001&plusmn0.0068",
+    "289.863876&plusmn0.000013",
+    "0.869&plusmn0.011",
+    "&lt0.1",
+    "&gt13.0",
+    '<div><span class="supersubNumber">2458326.10418</span>'
+    '<span class="superscript">+0.00055</span><span class="subscript">-0.00051</span></div>',
+    '<div><span class=supersubNumber">0.0336</span>'
+    '<span class=superscript">+0.0011</span><span class=subscript">-0.0012</span></div>',
+    '<div><span class="supersubNumber">11.9</span><span class="superscript">+1.2</span></div>',
+    '<div><span class="supersubNumber">1.05</span></div>',
+    '<div> <span class="supersubNumber"> 4.2 </span> <span class="subscript">-0.3</span> </div>',
+    '<div><span class="supersubNumber"></span><span class="superscript">+1</span></div>',
+    '<div><span class="supersubNumber">n/a</span></div>',
+]
+
 
 class TestIsInvalidRawValue:
     """Tests pour la fonction is_invalid_raw_value."""
@@ -290,6 +312,78 @@ class TestNasaExoplanetArchiveMapper:
         assert 0.3 < result.value < 0.4
 
 
+class TestCombinedRecordMapping:
+    """Tests du mapping combiné planète + étoile hôte en une passe."""
+
+    @pytest.fixture
+    def mapper(self):
+        mapper = NasaExoplanetArchiveMapper()
+        mapper.constellation_util = Mock()
+        mapper.constellation_util.get_constellation_name.return_value = "Cygne"
+        return mapper
+
+    @pytest.fixture
+    def nea_record(self):
+        return {
+            "pl_name": "Kepler-186 f",
+            "hostname": "Kepler-186",
+            "hd_name": "HD 1",
+            "tic_id": "TIC 111",
+            "rastr": "19h54m36.65s",
+            "decstr": "+43d57m03.8s",
+            "ra": 298.652708,
+            "dec": 43.951056,
+            "sy_dist": 177.6,
+            "sy_dist_err1": 2.1,
+            "sy_dist_err2": -2.0,
+            "st_spectype": "M1V",
+            "st_mass": 0.544,
+            "sy_snum": 1,
+            "pl_orbper": 129.9441,
+            "st_teff": 3788.0,
+            "disc_year": 2014,
+        }
+
+    @staticmethod
+    def _without_reference(entity):
+        from dataclasses import replace
+
+        return replace(entity, reference=None)
+
+    def test_combined_mapping_matches_separate_mapping(self, mapper, nea_record):
+        exoplanet, star = mapper.map_entities_from_nea_record(nea_record)
+
+        assert self._without_reference(exoplanet) == self._without_reference(
+            mapper.map_exoplanet_from_nea_record(nea_record)
+        )
+        assert self._without_reference(star) == self._without_reference(
+            mapper.map_star_from_nea_record(nea_record)
+        )
+        assert exoplanet.st_distance is star.st_distance
+        assert star.st_altname == ["HD 1", "TIC 111"]
+
+    def test_combined_mapping_resolves_constellation_once(self, mapper, nea_record):
+        exoplanet, star = mapper.map_entities_from_nea_record(nea_record)
+
+        mapper.constellation_util.get_constellation_name.assert_called_once_with(
+            "19/54/36.65", "+43/57/03.8"
+        )
+        assert exoplanet.sy_constellation == star.sy_constellation == "Cygne"
+
+    def test_combined_mapping_shares_reference_date(self, mapper, nea_record):
+        exoplanet, star = mapper.map_entities_from_nea_record(nea_record)
+
+        assert exoplanet.reference.update_date == star.reference.update_date
+        assert exoplanet.reference.planet_id == "Kepler-186 f"
+        assert star.reference.planet_id is None
+
+    def test_combined_mapping_can_skip_an_entity(self, mapper, nea_record):
+        exoplanet, star = mapper.map_entities_from_nea_record(nea_record, with_exoplanet=False)
+
+        assert exoplanet is None
+        assert star.st_name == "Kepler-186"
+
+
 class TestCompositeValueParsing:
     """Tests for composite formatted value parsing."""
 
@@ -410,6 +504,45 @@ class TestCompositeValueParsing:
         result = mapper.parse_composite_formatted_value("invalid text")
         assert result is None
 
+    @pytest.mark.parametrize("raw_value", COMPOSITE_CORPUS)
+    def test_regex_fast_path_matches_beautifulsoup(self, mapper, raw_value):
+        """Le parsing par regex donne le même résultat que BeautifulSoup."""
+        with patch.object(mapper, "_parse_html_value", mapper._parse_html_value_with_soup):
+            expected = mapper._parse_composite_string(raw_value)
+
+        assert mapper.is_composite_formatted_string(raw_value)
+        assert mapper.parse_composite_formatted_value(raw_value) == expected
+
+    def test_parse_html_value_unknown_layout_falls_back_to_beautifulsoup(self, mapper):
+        """Une mise en page HTML non reconnue passe par BeautifulSoup."""
+        html_value = (
+            '<div><span style="x" class="supersubNumber">7.5</span>'
+            '<span class="superscript">+0.5</span></div>'
+        )
+        with patch.object(
+            mapper, "_parse_html_value_with_soup", wraps=mapper._parse_html_value_with_soup
+        ) as soup_parser:
+            result = mapper._parse_html_value(html_value)
+
+        soup_parser.assert_called_once_with(html_value)
+        assert result == ValueWithUncertainty(value=7.5, error_positive=0.5, sign="±")
+
+    def test_parse_composite_formatted_value_is_memoized(self, mapper):
+        """Une même chaîne n'est parsée qu'une fois."""
+        with patch.object(
+            mapper, "_parse_plusmn_value", wraps=mapper._parse_plusmn_value
+        ) as plusmn_parser:
+            first = mapper.parse_composite_formatted_value("0.869&plusmn0.011")
+            second = mapper.parse_composite_formatted_value("0.869&plusmn0.011")
+
+        assert first is second
+        plusmn_parser.assert_called_once()
+
+    def test_is_composite_formatted_string_plain_values(self, mapper):
+        """Les valeurs simples ne sont pas composites."""
+        assert not mapper.is_composite_formatted_string("289.863876")
+        assert not mapper.is_composite_formatted_string("K1 V")
+
 
 class TestCoordinateFallbacks:
     """Tests for coordinate parsing when string formats unavailable."""
@@ -483,6 +616,74 @@ class TestCoordinateFallbacks:
         assert obj.sy_constellation == "Cygnus"
 
 
+class TestMappingPlan:
+    """Tests du plan de mapping compilé par schéma."""
+
+    @pytest.fixture
+    def mapper(self):
+        return NasaExoplanetArchiveMapper()
+
+    def test_plan_keeps_present_columns_and_resolves_conversions(self, mapper):
+        """Le plan ne garde que les colonnes présentes, avec leurs erreurs et conversions."""
+        columns = ("pl_name", "pl_orbper", "pl_orbper_err1", "st_lum", "sy_snum", "hostname")
+
+        plan = {p.nea_field: p for p in mapper.get_mapping_plan(columns, NEA_TO_STAR_MAPPING)}
+
+        assert set(plan) == {"st_lum", "sy_snum"}
+        assert plan["st_lum"].is_log10 and not plan["st_lum"].is_integer
+        assert plan["sy_snum"].is_integer
+        assert plan["st_lum"].err_pos_field is None
+
+        exoplanet_plan = mapper.get_mapping_plan(columns, NEA_TO_EXOPLANET_MAPPING)
+        orbper = next(p for p in exoplanet_plan if p.nea_field == "pl_orbper")
+        assert orbper == NeaFieldPlan(
+            nea_field="pl_orbper",
+            attribute="pl_orbital_period",
+            err_pos_field="pl_orbper_err1",
+        )
+
+    def test_plan_is_compiled_once_per_schema(self, mapper):
+        """Les lignes d'un même schéma réutilisent le même plan."""
+        first = {"pl_name": "Kepler-1 b", "hostname": "Kepler-1", "pl_orbper": 2.5}
+        second = {"pl_name": "Kepler-1 c", "hostname": "Kepler-1", "pl_orbper": 7.0}
+
+        plan = mapper.get_mapping_plan(tuple(first), NEA_TO_EXOPLANET_MAPPING)
+
+        assert mapper.get_mapping_plan(tuple(second), NEA_TO_EXOPLANET_MAPPING) is plan
+        assert mapper.get_mapping_plan(tuple(first), NEA_TO_STAR_MAPPING) is not plan
+
+    def test_record_plans_are_reused_for_rows_of_a_dataframe(self, mapper):
+        """Les lignes d'un DataFrame partagent l'Index des colonnes : pas de recompilation."""
+        df = pd.DataFrame({"pl_name": ["Kepler-1 b", "Kepler-1 c"], "pl_orbper": [2.5, 7.0]})
+        rows = [row for _, row in df.iterrows()]
+
+        plans = mapper.get_record_plans(rows[0].index)
+        with patch.object(mapper, "get_mapping_plan") as mock_plan:
+            assert mapper.get_record_plans(rows[1].index) is plans
+
+        mock_plan.assert_not_called()
+        assert [p.attribute for p in plans.exoplanet] == ["pl_orbital_period"]
+
+    def test_planned_mapping_reads_error_columns(self, mapper):
+        """Les erreurs résolues par le plan sont appliquées à la valeur."""
+        record = {
+            "pl_name": "Kepler-1 b",
+            "hostname": "Kepler-1",
+            "pl_orbper": 2.5,
+            "pl_orbper_err1": 0.1,
+            "pl_orbper_err2": -0.2,
+            "st_lum": float("nan"),
+        }
+
+        with patch.object(mapper.constellation_util, "get_constellation_name", return_value=None):
+            exoplanet, star = mapper.map_entities_from_nea_record(record)
+
+        assert exoplanet.pl_orbital_period == ValueWithUncertainty(
+            value=2.5, error_positive=0.1, error_negative=0.2, sign="±"
+        )
+        assert star.st_luminosity is None
+
+
 class TestSpecialFieldParsing:
     """Tests for special field parsing logic."""
 
@@ -566,3 +767,109 @@ class TestEdgeCases:
         # pl_radj maps to pl_radius and should be set with value 1.5
         assert exoplanet.pl_radius is not None
         assert exoplanet.pl_radius.value == 1.5
+
+
+class TestVectorizedDataFrameMapping:
+    """Tests du mapping vectorisé (DataFrame complet) comparé au mapping ligne par ligne."""
+
+    NEA_CSV = (
+        "pl_name,hostname,hd_name,hip_name,tic_id,rastr,decstr,ra,dec,"
+        "pl_orbper,pl_orbper_err1,pl_orbper_err2,pl_bmassj,pl_orbeccen,"
+        "st_lum,st_lum_err1,st_lum_err2,st_teff,st_teff_err1,st_teff_err2,"
+        "disc_year,sy_snum,discoverymethod,st_spectype\n"
+        "Kepler-186 f,Kepler-186,,,TIC 111,19h54m36.65s,+43d57m03.8s,298.652708,43.951056,"
+        "129.9441,0.0013,-0.0012,,0.04,-1.2,0.1,-0.1,3788,54,-54,"
+        "2014,1,Transit,M1V\n"
+        "Kepler-186 b,Kepler-186,,,TIC 111,19h54m36.65s,+43d57m03.8s,298.652708,43.951056,"
+        "3.8867907,6.2e-06,-6.2e-06,,&lt0.1,,,,3788,,,"
+        "2014,1,Transit,\n"
+        ",Orphan,HD 1,HIP 2,,12h00m00s,-12d30m45s,180.0,-12.5,"
+        "1.5,,,0.5,,,,,5000,10,-10,"
+        "2020.0,2,Radial Velocity,G2V\n"
+    )
+
+    @pytest.fixture
+    def mapper(self):
+        return NasaExoplanetArchiveMapper()
+
+    @pytest.fixture
+    def nea_dataframe(self):
+        import io
+
+        return pd.read_csv(io.StringIO(self.NEA_CSV))
+
+    @staticmethod
+    def _comparable(entity):
+        from dataclasses import replace
+
+        return repr(replace(entity, reference=None))
+
+    def test_vectorized_matches_row_by_row_mapping(self, mapper, nea_dataframe):
+        exoplanets, stars = mapper.map_entities_from_nea_dataframe(nea_dataframe)
+
+        records = [row.to_dict() for _, row in nea_dataframe.iterrows()]
+        expected_exoplanets = [
+            mapper.map_exoplanet_from_nea_record(r)
+            for r in records
+            if isinstance(r["pl_name"], str)
+        ]
+        expected_stars = [mapper.map_star_from_nea_record(r) for r in records]
+
+        assert [self._comparable(e) for e in exoplanets] == [
+            self._comparable(e) for e in expected_exoplanets
+        ]
+        assert [self._comparable(s) for s in stars] == [self._comparable(s) for s in expected_stars]
+
+    def test_vectorized_mapping_values(self, mapper, nea_dataframe):
+        exoplanets, stars = mapper.map_entities_from_nea_dataframe(nea_dataframe)
+
+        assert [e.pl_name for e in exoplanets] == ["Kepler-186 f", "Kepler-186 b"]
+        assert exoplanets[0].pl_orbital_period == ValueWithUncertainty(
+            value=129.9441, error_positive=0.0013, error_negative=0.0012, sign="±"
+        )
+        # Les exposants négatifs des erreurs ne sont plus altérés
+        assert exoplanets[1].pl_orbital_period.error_negative == pytest.approx(6.2e-06)
+        assert exoplanets[1].pl_eccentricity == ValueWithUncertainty(value=0.1, sign="<")
+        assert exoplanets[0].disc_year == 2014
+        assert exoplanets[0].sy_constellation == exoplanets[1].sy_constellation
+        assert exoplanets[0].reference.planet_id == "Kepler-186 f"
+
+        assert len(stars) == 3
+        assert 0.06 < stars[0].st_luminosity.value < 0.07
+        assert stars[2].st_altname == ["HD 1", "HIP 2"]
+        assert stars[2].sy_star_count == 2
+        assert stars[2].st_right_ascension == "12/00/00"
+        assert stars[2].reference.planet_id is None
+
+    def test_vectorized_mapping_computes_constellation_once_per_position(
+        self, mapper, nea_dataframe
+    ):
+        mapper.constellation_util = Mock()
+        mapper.constellation_util.get_constellation_names.side_effect = lambda ra, dec: (
+            ["Cygne"] * len(ra)
+        )
+
+        exoplanets, stars = mapper.map_entities_from_nea_dataframe(nea_dataframe)
+
+        # 2 positions distinctes pour 2 planètes + 3 étoiles, résolues en un seul lot
+        mapper.constellation_util.get_constellation_names.assert_called_once()
+        ra_deg, dec_deg = mapper.constellation_util.get_constellation_names.call_args.args
+        assert sorted(ra_deg) == pytest.approx([180.0, 298.6527083])
+        assert sorted(dec_deg) == pytest.approx([-12.5125, 43.9510556])
+        mapper.constellation_util.get_constellation_name.assert_not_called()
+        assert {e.sy_constellation for e in exoplanets + stars} == {"Cygne"}
+
+    def test_vectorized_mapping_restricts_stars_to_selected_rows(self, mapper, nea_dataframe):
+        exoplanets, stars = mapper.map_entities_from_nea_dataframe(nea_dataframe, star_rows=[0, 2])
+
+        assert len(exoplanets) == 2
+        assert [s.st_name for s in stars] == ["Kepler-186", "Orphan"]
+        assert stars[0].st_luminosity is not None
+        assert stars[1].st_right_ascension == "12/00/00"
+
+    def test_get_star_source_columns(self, mapper, nea_dataframe):
+        columns = mapper.get_star_source_columns(nea_dataframe.columns)
+
+        assert "st_teff_err1" in columns
+        assert "tic_id" in columns and "rastr" in columns
+        assert "pl_orbper" not in columns
@@ -7,7 +7,11 @@ from datetime import datetime
 
 import pytest
 
-from src.models.entities.exoplanet_entity import Exoplanet, ValueWithUncertainty
+from src.models.entities.exoplanet_entity import (
+    Exoplanet,
+    ValueWithUncertainty,
+    intern_value_with_uncertainty,
+)
 from src.models.references.reference import Reference, SourceType
 
 
@@ -157,3 +161,34 @@ class TestValueWithUncertainty:
         assert value != 1.5
         assert value is not None
         assert value != {"value": 1.5}
+
+    def test_entities_use_slots(self):
+        """Pas de __dict__ par instance : un attribut hors modèle est refusé."""
+        exoplanet = Exoplanet(pl_name="Test b")
+        value = ValueWithUncertainty(value=1.0)
+
+        assert not hasattr(exoplanet, "__dict__")
+        assert not hasattr(value, "__dict__")
+        with pytest.raises(AttributeError):
+            exoplanet.orbital_period = value
+
+    def test_value_with_uncertainty_nan_equality_and_hash(self):
+        """Deux valeurs NaN sont égales et de même hash."""
+        left = ValueWithUncertainty(value=float("nan"), sign="±")
+        right = ValueWithUncertainty(value=float("nan"), sign="±")
+
+        assert left == right
+        assert hash(left) == hash(right)
+        assert left != ValueWithUncertainty(value=1.0, sign="±")
+
+    def test_interned_values_are_shared(self):
+        """Les mêmes composantes donnent la même instance ; 1 et 1.0 restent distincts."""
+        first = intern_value_with_uncertainty(0.0, 0.01, 0.02, "±")
+
+        assert intern_value_with_uncertainty(0.0, 0.01, 0.02, "±") is first
+        assert intern_value_with_uncertainty(float("nan")) is intern_value_with_uncertainty(
+            float("nan")
+        )
+        assert isinstance(intern_value_with_uncertainty(1).value, int)
+        assert isinstance(intern_value_with_uncertainty(1.0).value, float)
+        assert str(intern_value_with_uncertainty(-0.0).value) == "-0.0"
@@ -5,7 +5,14 @@ Tests pour le module cli_parser.py
 
 from unittest.mock import patch
 
-from src.core.config import DEFAULT_DRAFTS_DIR, DEFAULT_OUTPUT_DIR
+import pytest
+
+from src.core.config import (
+    DEFAULT_DRAFTS_DIR,
+    DEFAULT_OUTPUT_DIR,
+    REPOSITORY_SNAPSHOT_PATH,
+    WIKIPEDIA_CACHE_PATH,
+)
 from src.orchestration.cli_parser import parse_cli_arguments
 
 
@@ -67,3 +74,29 @@ class TestCLIParser:
 
         assert "nasa_exoplanet_archive" in args.use_mock
         assert args.skip_wikipedia_check is True
+
+    @patch("sys.argv", ["main.py"])
+    def test_repository_snapshot_is_opt_in(self):
+        """Sans option, aucun instantané (pickle) n'est lu ni écrit."""
+        assert parse_cli_arguments().repository_snapshot is None
+
+    @patch("sys.argv", ["main.py", "--repository-snapshot"])
+    def test_repository_snapshot_default_path(self):
+        """L'option sans chemin utilise le chemin de la configuration."""
+        assert parse_cli_arguments().repository_snapshot == REPOSITORY_SNAPSHOT_PATH
+
+    @patch("sys.argv", ["main.py", "--chunk-size", "1000", "--collect-workers", "2"])
+    def test_chunk_size_rejects_parallel_collection(self):
+        """La lecture par blocs et la collecte parallèle sont incompatibles."""
+        with pytest.raises(SystemExit):
+            parse_cli_arguments()
+
+    @patch("sys.argv", ["main.py"])
+    def test_wikipedia_cache_is_opt_in(self):
+        """Sans option, l'existence des articles est demandée à l'API à chaque exécution."""
+        assert parse_cli_arguments().wikipedia_cache is None
+
+    @patch("sys.argv", ["main.py", "--wikipedia-cache"])
+    def test_wikipedia_cache_default_path(self):
+        """L'option sans chemin utilise le chemin de la configuration."""
+        assert parse_cli_arguments().wikipedia_cache == WIKIPEDIA_CACHE_PATH
@@ -4,6 +4,7 @@ Tests unitaires pour le module data_pipeline.
 Ce module teste les fonctions de collecte, ingestion et export de données.
 """
 
+import threading
 from datetime import datetime
 from unittest.mock import Mock, mock_open, patch
 
@@ -153,6 +154,107 @@ class TestFetchAndIngestData:
         assert mock_processor.ingest_exoplanets_from_source.call_count == 2
         assert mock_processor.ingest_stars_from_source.call_count == 1
 
+    def test_fetch_and_ingest_data_parallel_runs_collectors_concurrently(
+        self, mock_processor, sample_exoplanet
+    ):
+        """En parallèle, toutes les collectes sont en cours en même temps."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def make_collector():
+            collector = Mock()
+
+            def collect():
+                barrier.wait()  # lève BrokenBarrierError si les collectes sont séquentielles
+                return [sample_exoplanet], None
+
+            collector.collect_entities_from_source.side_effect = collect
+            return collector
+
+        collectors = {name: make_collector() for name in ("NEA", "EU", "OEC")}
+
+        fetch_and_ingest_data(collectors, mock_processor, max_workers=3)
+
+        assert mock_processor.ingest_exoplanets_from_source.call_count == 3
+
+    def test_fetch_and_ingest_data_parallel_keeps_source_order(
+        self, mock_processor, sample_exoplanet, sample_star
+    ):
+        """L'ingestion suit l'ordre des sources, même si la première termine en dernier."""
+        first_may_finish = threading.Event()
+
+        slow_collector = Mock()
+
+        def slow_collect():
+            first_may_finish.wait(timeout=5)
+            return [sample_exoplanet], [sample_star]
+
+        slow_collector.collect_entities_from_source.side_effect = slow_collect
+
+        fast_collector = Mock()
+
+        def fast_collect():
+            first_may_finish.set()
+            return [sample_exoplanet], None
+
+        fast_collector.collect_entities_from_source.side_effect = fast_collect
+
+        failing_collector = Mock()
+        failing_collector.collect_entities_from_source.side_effect = Exception("Test error")
+
+        collectors = {"NEA": slow_collector, "EU": failing_collector, "OEC": fast_collector}
+
+        fetch_and_ingest_data(collectors, mock_processor, max_workers=3)
+
+        ingested_sources = [
+            c.args[1] for c in mock_processor.ingest_exoplanets_from_source.call_args_list
+        ]
+        assert ingested_sources == ["NEA", "OEC"]
+        mock_processor.ingest_stars_from_source.assert_called_once_with([sample_star], "NEA")
+
+    def test_fetch_and_ingest_data_streaming_ingests_each_block(
+        self, mock_processor, sample_exoplanet, sample_star
+    ):
+        """En mode flux, chaque bloc est ingéré avant que le suivant ne soit lu."""
+        events = []
+
+        def ingest(exoplanets, source_name):
+            events.append(("ingest", len(exoplanets)))
+
+        mock_processor.ingest_exoplanets_from_source.side_effect = ingest
+
+        def iter_blocks():
+            events.append(("read", 1))
+            yield [sample_exoplanet], [sample_star]
+            events.append(("read", 2))
+            yield [sample_exoplanet, sample_exoplanet], []
+
+        mock_collector = Mock()
+        mock_collector.iter_entities_from_source.side_effect = iter_blocks
+
+        fetch_and_ingest_data({"NEA": mock_collector}, mock_processor, streaming=True)
+
+        assert events == [("read", 1), ("ingest", 1), ("read", 2), ("ingest", 2)]
+        mock_processor.ingest_stars_from_source.assert_called_once_with([sample_star], "NEA")
+        mock_collector.collect_entities_from_source.assert_not_called()
+
+    @patch("src.orchestration.data_pipeline.logger")
+    def test_fetch_and_ingest_data_streaming_takes_precedence_over_workers(
+        self, mock_logger, mock_processor, sample_exoplanet
+    ):
+        """Le mode flux n'est pas abandonné au profit du pool de threads."""
+        collectors = {}
+        for source_name in ("NEA", "EU"):
+            collector = Mock()
+            collector.iter_entities_from_source.return_value = iter([([sample_exoplanet], [])])
+            collectors[source_name] = collector
+
+        fetch_and_ingest_data(collectors, mock_processor, max_workers=2, streaming=True)
+
+        for collector in collectors.values():
+            collector.iter_entities_from_source.assert_called_once()
+            collector.collect_entities_from_source.assert_not_called()
+        assert "max_workers=2 ignoré" in mock_logger.warning.call_args.args[0]
+
 
 class TestExportConsolidatedData:
     """Tests pour export_consolidated_data."""
@@ -211,8 +313,8 @@ class TestGenerateAndExportStatistics:
     def mock_processor(self):
         """Fixture pour créer un processeur mocké."""
         processor = Mock()
-        processor.collect_all_exoplanets.return_value = []
-        processor.collect_all_stars.return_value = []
+        processor.view_all_exoplanets.return_value = []
+        processor.view_all_stars.return_value = []
         return processor
 
     def test_generate_and_export_statistics_without_timestamp(
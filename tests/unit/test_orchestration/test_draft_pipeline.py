@@ -57,12 +57,12 @@ class TestDraftPipeline:
         self, mock_build, mock_persist, mock_processor, sample_exoplanets
     ):
         """Test de génération et persistance de brouillons d'exoplanètes."""
-        mock_processor.collect_all_exoplanets.return_value = sample_exoplanets
+        mock_processor.view_all_exoplanets.return_value = sample_exoplanets
         mock_build.return_value = "Draft content"
 
         generate_and_persist_exoplanet_drafts(mock_processor, "drafts")
 
-        mock_processor.collect_all_exoplanets.assert_called_once()
+        mock_processor.view_all_exoplanets.assert_called_once()
         # Vérifier que build_exoplanet_article_draft est appelé avec system_planets
         call_args = mock_build.call_args
         assert call_args[0][0] == sample_exoplanets[0]  # Premier argument positionnel
@@ -75,27 +75,55 @@ class TestDraftPipeline:
         self, mock_build, mock_persist, mock_processor, sample_stars
     ):
         """Test de génération et persistance de brouillons d'étoiles."""
-        mock_processor.collect_all_stars.return_value = sample_stars
+        mock_processor.view_all_stars.return_value = sample_stars
         mock_build.return_value = "Draft content"
 
         generate_and_persist_star_drafts(mock_processor, "drafts")
 
-        mock_processor.collect_all_stars.assert_called_once()
+        mock_processor.view_all_stars.assert_called_once()
         mock_build.assert_called_once()
         mock_persist.assert_called_once()
 
+    @patch("src.orchestration.draft_pipeline.persist_drafts_by_entity_type")
+    @patch("src.orchestration.draft_pipeline.build_exoplanet_article_draft")
+    def test_exoplanet_drafts_use_repository_host_index(
+        self, mock_build, mock_persist, mock_processor, sample_exoplanets
+    ):
+        """Les planètes du système viennent de l'index hôte, sans index reconstruit."""
+        mock_processor.view_all_exoplanets.return_value = sample_exoplanets
+        mock_processor.collect_planets_for_star.return_value = sample_exoplanets
+
+        generate_and_persist_exoplanet_drafts(mock_processor, "drafts")
+
+        mock_processor.collect_planets_for_star.assert_called_once_with("Test")
+        assert mock_build.call_args.kwargs["system_planets"] == sample_exoplanets
+
+    @patch("src.orchestration.draft_pipeline.persist_drafts_by_entity_type")
+    @patch("src.orchestration.draft_pipeline.build_star_article_draft")
+    def test_star_drafts_use_repository_host_index(
+        self, mock_build, mock_persist, mock_processor, sample_stars, sample_exoplanets
+    ):
+        """Sans liste fournie, les exoplanètes d'une étoile viennent de l'index hôte."""
+        mock_processor.view_all_stars.return_value = sample_stars
+        mock_processor.collect_planets_for_star.return_value = sample_exoplanets
+
+        generate_and_persist_star_drafts(mock_processor, "drafts")
+
+        mock_processor.collect_planets_for_star.assert_called_once_with("Test")
+        assert mock_build.call_args.kwargs["exoplanets"] == sample_exoplanets
+
     @patch("src.orchestration.draft_pipeline.persist_drafts_by_entity_type")
     @patch("src.orchestration.draft_pipeline.build_star_article_draft")
     def test_generate_and_persist_star_drafts_with_exoplanets(
         self, mock_build, mock_persist, mock_processor, sample_stars, sample_exoplanets
     ):
         """Test de génération avec exoplanètes associées."""
-        mock_processor.collect_all_stars.return_value = sample_stars
+        mock_processor.view_all_stars.return_value = sample_stars
         mock_build.return_value = "Draft content"
 
         generate_and_persist_star_drafts(mock_processor, "drafts", sample_exoplanets)
 
-        mock_processor.collect_all_stars.assert_called_once()
+        mock_processor.view_all_stars.assert_called_once()
         mock_build.assert_called_once()
         # Vérifier que les exoplanètes sont passées
         call_args = mock_build.call_args
@@ -105,7 +133,7 @@ class TestDraftPipeline:
     @patch("src.orchestration.draft_pipeline.build_exoplanet_article_draft")
     def test_generate_exoplanet_drafts_empty_list(self, mock_build, mock_persist, mock_processor):
         """Test avec liste vide d'exoplanètes."""
-        mock_processor.collect_all_exoplanets.return_value = []
+        mock_processor.view_all_exoplanets.return_value = []
 
         generate_and_persist_exoplanet_drafts(mock_processor, "drafts")
 
@@ -116,7 +144,7 @@ class TestDraftPipeline:
     @patch("src.orchestration.draft_pipeline.build_star_article_draft")
     def test_generate_star_drafts_empty_list(self, mock_build, mock_persist, mock_processor):
         """Test avec liste vide d'étoiles."""
-        mock_processor.collect_all_stars.return_value = []
+        mock_processor.view_all_stars.return_value = []
 
         generate_and_persist_star_drafts(mock_processor, "drafts")
 
@@ -133,7 +161,7 @@ class TestDraftPipeline:
         # Objet qui a pl_name mais n'est pas une instance de Exoplanet
         invalid_obj = Mock(spec=[])
         invalid_obj.pl_name = "Invalid Object"
-        mock_processor.collect_all_exoplanets.return_value = [invalid_obj]
+        mock_processor.view_all_exoplanets.return_value = [invalid_obj]
 
         generate_and_persist_exoplanet_drafts(mock_processor, "drafts")
 
@@ -152,7 +180,7 @@ class TestDraftPipeline:
         # Objet qui a st_name mais n'est pas une instance de Star
         invalid_obj = Mock(spec=[])
         invalid_obj.st_name = "Invalid Star"
-        mock_processor.collect_all_stars.return_value = [invalid_obj]
+        mock_processor.view_all_stars.return_value = [invalid_obj]
 
         generate_and_persist_star_drafts(mock_processor, "drafts")
 
@@ -0,0 +1,55 @@
+"""
+Budget d'import au démarrage (python -X importtime) : le parseur CLI ne doit pas
+charger les dépendances lourdes, et le pipeline ne charge bs4, astropy et les
+collecteurs qu'à la première utilisation.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+# Budget large (µs) pour absorber les machines lentes ; l'import mesuré est ~20 ms
+MAIN_IMPORT_BUDGET_US = 300_000
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Temps cumulé (µs) de chaque module importé par `import module`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def _top_level_packages(times: dict[str, int]) -> set[str]:
+    return {name.split(".")[0] for name in times}
+
+
+class TestImportTime:
+    def test_main_import_stays_within_budget(self):
+        times = _import_times("src.core.main")
+
+        assert times["src.core.main"] < MAIN_IMPORT_BUDGET_US
+
+    @pytest.mark.parametrize("package", ["pandas", "numpy", "requests", "bs4", "astropy"])
+    def test_main_import_skips_heavy_packages(self, package):
+        assert package not in _top_level_packages(_import_times("src.core.main"))
+
+    def test_pipeline_import_defers_bs4_astropy_and_collectors(self):
+        times = _import_times("src.orchestration.pipeline_executor")
+
+        assert {"bs4", "astropy"}.isdisjoint(_top_level_packages(times))
+        assert not any(name.startswith("src.collectors.implementations") for name in times)
@@ -118,7 +118,7 @@ class TestExecutePipeline:
             ["Missing Star"],
         )
 
-        # Mock collect_all_exoplanets
+        # Mock iter_exoplanets_by_names (accès direct au référentiel par nom)
         mock_planet1 = Mock()
         mock_planet1.pl_name = "Existing Planet"
         mock_planet1.st_name = "Existing Star"
@@ -126,7 +126,10 @@ class TestExecutePipeline:
         mock_planet2.pl_name = "Missing Planet"
         mock_planet2.st_name = "Missing Star"
 
-        mock_processor.collect_all_exoplanets.return_value = [mock_planet1, mock_planet2]
+        planets = [mock_planet1, mock_planet2]
+        mock_processor.iter_exoplanets_by_names.side_effect = lambda names: [
+            p for p in planets if p.pl_name in names
+        ]
 
         # We need to patch _initialize_data_processor to return our mock_processor
         with patch(
@@ -203,8 +206,8 @@ class TestExecutePipeline:
 
         # Mock processor
         mock_processor = Mock()
-        # Mock collect_all_exoplanets to return a list (needed for star drafts generation)
-        mock_processor.collect_all_exoplanets.return_value = []
+        # Mock iter_exoplanets_by_names to return a list (needed for drafts generation)
+        mock_processor.iter_exoplanets_by_names.return_value = []
 
         with patch(
             "src.orchestration.pipeline_executor._initialize_data_processor",
@@ -259,10 +262,10 @@ class TestExecutePipeline:
 
         # Mock processor
         mock_processor = Mock()
-        # Mock collect_all_exoplanets to return a list (needed for star drafts generation)
-        mock_processor.collect_all_exoplanets.return_value = []
-        # Mock collect_all_stars to return a list (needed for star drafts generation)
-        mock_processor.collect_all_stars.return_value = []
+        # Mock iter_exoplanets_by_names to return a list (needed for drafts generation)
+        mock_processor.iter_exoplanets_by_names.return_value = []
+        # Mock view_all_stars to return a list (needed for star drafts generation)
+        mock_processor.view_all_stars.return_value = []
 
         with patch(
             "src.orchestration.pipeline_executor._initialize_data_processor",
@@ -343,11 +346,10 @@ class TestExecutePipeline:
             [],
         )
 
-        # Mock collect_all_exoplanets to return all planets
-        mock_processor.collect_all_exoplanets.return_value = [
-            mock_planet1,
-            mock_planet2,
-            mock_planet3,
+        # Mock iter_exoplanets_by_names to filter all planets by name
+        planets = [mock_planet1, mock_planet2, mock_planet3]
+        mock_processor.iter_exoplanets_by_names.side_effect = lambda names: [
+            p for p in planets if p.pl_name in names
         ]
 
         # Mock draft generation
@@ -371,8 +373,8 @@ class TestExecutePipeline:
         # Vérifier que resolve_wikipedia_status_for_exoplanets a été appelé
         mock_processor.resolve_wikipedia_status_for_exoplanets.assert_called_once()
 
-        # Vérifier que collect_all_exoplanets a été appelé
-        mock_processor.collect_all_exoplanets.assert_called_once()
+        # Vérifier que les exoplanètes ont été lues par nom (existantes puis manquantes)
+        assert mock_processor.iter_exoplanets_by_names.call_count == 2
 
         # Vérifier que build_exoplanet_article_draft a été appelé 3 fois (pour Planet A, B et C)
         # Car on génère maintenant aussi les drafts pour les articles existants
@@ -448,10 +450,10 @@ class TestExecutePipeline:
             [],
         )
 
-        # Mock collect_all_exoplanets to return all planets
-        mock_processor.collect_all_exoplanets.return_value = [
-            mock_planet1,
-            mock_planet2,
+        # Mock iter_exoplanets_by_names to filter all planets by name
+        planets = [mock_planet1, mock_planet2]
+        mock_processor.iter_exoplanets_by_names.side_effect = lambda names: [
+            p for p in planets if p.pl_name in names
         ]
 
         with patch(
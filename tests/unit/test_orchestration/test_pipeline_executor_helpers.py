@@ -1,10 +1,17 @@
 import argparse
 from unittest.mock import Mock, patch
 
+from src.models.entities.exoplanet_entity import Exoplanet
 from src.orchestration.pipeline_executor import (
+    _collect_or_restore_repositories,
     _initialize_data_processor,
+    _load_repositories_from_entity_store,
+    _save_repositories_to_entity_store,
     _setup_output_directories,
 )
+from src.services.repositories.exoplanet_repository import ExoplanetRepository
+from src.services.repositories.sqlite_entity_store import SqliteEntityStore
+from src.services.repositories.star_repository import StarRepository
 
 
 class TestPipelineExecutorHelpers:
@@ -49,5 +56,78 @@ class TestPipelineExecutorHelpers:
                 stat_service=stat_service,
                 wiki_service=wiki_service,
                 export_service=export_service,
+                entity_resolver=None,
             )
             assert result == mock_instance
+
+    @patch("src.orchestration.pipeline_executor.save_repository_snapshot")
+    @patch("src.orchestration.pipeline_executor.load_repository_snapshot", return_value=True)
+    @patch("src.orchestration.pipeline_executor.build_source_fingerprints", return_value={})
+    @patch("src.orchestration.pipeline_executor.fetch_and_ingest_data")
+    def test_snapshot_replaces_collection_when_sources_unchanged(
+        self, mock_fetch, mock_fingerprints, mock_load, mock_save
+    ):
+        args = argparse.Namespace(repository_snapshot="snapshot.pkl", rebuild_snapshot=False)
+
+        _collect_or_restore_repositories(args, {}, Mock(), None)
+
+        mock_load.assert_called_once()
+        mock_fetch.assert_not_called()
+        mock_save.assert_not_called()
+
+    @patch("src.orchestration.pipeline_executor.save_repository_snapshot")
+    @patch("src.orchestration.pipeline_executor.load_repository_snapshot")
+    @patch("src.orchestration.pipeline_executor.build_source_fingerprints", return_value={})
+    @patch("src.orchestration.pipeline_executor.fetch_and_ingest_data")
+    def test_rebuild_snapshot_forces_collection(
+        self, mock_fetch, mock_fingerprints, mock_load, mock_save
+    ):
+        args = argparse.Namespace(repository_snapshot="snapshot.pkl", rebuild_snapshot=True)
+        processor = Mock()
+
+        _collect_or_restore_repositories(args, {}, processor, None)
+
+        mock_load.assert_not_called()
+        mock_fetch.assert_called_once()
+        mock_save.assert_called_once_with(
+            "snapshot.pkl", processor.exoplanet_repository, processor.star_repository, {}
+        )
+
+    def test_entity_store_is_saved_then_reused_without_collecting(self, tmp_path):
+        db_path = str(tmp_path / "catalog.sqlite")
+        args = argparse.Namespace(entity_store=db_path, reuse_entity_store=True)
+        store = SqliteEntityStore(db_path)
+        processor = Mock(
+            exoplanet_repository=ExoplanetRepository(store=store),
+            star_repository=StarRepository(store=store),
+        )
+        assert _load_repositories_from_entity_store(args, processor) is False
+        processor.exoplanet_repository.add_exoplanets([Exoplanet(pl_name="Kepler-452 b")], "NEA")
+
+        _save_repositories_to_entity_store(args, processor)
+        processor.exoplanet_repository = ExoplanetRepository(store=store)
+
+        assert _load_repositories_from_entity_store(args, processor) is True
+        assert [e.pl_name for e in processor.exoplanet_repository.get_all_exoplanets()] == [
+            "Kepler-452 b"
+        ]
+        store.close()
+
+    def test_entity_store_is_not_reused_by_default(self):
+        args = argparse.Namespace(entity_store="catalog.sqlite")
+        processor = Mock()
+
+        assert _load_repositories_from_entity_store(args, processor) is False
+        processor.exoplanet_repository.load_from_store.assert_not_called()
+
+    @patch("src.orchestration.pipeline_executor.build_source_fingerprints")
+    @patch("src.orchestration.pipeline_executor.fetch_and_ingest_data")
+    def test_match_table_is_saved_with_post_collection_fingerprints(
+        self, mock_fetch, mock_fingerprints
+    ):
+        args = argparse.Namespace(repository_snapshot=None)
+        entity_resolver = Mock()
+
+        _collect_or_restore_repositories(args, {}, Mock(), entity_resolver)
+
+        entity_resolver.save_match_table.assert_called_once_with(mock_fingerprints.return_value)
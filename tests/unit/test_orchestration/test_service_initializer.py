@@ -85,7 +85,16 @@ class TestServiceInitializer:
 
         assert "nasa_exoplanet_archive" in collectors
         assert collectors["nasa_exoplanet_archive"] == mock_collector
-        mock_get_instance.assert_called_with("nasa_exoplanet_archive", False, ANY)
+        mock_get_instance.assert_called_with(
+            "nasa_exoplanet_archive",
+            False,
+            ANY,
+            compress_cache=False,
+            revalidate_cache=False,
+            cache_max_age=24 * 3600,
+            incremental_fetch=False,
+            chunk_size=None,
+        )
 
     def test_get_collector_instance_nasa(self):
         """Test la factory pour NASA."""
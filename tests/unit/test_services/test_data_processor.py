@@ -131,7 +131,7 @@ class TestDataProcessor:
         self, data_processor, mock_repositories_and_services, sample_exoplanet
     ):
         """Test de calcul des statistiques d'exoplanètes."""
-        mock_repositories_and_services["exoplanet_repo"].get_all_exoplanets.return_value = [
+        mock_repositories_and_services["exoplanet_repo"].exoplanets_view.return_value = [
             sample_exoplanet
         ]
         mock_repositories_and_services[
@@ -149,7 +149,7 @@ class TestDataProcessor:
         self, data_processor, mock_repositories_and_services, sample_star
     ):
         """Test de calcul des statistiques d'étoiles."""
-        mock_repositories_and_services["star_repo"].get_all_stars.return_value = [sample_star]
+        mock_repositories_and_services["star_repo"].stars_view.return_value = [sample_star]
         mock_repositories_and_services["stat_service"].generate_statistics_star.return_value = {
             "total_stars": 1
         }
@@ -169,10 +169,10 @@ class TestDataProcessor:
         sample_star,
     ):
         """Test de génération de toutes les statistiques."""
-        mock_repositories_and_services["exoplanet_repo"].get_all_exoplanets.return_value = [
+        mock_repositories_and_services["exoplanet_repo"].exoplanets_view.return_value = [
             sample_exoplanet
         ]
-        mock_repositories_and_services["star_repo"].get_all_stars.return_value = [sample_star]
+        mock_repositories_and_services["star_repo"].stars_view.return_value = [sample_star]
         mock_repositories_and_services[
             "stat_service"
         ].generate_statistics_exoplanet.return_value = {"total": 1}
@@ -191,7 +191,7 @@ class TestDataProcessor:
         self, data_processor, mock_repositories_and_services, sample_exoplanet
     ):
         """Test de récupération des articles Wikipedia."""
-        mock_repositories_and_services["exoplanet_repo"].get_all_exoplanets.return_value = [
+        mock_repositories_and_services["exoplanet_repo"].exoplanets_view.return_value = [
             sample_exoplanet
         ]
         mock_repositories_and_services[
@@ -209,7 +209,7 @@ class TestDataProcessor:
         self, data_processor, mock_repositories_and_services
     ):
         """Test de récupération avec aucune exoplanète."""
-        mock_repositories_and_services["exoplanet_repo"].get_all_exoplanets.return_value = []
+        mock_repositories_and_services["exoplanet_repo"].exoplanets_view.return_value = []
 
         result = data_processor.fetch_wikipedia_articles_for_exoplanets()
 
@@ -219,7 +219,7 @@ class TestDataProcessor:
         self, data_processor, mock_repositories_and_services, sample_exoplanet
     ):
         """Test de résolution du statut Wikipedia."""
-        mock_repositories_and_services["exoplanet_repo"].get_all_exoplanets.return_value = [
+        mock_repositories_and_services["exoplanet_repo"].exoplanets_view.return_value = [
             sample_exoplanet
         ]
         mock_repositories_and_services[
@@ -248,7 +248,7 @@ class TestDataProcessor:
         self, data_processor, mock_repositories_and_services
     ):
         """Test de résolution avec aucun article."""
-        mock_repositories_and_services["exoplanet_repo"].get_all_exoplanets.return_value = []
+        mock_repositories_and_services["exoplanet_repo"].exoplanets_view.return_value = []
 
         existing, missing = data_processor.resolve_wikipedia_status_for_exoplanets()
 
@@ -259,7 +259,7 @@ class TestDataProcessor:
         self, data_processor, mock_repositories_and_services, sample_exoplanet
     ):
         """Test d'export CSV."""
-        mock_repositories_and_services["exoplanet_repo"].get_all_exoplanets.return_value = [
+        mock_repositories_and_services["exoplanet_repo"].exoplanets_view.return_value = [
             sample_exoplanet
         ]
 
@@ -273,7 +273,7 @@ class TestDataProcessor:
         self, data_processor, mock_repositories_and_services, sample_exoplanet
     ):
         """Test d'export JSON."""
-        mock_repositories_and_services["exoplanet_repo"].get_all_exoplanets.return_value = [
+        mock_repositories_and_services["exoplanet_repo"].exoplanets_view.return_value = [
             sample_exoplanet
         ]
 
@@ -287,7 +287,7 @@ class TestDataProcessor:
         self, data_processor, mock_repositories_and_services, sample_exoplanet
     ):
         """Test d'export avec format invalide."""
-        mock_repositories_and_services["exoplanet_repo"].get_all_exoplanets.return_value = [
+        mock_repositories_and_services["exoplanet_repo"].exoplanets_view.return_value = [
             sample_exoplanet
         ]
 
@@ -298,7 +298,7 @@ class TestDataProcessor:
         self, data_processor, mock_repositories_and_services, sample_exoplanet
     ):
         """Test d'export des liens Wikipedia."""
-        mock_repositories_and_services["exoplanet_repo"].get_all_exoplanets.return_value = [
+        mock_repositories_and_services["exoplanet_repo"].exoplanets_view.return_value = [
             sample_exoplanet
         ]
         mock_repositories_and_services[
@@ -321,7 +321,7 @@ class TestDataProcessor:
         self, data_processor, mock_repositories_and_services
     ):
         """Test d'export avec repo vide."""
-        mock_repositories_and_services["exoplanet_repo"].get_all_exoplanets.return_value = []
+        mock_repositories_and_services["exoplanet_repo"].exoplanets_view.return_value = []
 
         wiki_data = {"Test b": {}}
         data_processor.export_exoplanet_wikipedia_links_by_status(
@@ -336,7 +336,7 @@ class TestDataProcessor:
         self, data_processor, mock_repositories_and_services, sample_exoplanet
     ):
         """Test d'export avec données vides."""
-        mock_repositories_and_services["exoplanet_repo"].get_all_exoplanets.return_value = [
+        mock_repositories_and_services["exoplanet_repo"].exoplanets_view.return_value = [
             sample_exoplanet
         ]
 
@@ -350,7 +350,7 @@ class TestDataProcessor:
         self, data_processor, mock_repositories_and_services, sample_exoplanet
     ):
         """Test d'export avec données formatées vides."""
-        mock_repositories_and_services["exoplanet_repo"].get_all_exoplanets.return_value = [
+        mock_repositories_and_services["exoplanet_repo"].exoplanets_view.return_value = [
             sample_exoplanet
         ]
         mock_repositories_and_services[
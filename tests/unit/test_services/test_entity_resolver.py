@@ -0,0 +1,184 @@
+# tests/unit/test_services/test_entity_resolver.py
+"""
+Tests pour la résolution inter-catalogues des exoplanètes (EntityResolver).
+"""
+
+from datetime import datetime
+
+from src.models.entities.exoplanet_entity import Exoplanet, ValueWithUncertainty
+from src.models.references.reference import Reference, SourceType
+from src.services.processors.entity_resolver import EntityResolver, _catalog_key
+from src.services.repositories.exoplanet_repository import ExoplanetRepository
+
+# Empreintes des catalogues sources, au format de build_source_fingerprints
+_FINGERPRINTS = {"sources": {"NEA": {"sha256": "abc", "size": 10}}, "settings": {}}
+
+
+def _planet(
+    name: str,
+    host: str,
+    source: SourceType,
+    period: float | None = None,
+    position: tuple[str, str] | None = None,
+) -> Exoplanet:
+    planet = Exoplanet(
+        pl_name=name,
+        st_name=host,
+        reference=Reference(
+            source=source,
+            update_date=datetime(2025, 1, 1),
+            consultation_date=datetime(2025, 1, 15),
+        ),
+    )
+    if period is not None:
+        planet.pl_orbital_period = ValueWithUncertainty(value=period)
+    if position is not None:
+        planet.st_right_ascension, planet.st_declination = position
+    return planet
+
+
+class TestEntityResolver:
+    """Tests de la résolution par blocs et de la table de correspondance."""
+
+    def test_same_host_and_period_resolves_koi_designation(self):
+        resolver = EntityResolver()
+        resolver.resolve_exoplanet(_planet("Kepler-452 b", "Kepler-452", SourceType.NEA, 384.843))
+
+        koi = resolver.resolve_exoplanet(
+            _planet("KOI-7016.01", "Kepler-452", SourceType.EPE, 384.84)
+        )
+
+        assert koi.pl_altname == ["Kepler-452 b"]
+
+    def test_sky_position_and_period_resolve_different_host_names(self):
+        resolver = EntityResolver()
+        position = ("19/44/00.89", "+44/16/39.2")
+        resolver.resolve_exoplanet(
+            _planet("Kepler-452 b", "Kepler-452", SourceType.NEA, 384.843, position)
+        )
+
+        koi = resolver.resolve_exoplanet(
+            _planet("KOI-7016.01", "KOI-7016", SourceType.OEC, 384.84, (296.0037, 44.2776))
+        )
+
+        assert koi.pl_altname == ["Kepler-452 b"]
+
+    def test_spelling_variant_resolves_without_scoring(self):
+        resolver = EntityResolver()
+        resolver.resolve_exoplanet(_planet("Kepler-452 b", "Kepler-452", SourceType.NEA))
+
+        variant = resolver.resolve_exoplanet(_planet("Kepler-452b", "Kepler 452", SourceType.EPE))
+
+        assert variant.pl_altname == []
+        assert resolver.comparisons == 0
+
+    def test_period_mismatch_vetoes_same_host_candidate(self):
+        resolver = EntityResolver()
+        resolver.resolve_exoplanet(_planet("Kepler-20 b", "Kepler-20", SourceType.NEA, 3.696))
+
+        other = resolver.resolve_exoplanet(
+            _planet("KOI-70.02", "Kepler-20", SourceType.EPE, 10.854)
+        )
+
+        assert other.pl_altname == []
+
+    def test_planets_of_a_same_source_are_never_scored_together(self):
+        resolver = EntityResolver()
+        resolver.resolve_exoplanet(_planet("Kepler-20 b", "Kepler-20", SourceType.NEA, 3.696))
+
+        sibling = resolver.resolve_exoplanet(
+            _planet("Kepler-20 b2", "Kepler-20", SourceType.NEA, 3.696)
+        )
+
+        assert sibling.pl_altname == []
+        assert resolver.comparisons == 0
+
+    def test_blocking_limits_compared_pairs(self):
+        resolver = EntityResolver()
+        for i in range(500):
+            resolver.resolve_exoplanet(
+                _planet(f"HAT-P-{i} b", f"HAT-P-{i}", SourceType.NEA, 1.0 + i)
+            )
+
+        resolver.resolve_exoplanet(_planet("Planet X b", "HAT-P-42", SourceType.EPE, 43.0))
+
+        assert resolver.comparisons == 1
+
+    def test_catalog_key_uses_the_number_after_the_prefix(self):
+        assert _catalog_key("K2-18 b") == ("k2", 18)
+        assert _catalog_key("K2-3 d") == ("k2", 3)
+        assert _catalog_key("2MASS J1207-3932 b") == ("2mass", 1207)
+        assert _catalog_key("KOI-7016.01") == ("koi", 7016)
+        assert _catalog_key("Proxima Centauri b") is None
+
+    def test_k2_planets_are_not_blocked_together(self):
+        resolver = EntityResolver()
+        for i in range(1, 200):
+            resolver.resolve_exoplanet(_planet(f"K2-{i} b", f"K2-{i}", SourceType.NEA, 1.0 + i))
+
+        resolver.resolve_exoplanet(_planet("K2-18 c", "EPIC 201912552", SourceType.EPE, 8.96))
+
+        assert resolver.comparisons == 1
+
+    @staticmethod
+    def _run_and_save(table_path: str, fingerprints: dict | None) -> EntityResolver:
+        resolver = EntityResolver(table_path)
+        list(
+            resolver.resolve_exoplanets(
+                [
+                    _planet("Kepler-452 b", "Kepler-452", SourceType.NEA, 384.843),
+                    _planet("KOI-7016.01", "Kepler-452", SourceType.EPE, 384.84),
+                ]
+            )
+        )
+        resolver.save_match_table(fingerprints)
+        return resolver
+
+    def test_match_table_is_reused_by_later_runs(self, tmp_path):
+        table_path = str(tmp_path / "matches.json")
+        first_run = self._run_and_save(table_path, _FINGERPRINTS)
+
+        second_run = EntityResolver(table_path, source_fingerprints=_FINGERPRINTS)
+        koi = second_run.resolve_exoplanet(
+            _planet("KOI-7016.01", "Kepler-452", SourceType.EPE, 384.84)
+        )
+
+        assert koi.pl_altname == ["Kepler-452 b"]
+        assert second_run.comparisons == 0
+        assert second_run.match_table == first_run.match_table
+
+    def test_match_table_is_rebuilt_when_source_catalogs_change(self, tmp_path):
+        table_path = str(tmp_path / "matches.json")
+        self._run_and_save(table_path, _FINGERPRINTS)
+        updated = {"sources": {"NEA": {"sha256": "def"}}, "settings": {}}
+
+        assert EntityResolver(table_path, source_fingerprints=updated).match_table == {}
+        assert EntityResolver(table_path, source_fingerprints=None).match_table == {}
+
+    def test_match_table_is_not_saved_without_fingerprints(self, tmp_path):
+        table_path = tmp_path / "matches.json"
+
+        self._run_and_save(str(table_path), None)
+
+        assert not table_path.exists()
+
+    def test_resolved_planets_are_merged_by_the_repository(self):
+        resolver = EntityResolver()
+        repo = ExoplanetRepository()
+        repo.add_exoplanets(
+            resolver.resolve_exoplanets(
+                [_planet("Kepler-452 b", "Kepler-452", SourceType.NEA, 384.843)]
+            ),
+            "NEA",
+        )
+        repo.add_exoplanets(
+            resolver.resolve_exoplanets(
+                [_planet("KOI-7016.01", "Kepler-452", SourceType.EPE, 384.84)]
+            ),
+            "EPE",
+        )
+
+        planets = repo.get_all_exoplanets()
+        assert len(planets) == 1
+        assert planets[0].pl_name == "Kepler-452 b"
+        assert planets[0].pl_altname == ["KOI-7016.01"]
@@ -3,10 +3,23 @@
 Tests pour les repositories (ExoplanetRepository, StarRepository).
 """
 
+from datetime import datetime
+from unittest.mock import patch
+
+from src.models.entities.exoplanet_entity import Exoplanet, ValueWithUncertainty
+from src.models.entities.star_entity import Star
+from src.models.references.reference import Reference, SourceType
+from src.services.repositories.entity_merge import normalize_designation
 from src.services.repositories.exoplanet_repository import ExoplanetRepository
 from src.services.repositories.star_repository import StarRepository
 
 
+def _reference(source: SourceType) -> Reference:
+    return Reference(
+        source=source, update_date=datetime(2025, 1, 1), consultation_date=datetime(2025, 1, 15)
+    )
+
+
 class TestExoplanetRepository:
     """Tests du repository d'exoplanètes."""
 
@@ -60,6 +73,158 @@ class TestExoplanetRepository:
         exoplanets = repo.get_all_exoplanets()
         assert len(exoplanets) == 2
 
+    def test_add_exoplanets_from_generator(self, sample_exoplanet):
+        """Test d'ajout depuis un générateur (ingestion en flux)."""
+        repo = ExoplanetRepository()
+
+        repo.add_exoplanets((exo for exo in [sample_exoplanet]), "test_source")
+
+        assert [e.pl_name for e in repo.get_all_exoplanets()] == ["HD 209458 b"]
+
+    def test_merge_fills_missing_fields_and_keeps_priority_values(self, sample_exoplanet):
+        """Une désignation proche fusionne : champs vides complétés, NEA prioritaire."""
+        repo = ExoplanetRepository()
+        repo.add_exoplanets([sample_exoplanet], "nasa_exoplanet_archive")
+
+        eu_planet = Exoplanet(
+            pl_name="HD209458-b",
+            pl_mass=ValueWithUncertainty(value=0.71),
+            pl_eccentricity=ValueWithUncertainty(value=0.01),
+            reference=_reference(SourceType.EPE),
+        )
+        repo.add_exoplanets([eu_planet], "exoplanet_eu")
+
+        [merged] = repo.get_all_exoplanets()
+        assert merged.pl_name == "HD 209458 b"
+        assert merged.pl_mass.value == 0.69
+        assert merged.pl_eccentricity.value == 0.01
+        # Même désignation une fois normalisée : pas d'alias ajouté
+        assert merged.pl_altname == []
+        assert merged.reference.source == SourceType.NEA
+        assert repo.find_exoplanet("hd 209458 B") is merged
+
+    def test_merge_higher_priority_source_overrides_fields(self):
+        """Une source prioritaire remplace les valeurs, même ajoutée en second."""
+        repo = ExoplanetRepository()
+        oec_planet = Exoplanet(
+            pl_name="Kepler-7 b",
+            pl_radius=ValueWithUncertainty(value=1.6),
+            reference=_reference(SourceType.OEC),
+        )
+        nea_planet = Exoplanet(
+            pl_name="Kepler-7 b",
+            pl_radius=ValueWithUncertainty(value=1.48),
+            reference=_reference(SourceType.NEA),
+        )
+
+        repo.add_exoplanets([oec_planet], "open_exoplanet")
+        repo.add_exoplanets([nea_planet], "nasa_exoplanet_archive")
+
+        [merged] = repo.get_all_exoplanets()
+        assert merged.pl_radius.value == 1.48
+        assert merged.reference.source == SourceType.NEA
+
+    def test_merge_honours_field_source_priority(self):
+        """FIELD_SOURCE_PRIORITY redéfinit la priorité pour un champ."""
+        repo = ExoplanetRepository()
+        nea_planet = Exoplanet(
+            pl_name="Kepler-7 b",
+            pl_mass=ValueWithUncertainty(value=0.43),
+            pl_radius=ValueWithUncertainty(value=1.48),
+            reference=_reference(SourceType.NEA),
+        )
+        eu_planet = Exoplanet(
+            pl_name="Kepler-7 b",
+            pl_mass=ValueWithUncertainty(value=0.44),
+            pl_radius=ValueWithUncertainty(value=1.6),
+            reference=_reference(SourceType.EPE),
+        )
+
+        with patch.dict(
+            "src.services.repositories.entity_merge.FIELD_SOURCE_PRIORITY",
+            {"pl_mass": ("EPE", "NEA", "OEC")},
+        ):
+            repo.add_exoplanets([nea_planet], "nasa_exoplanet_archive")
+            repo.add_exoplanets([eu_planet], "exoplanet_eu")
+
+        [merged] = repo.get_all_exoplanets()
+        assert merged.pl_mass.value == 0.44
+        assert merged.pl_radius.value == 1.48
+
+    def test_match_by_host_identifier_and_letter(self):
+        """Un identifiant de l'hôte suivi de la lettre retrouve la planète."""
+        repo = ExoplanetRepository()
+        nea_planet = Exoplanet(
+            pl_name="Osiris b", hd_name="HD 209458", reference=_reference(SourceType.NEA)
+        )
+        repo.add_exoplanets([nea_planet], "nasa_exoplanet_archive")
+        repo.add_exoplanets(
+            [Exoplanet(pl_name="HD 209458 b", reference=_reference(SourceType.EPE))],
+            "exoplanet_eu",
+        )
+        repo.add_exoplanets(
+            [Exoplanet(pl_name="HD 209458 c", reference=_reference(SourceType.EPE))],
+            "exoplanet_eu",
+        )
+
+        assert sorted(repo.exoplanets) == ["HD 209458 c", "Osiris b"]
+
+    def test_designations_differing_only_by_a_number_boundary_are_not_merged(self):
+        """KOI-10.01 et KOI-1001 sont deux objets distincts : pas de fusion."""
+        repo = ExoplanetRepository()
+        repo.add_exoplanets(
+            [Exoplanet(pl_name="KOI-10.01", reference=_reference(SourceType.NEA))],
+            "nasa_exoplanet_archive",
+        )
+        repo.add_exoplanets(
+            [Exoplanet(pl_name="KOI-1001", reference=_reference(SourceType.EPE))],
+            "exoplanet_eu",
+        )
+
+        assert sorted(repo.exoplanets) == ["KOI-10.01", "KOI-1001"]
+
+    def test_host_star_index_is_maintained_on_add(self):
+        """L'index par étoile hôte suit les ajouts ; une fusion n'ajoute pas de doublon."""
+        repo = ExoplanetRepository()
+        repo.add_exoplanets(
+            [
+                Exoplanet(pl_name="TRAPPIST-1 b", st_name="TRAPPIST-1"),
+                Exoplanet(pl_name="Kepler-452 b", st_name="Kepler-452"),
+                Exoplanet(pl_name="TRAPPIST-1 c", st_name="TRAPPIST-1"),
+            ],
+            "nasa_exoplanet_archive",
+        )
+        repo.add_exoplanets(
+            [Exoplanet(pl_name="TRAPPIST-1b", st_name="TRAPPIST-1")], "exoplanet_eu"
+        )
+
+        assert [p.pl_name for p in repo.get_planets_for_star("TRAPPIST-1")] == [
+            "TRAPPIST-1 b",
+            "TRAPPIST-1 c",
+        ]
+        assert repo.get_planets_for_star("Unknown") == []
+        assert [(star, len(planets)) for star, planets in repo.iter_systems()] == [
+            ("TRAPPIST-1", 2),
+            ("Kepler-452", 1),
+        ]
+
+    def test_views_and_lookup_by_names_do_not_copy(self):
+        """Vue et parcours sans copie ; la lecture par noms suit l'ordre demandé."""
+        repo = ExoplanetRepository()
+        repo.add_exoplanets(
+            [Exoplanet(pl_name="TRAPPIST-1 b"), Exoplanet(pl_name="Kepler-452 b")], "NEA"
+        )
+
+        view = repo.exoplanets_view()
+        repo.add_exoplanets([Exoplanet(pl_name="TOI-700 d")], "NEA")
+
+        assert len(view) == 3
+        assert list(repo.iter_exoplanets()) == list(view)
+        assert [
+            p.pl_name
+            for p in repo.iter_exoplanets_by_names(["TOI-700 d", "Unknown", "TRAPPIST-1 b"])
+        ] == ["TOI-700 d", "TRAPPIST-1 b"]
+
 
 class TestStarRepository:
     """Tests du repository d'étoiles."""
@@ -109,3 +274,56 @@ class TestStarRepository:
 
         stars = repo.get_all_stars()
         assert len(stars) == 2
+
+    def test_merge_star_by_alias(self, sample_star):
+        """Une étoile connue sous un alias (HD, HIP, TIC) est fusionnée."""
+        repo = StarRepository()
+        nea_star = Star(
+            st_name="Osiris", st_altname=["HD 209458"], reference=_reference(SourceType.NEA)
+        )
+        eu_star = Star(
+            st_name="HD 209458",
+            st_spectral_type="G0V",
+            st_altname=["HIP 108859"],
+            reference=_reference(SourceType.EPE),
+        )
+
+        repo.add_stars([nea_star], "nasa_exoplanet_archive")
+        repo.add_stars([eu_star], "exoplanet_eu")
+
+        [merged] = repo.get_all_stars()
+        assert merged.st_name == "Osiris"
+        assert merged.st_spectral_type == "G0V"
+        assert merged.st_altname == ["HD 209458", "HIP 108859"]
+        assert repo.find_star("hip108859") is merged
+
+    def test_views_and_lookup_by_names(self, sample_star):
+        """Vue sans copie et lecture des étoiles par noms (inconnus ignorés)."""
+        repo = StarRepository()
+        repo.add_stars([sample_star, Star(st_name="Kepler-1")], "test_source")
+
+        assert len(repo.stars_view()) == 2
+        assert list(repo.iter_stars()) == repo.get_all_stars()
+        assert [s.st_name for s in repo.iter_stars_by_names(["Kepler-1", "Unknown"])] == [
+            "Kepler-1"
+        ]
+
+
+def test_normalize_designation_keeps_boundaries_between_numbers():
+    """Deux nombres séparés ne se confondent pas avec leur concaténation."""
+    assert normalize_designation("KOI-10.01") != normalize_designation("KOI-1001")
+    assert normalize_designation("GJ 3 4 b") != normalize_designation("GJ 34 b")
+    assert normalize_designation("2MASS J1234-5678 b") != normalize_designation("2MASS J12345678 b")
+
+
+def test_normalize_designation_ignores_case_and_separators():
+    """Casse, espaces, tirets, points et soulignés sont ignorés ; le signe + est gardé."""
+    assert normalize_designation("Kepler-1 b") == normalize_designation("KEPLER 1b")
+    assert normalize_designation("2MASS J0103+1935 b") != normalize_designation(
+        "2MASS J0103-1935 b"
+    )
+    assert normalize_designation("τ Boo b") != normalize_designation("υ Boo b")
+    assert normalize_designation("KOI-10.01") == normalize_designation("KOI 10 01")
+    assert normalize_designation(" ") is None
+    assert normalize_designation("-Kepler-1 b.") == normalize_designation("Kepler-1 b")
+    assert normalize_designation(float("nan")) is None
@@ -0,0 +1,91 @@
+# tests/unit/test_services/test_repository_snapshot.py
+"""
+Tests pour l'instantané des référentiels consolidés (repository_snapshot).
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.models.entities.exoplanet_entity import Exoplanet, ValueWithUncertainty
+from src.models.entities.star_entity import Star
+from src.services.repositories.exoplanet_repository import ExoplanetRepository
+from src.services.repositories.repository_snapshot import (
+    build_source_fingerprints,
+    load_repository_snapshot,
+    save_repository_snapshot,
+)
+from src.services.repositories.star_repository import StarRepository
+
+FINGERPRINTS = {"sources": {"nasa_exoplanet_archive": {"sha256": "abc"}}, "settings": {}}
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    exoplanet_repo = ExoplanetRepository()
+    exoplanet_repo.add_exoplanets(
+        [
+            Exoplanet(
+                pl_name="Kepler-452 b",
+                st_name="Kepler-452",
+                pl_altname=["KOI-7016.01"],
+                pl_orbital_period=ValueWithUncertainty(384.843, 0.007, 0.012, "±"),
+            )
+        ],
+        "NEA",
+    )
+    star_repo = StarRepository()
+    star_repo.add_stars([Star(st_name="Kepler-452", st_altname=["KOI-7016"])], "NEA")
+
+    path = str(tmp_path / "snapshot.pkl")
+    save_repository_snapshot(path, exoplanet_repo, star_repo, FINGERPRINTS)
+    return path
+
+
+class TestRepositorySnapshot:
+    def test_restores_entities_and_indexes(self, snapshot_path):
+        exoplanet_repo, star_repo = ExoplanetRepository(), StarRepository()
+
+        assert load_repository_snapshot(snapshot_path, exoplanet_repo, star_repo, FINGERPRINTS)
+
+        planet = exoplanet_repo.find_exoplanet("KOI-7016.01")
+        assert planet.pl_orbital_period == ValueWithUncertainty(384.843, 0.007, 0.012, "±")
+        assert exoplanet_repo.get_planets_for_star("Kepler-452") == [planet]
+        assert star_repo.find_star("KOI 7016").st_name == "Kepler-452"
+
+    def test_changed_sources_are_not_restored(self, snapshot_path):
+        exoplanet_repo, star_repo = ExoplanetRepository(), StarRepository()
+        changed = {"sources": {"nasa_exoplanet_archive": {"sha256": "def"}}, "settings": {}}
+
+        assert not load_repository_snapshot(snapshot_path, exoplanet_repo, star_repo, changed)
+        assert exoplanet_repo.get_all_exoplanets() == []
+
+    def test_changed_entity_schema_is_not_restored(self, snapshot_path, monkeypatch):
+        monkeypatch.setattr(
+            "src.services.repositories.repository_snapshot.compute_entity_schema_hash",
+            lambda: "other",
+        )
+
+        assert not load_repository_snapshot(
+            snapshot_path, ExoplanetRepository(), StarRepository(), FINGERPRINTS
+        )
+
+    def test_missing_or_corrupt_snapshot_is_ignored(self, tmp_path):
+        corrupt = tmp_path / "corrupt.pkl"
+        corrupt.write_bytes(b"not a pickle")
+
+        for path in (str(tmp_path / "missing.pkl"), str(corrupt)):
+            assert not load_repository_snapshot(
+                path, ExoplanetRepository(), StarRepository(), FINGERPRINTS
+            )
+
+    def test_fingerprints_require_every_source_cache(self):
+        cached, missing = Mock(), Mock()
+        cached.get_cache_fingerprint.return_value = {"sha256": "abc"}
+        missing.get_cache_fingerprint.return_value = None
+
+        assert build_source_fingerprints({"nea": cached}, resolve_entities=True) == {
+            "sources": {"nea": {"sha256": "abc"}},
+            "settings": {"resolve_entities": True},
+        }
+        assert build_source_fingerprints({"nea": cached, "eu": missing}) is None
@@ -0,0 +1,221 @@
+# tests/unit/test_services/test_sqlite_entity_store.py
+"""
+Tests pour le stockage SQLite des entités consolidées (SqliteEntityStore).
+"""
+
+import sqlite3
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.models.entities.exoplanet_entity import Exoplanet, ValueWithUncertainty
+from src.models.entities.star_entity import Star
+from src.models.references.reference import Reference, SourceType
+from src.services.repositories.exoplanet_repository import ExoplanetRepository
+from src.services.repositories.sqlite_entity_store import SqliteEntityStore
+from src.services.repositories.star_repository import StarRepository
+
+
+def _reference(source: SourceType) -> Reference:
+    return Reference(
+        source=source,
+        update_date=datetime(2025, 1, 1),
+        consultation_date=datetime(2025, 1, 15),
+        star_id="Kepler-452",
+        planet_id="Kepler-452 b",
+    )
+
+
+def _exoplanet(name: str = "Kepler-452 b", source: SourceType = SourceType.NEA) -> Exoplanet:
+    return Exoplanet(
+        pl_name=name,
+        st_name="Kepler-452",
+        pl_altname=["KOI-7016.01"],
+        disc_year=np.int64(2015),
+        disc_method="Transit",
+        disc_facility="Kepler",
+        pl_orbital_period=ValueWithUncertainty(384.843, 0.007, -0.012, "±"),
+        reference=_reference(source),
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    entity_store = SqliteEntityStore(str(tmp_path / "catalog.sqlite"))
+    yield entity_store
+    entity_store.close()
+
+
+class TestSqliteEntityStore:
+    def test_exoplanet_round_trip(self, store):
+        exoplanet = _exoplanet()
+
+        store.upsert_exoplanets([exoplanet])
+        [loaded] = store.load_exoplanets()
+
+        assert loaded == exoplanet
+        assert loaded.pl_orbital_period == ValueWithUncertainty(384.843, 0.007, -0.012, "±")
+
+    def test_unknown_stored_attributes_are_ignored(self, store):
+        store.upsert_exoplanets([_exoplanet()])
+        store._connection.execute(
+            "UPDATE exoplanets SET data = json_set(data, '$.orbital_period', 1.0)"
+        )
+
+        [loaded] = store.load_exoplanets()
+
+        assert loaded.pl_name == "Kepler-452 b"
+
+    def test_star_round_trip(self, store):
+        star = Star(
+            st_name="Kepler-452", st_altname=["KOI-7016"], reference=_reference(SourceType.NEA)
+        )
+
+        store.upsert_stars([star])
+
+        assert store.load_stars() == [star]
+
+    def test_upsert_replaces_existing_row(self, store):
+        store.upsert_exoplanets([_exoplanet()])
+        updated = _exoplanet()
+        updated.disc_facility = "Kepler Space Telescope"
+
+        store.upsert_exoplanets([updated])
+
+        assert store.count_exoplanets() == 1
+        assert store.load_exoplanets()[0].disc_facility == "Kepler Space Telescope"
+
+    def test_query_exoplanets_by_indexed_columns(self, store):
+        other = _exoplanet("TOI-700 d")
+        other.st_name, other.disc_method = "TOI-700", "Transit"
+        store.upsert_exoplanets([_exoplanet(), other])
+
+        assert [e.pl_name for e in store.query_exoplanets(host_star="Kepler-452")] == [
+            "Kepler-452 b"
+        ]
+        assert len(store.query_exoplanets(disc_method="Transit", disc_year=2015)) == 2
+        with pytest.raises(ValueError, match="Critères inconnus"):
+            store.query_exoplanets(pl_mass=1)
+
+    def test_schema_has_lookup_indexes(self, store):
+        indexes = {
+            row[0]
+            for row in sqlite3.connect(store.db_path).execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+
+        assert {
+            "idx_exoplanets_host_star",
+            "idx_exoplanets_disc_year",
+            "idx_exoplanets_disc_method",
+            "idx_exoplanets_disc_facility",
+        } <= indexes
+
+    def test_outdated_schema_is_rebuilt(self, tmp_path):
+        db_path = str(tmp_path / "old.sqlite")
+        with sqlite3.connect(db_path) as connection:
+            connection.execute("CREATE TABLE exoplanets (name TEXT)")
+            connection.execute("PRAGMA user_version = 99")
+
+        store = SqliteEntityStore(db_path)
+        store.upsert_exoplanets([_exoplanet()])
+
+        assert store.count_exoplanets() == 1
+        store.close()
+
+
+class TestRepositoriesWithStore:
+    def test_saved_catalog_is_reloaded_without_collecting(self, tmp_path):
+        db_path = str(tmp_path / "catalog.sqlite")
+        first_store = SqliteEntityStore(db_path)
+        exoplanet_repo = ExoplanetRepository(store=first_store)
+        exoplanet_repo.add_exoplanets([_exoplanet()], "NEA")
+        star_repo = StarRepository(store=first_store)
+        star_repo.add_stars([Star(st_name="Kepler-452", st_altname=["KOI-7016"])], "NEA")
+        with first_store.transaction():
+            exoplanet_repo.save_to_store()
+            star_repo.save_to_store()
+        first_store.close()
+
+        reopened = SqliteEntityStore(db_path)
+        exoplanet_repo = ExoplanetRepository(store=reopened)
+        star_repo = StarRepository(store=reopened)
+
+        assert exoplanet_repo.load_from_store() == 1
+        assert star_repo.load_from_store() == 1
+        assert [e.pl_name for e in exoplanet_repo.get_all_exoplanets()] == ["Kepler-452 b"]
+        assert exoplanet_repo.find_exoplanet("KOI-7016.01") is not None
+        assert [p.pl_name for p in exoplanet_repo.get_planets_for_star("Kepler-452")] == [
+            "Kepler-452 b"
+        ]
+        assert star_repo.find_star("KOI-7016").st_name == "Kepler-452"
+        reopened.close()
+
+    def test_opening_a_repository_keeps_the_stored_catalog(self, store):
+        repo = ExoplanetRepository(store=store)
+        repo.add_exoplanets([_exoplanet()], "NEA")
+        repo.save_to_store()
+
+        ExoplanetRepository(store=store).add_exoplanets([_exoplanet("Kepler-9 d")], "NEA")
+
+        assert [e.pl_name for e in store.load_exoplanets()] == ["Kepler-452 b"]
+
+    def test_save_replaces_the_previous_run(self, store):
+        first_run = _exoplanet()
+        first_run.pl_mass = ValueWithUncertainty(value=1.0)
+        repo = ExoplanetRepository(store=store)
+        repo.add_exoplanets([first_run, _exoplanet("Kepler-9 d")], "NEA")
+        repo.save_to_store()
+        second_run = _exoplanet()
+        second_run.pl_mass = ValueWithUncertainty(value=2.0)
+
+        repo = ExoplanetRepository(store=store)
+        repo.add_exoplanets([second_run], "NEA")
+        repo.save_to_store()
+
+        [stored] = store.load_exoplanets()
+        assert stored.pl_mass == ValueWithUncertainty(value=2.0)
+
+    def test_interrupted_save_keeps_the_previous_catalog(self, store):
+        repo = ExoplanetRepository(store=store)
+        repo.add_exoplanets([_exoplanet()], "NEA")
+        repo.save_to_store()
+        next_run = ExoplanetRepository(store=store)
+        next_run.add_exoplanets([_exoplanet("Kepler-9 d")], "NEA")
+
+        with pytest.raises(RuntimeError), store.transaction():
+            next_run.save_to_store()
+            raise RuntimeError("interruption")
+
+        assert [e.pl_name for e in store.load_exoplanets()] == ["Kepler-452 b"]
+
+    def test_field_sources_survive_a_reload(self, store):
+        repo = ExoplanetRepository(store=store)
+        repo.add_exoplanets([_exoplanet()], "NEA")
+        repo.add_exoplanets(
+            [
+                Exoplanet(
+                    pl_name="Kepler-452b",
+                    st_name="Kepler-452",
+                    pl_mass=ValueWithUncertainty(value=5.0),
+                    reference=_reference(SourceType.EPE),
+                )
+            ],
+            "EPE",
+        )
+        repo.save_to_store()
+        reloaded = ExoplanetRepository(store=store)
+        reloaded.load_from_store()
+        update = _exoplanet()
+        update.pl_mass = ValueWithUncertainty(value=7.0)
+
+        reloaded.add_exoplanets([update], "NEA")
+
+        # La masse venait d'EPE : NEA, prioritaire, la remplace
+        assert reloaded.find_exoplanet("Kepler-452 b").pl_mass == ValueWithUncertainty(value=7.0)
+
+    def test_repository_without_store_cannot_save(self):
+        with pytest.raises(ValueError, match="no persistent store"):
+            ExoplanetRepository().save_to_store()
@@ -322,3 +322,23 @@ class TestWikipediaService:
         # Si au moins un article existe, l'exoplanète est dans "existing"
         assert "Planet A" in existing
         assert "Planet A" not in missing
+
+    def test_concurrent_batches_match_sequential_results(self, mock_checker):
+        """Les lots interrogés en parallèle donnent le même résultat, dans le même ordre."""
+        exoplanets = [
+            Exoplanet(pl_name=f"Planet {i}", st_name=f"Star {i}", pl_altname=[f"Alt {i}"])
+            for i in range(120)
+        ]
+        mock_checker.check_article_existence_batch.side_effect = lambda titles, **_: {
+            title: WikiArticleInfo(exists=len(title) % 2 == 0, title=title, queried_title=title)
+            for title in titles
+        }
+
+        sequential = WikipediaService(mock_checker).fetch_articles_for_exoplanet_batch(exoplanets)
+        concurrent = WikipediaService(
+            mock_checker, max_workers=4
+        ).fetch_articles_for_exoplanet_batch(exoplanets)
+
+        assert concurrent == sequential
+        assert list(concurrent) == list(sequential)
+        assert mock_checker.check_article_existence_batch.call_count == 2 * 5
@@ -0,0 +1,100 @@
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.astro import constellation_util
+from src.utils.astro.constellation_util import ConstellationUtil, load_constellation_boundaries
+
+EU_CATALOG_PATH = "data/cache/exoplanet_eu/exoplanet_eu.csv"
+
+
+class TestConstellationUtil:
+    @pytest.fixture
+    def util(self):
+        ConstellationUtil.clear_cache()
+        yield ConstellationUtil()
+        ConstellationUtil.clear_cache()
+
+    @pytest.fixture
+    def astropy_util(self):
+        ConstellationUtil.clear_cache()
+        yield ConstellationUtil(validate_with_astropy=True)
+        ConstellationUtil.clear_cache()
+
+    def test_get_constellation_name_from_wiki_coordinates(self, util):
+        assert util.get_constellation_name("19/54/36.65", "+43/57/03.8") == "Cygne"
+        assert util.get_constellation_name("05/35/17.3", "-05/23/28") == "Orion"
+
+    def test_get_constellation_names_batch(self, util):
+        names = util.get_constellation_names(
+            [298.6527, 83.8221, float("nan")], [43.9511, -5.3911, 10.0]
+        )
+        assert names == ["Cygne", "Orion", None]
+
+    def test_offline_lookup_does_not_use_astropy(self, util):
+        with patch.object(ConstellationUtil, "_astropy_constellations") as mock_astropy:
+            assert util.get_constellation_names([298.6527], [43.9511]) == ["Cygne"]
+
+        mock_astropy.assert_not_called()
+
+    def test_falls_back_to_astropy_without_boundary_table(self, util):
+        with patch.object(constellation_util, "load_constellation_boundaries", return_value=None):
+            assert util.get_constellation_names([83.8221], [-5.3911]) == ["Orion"]
+
+    def test_validated_mode_reports_mismatches(self, astropy_util, caplog):
+        with patch.object(
+            ConstellationUtil, "_astropy_constellations", return_value=["Lyra"]
+        ) as mock_astropy:
+            assert astropy_util.get_constellation_names([298.6527], [43.9511]) == ["Lyre"]
+
+        mock_astropy.assert_called_once()
+        assert "Cygnus (table) vs Lyra (astropy)" in caplog.text
+
+    def test_astropy_results_are_cached(self, astropy_util):
+        astropy_util.get_constellation_name("19/54/36.65", "+43/57/03.8")
+
+        with patch.object(ConstellationUtil, "_astropy_constellations") as mock_astropy:
+            # Même position à l'arrondi près : servie par le cache
+            assert astropy_util.get_constellation_names([298.652708], [43.951056]) == ["Cygne"]
+
+        mock_astropy.assert_not_called()
+
+    def test_cache_is_bounded(self, astropy_util):
+        with patch.object(ConstellationUtil, "CACHE_MAX_SIZE", 3):
+            astropy_util.get_constellation_names([1.0, 2.0, 3.0, 4.0, 5.0], [0.0] * 5)
+            assert ConstellationUtil.cache_size() == 3
+
+    def test_sexagesimal_to_degrees(self):
+        ra, dec = ConstellationUtil.sexagesimal_to_degrees("12/00/00", "-00/30/00")
+        assert ra == pytest.approx(180.0)
+        assert dec == pytest.approx(-0.5)
+        assert ConstellationUtil.sexagesimal_to_degrees("12h00", "+10/00/00") is None
+
+
+class TestConstellationBoundaryTable:
+    def test_boundary_table_is_shipped(self):
+        table = load_constellation_boundaries()
+        assert table is not None
+        assert len(table.names) == 88
+
+    def test_offline_table_matches_astropy_on_random_sky(self):
+        rng = np.random.default_rng(1)
+        ra_deg = rng.uniform(0.0, 360.0, 20_000)
+        dec_deg = np.degrees(np.arcsin(rng.uniform(-1.0, 1.0, 20_000)))
+
+        offline = load_constellation_boundaries().lookup(ra_deg, dec_deg)
+        expected = ConstellationUtil._astropy_constellations(ra_deg, dec_deg)
+
+        assert offline.tolist() == expected
+
+    @pytest.mark.skipif(not os.path.exists(EU_CATALOG_PATH), reason="catalogue EU absent")
+    def test_offline_table_matches_astropy_on_full_catalog(self):
+        df = pd.read_csv(EU_CATALOG_PATH, usecols=["ra", "dec"]).dropna()
+
+        offline = load_constellation_boundaries().lookup(df["ra"].values, df["dec"].values)
+        expected = ConstellationUtil._astropy_constellations(df["ra"].values, df["dec"].values)
+
+        assert offline.tolist() == expected
@@ -0,0 +1,43 @@
+"""Tests pour le limiteur de débit TokenBucket."""
+
+import pytest
+
+from src.utils.wikipedia.token_bucket import TokenBucket
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """Tests du débit et de la capacité du seau."""
+
+    def test_burst_up_to_capacity_then_waits_for_refill(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=3, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(5)]
+
+        assert waits == [0.0, 0.0, 0.0, 0.5, 0.5]
+        assert clock.now == pytest.approx(1.0)
+
+    def test_idle_time_refills_without_exceeding_capacity(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=2, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+        bucket.acquire()
+
+        clock.now += 60.0
+
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 1.0]
+
+    def test_rate_must_be_positive(self):
+        with pytest.raises(ValueError, match="strictement positif"):
+            TokenBucket(rate=0)
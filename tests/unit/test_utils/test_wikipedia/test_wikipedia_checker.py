@@ -1,5 +1,6 @@
 """Tests pour WikipediaChecker."""
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
@@ -26,6 +27,21 @@ class TestWikipediaChecker:
         checker = WikipediaChecker()
         assert "AstroWikiBuilder" in checker.session.headers["User-Agent"]
 
+    def test_each_thread_has_its_own_session(self):
+        """Une session par thread, réutilisée par le thread, sur un pool de connexions commun."""
+        checker = WikipediaChecker(user_agent="TestBot/1.0", max_connections=4)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sessions = list(executor.map(lambda _: checker.session, range(2)))
+        worker_session = sessions[0]
+
+        assert checker.session is checker.session
+        assert checker.session not in sessions
+        assert worker_session.headers["User-Agent"] == "TestBot/1.0"
+        adapter = worker_session.get_adapter("https://fr.wikipedia.org")
+        assert adapter is checker.session.get_adapter("https://fr.wikipedia.org")
+        assert adapter._pool_maxsize == 4
+
     def test_normalize_title_basic(self, checker):
         """Test de normalisation basique d'un titre."""
         assert checker._normalize_title("Test Article") == "test-article"
@@ -272,3 +288,47 @@ class TestWikipediaChecker:
         assert "Test Article" in results
         assert results["Test Article"].exists is True
         assert results["Test Article"].url == "https://fr.wikipedia.org/wiki/Test_Article"
+
+
+class TestWikipediaCheckerRetries:
+    """Tests du paramètre maxlag, des nouvelles tentatives et du limiteur de débit."""
+
+    @staticmethod
+    def _response(payload: dict, status_code: int = 200, headers: dict | None = None) -> Mock:
+        response = Mock(status_code=status_code, headers=headers or {})
+        response.json.return_value = payload
+        return response
+
+    @patch("src.utils.wikipedia.wikipedia_checker.time.sleep")
+    @patch("requests.Session.get")
+    def test_maxlag_error_is_retried_after_retry_after(self, mock_get, mock_sleep):
+        maxlag = self._response(
+            {"error": {"code": "maxlag", "info": "Waiting for db"}}, headers={"Retry-After": "2"}
+        )
+        mock_get.side_effect = [maxlag, self._response({"query": {"pages": {}}})]
+
+        result = WikipediaChecker(maxlag=5).fetch_raw_article_query_from_mediawiki(["Kepler-22 b"])
+
+        assert result == {"pages": {}}
+        assert mock_get.call_args.kwargs["params"]["maxlag"] == 5
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("src.utils.wikipedia.wikipedia_checker.time.sleep")
+    @patch("requests.Session.get")
+    def test_too_many_requests_exhausts_retries(self, mock_get, mock_sleep):
+        mock_get.return_value = self._response({}, status_code=429, headers={"Retry-After": "1"})
+
+        results = WikipediaChecker(max_retries=2).check_article_existence_batch(["Kepler-22 b"])
+
+        assert mock_get.call_count == 3
+        assert mock_sleep.call_count == 2
+        assert "Erreur API" in results["Kepler-22 b"].url
+
+    @patch("requests.Session.get")
+    def test_each_request_acquires_a_token(self, mock_get):
+        mock_get.return_value = self._response({"query": {}})
+        rate_limiter = Mock()
+
+        WikipediaChecker(rate_limiter=rate_limiter).fetch_raw_article_query_from_mediawiki(["A"])
+
+        rate_limiter.acquire.assert_called_once()
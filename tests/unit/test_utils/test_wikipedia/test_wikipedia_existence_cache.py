@@ -0,0 +1,150 @@
+"""Tests pour le cache persistant des réponses Wikipedia (WikipediaExistenceCache)."""
+
+import sqlite3
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from src.utils.wikipedia.wikipedia_checker import WikiArticleInfo, WikipediaChecker
+from src.utils.wikipedia.wikipedia_existence_cache import WikipediaExistenceCache
+
+DAY = 24 * 3600
+
+
+def _api_response(*pages: dict) -> Mock:
+    response = Mock()
+    response.json.return_value = {
+        "query": {"pages": {str(i): page for i, page in enumerate(pages, start=1)}}
+    }
+    return response
+
+
+def _existing_page(title: str) -> dict:
+    return {
+        "pageid": 123,
+        "title": title,
+        "fullurl": f"https://fr.wikipedia.org/wiki/{title.replace(' ', '_')}",
+    }
+
+
+def _missing_page(title: str) -> dict:
+    return {"title": title, "missing": ""}
+
+
+def _queried_titles(mock_get: Mock) -> list[str]:
+    return mock_get.call_args.kwargs["params"]["titles"].split("|")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    existence_cache = WikipediaExistenceCache(
+        str(tmp_path / "wikipedia.sqlite"), positive_ttl=30 * DAY, negative_ttl=DAY
+    )
+    yield existence_cache
+    existence_cache.close()
+
+
+class TestWikipediaExistenceCache:
+    """Tests du stockage et de l'expiration des réponses."""
+
+    def test_round_trip(self, cache):
+        info = WikiArticleInfo(
+            exists=True,
+            title="Kepler-452 b",
+            queried_title="Kepler-452b",
+            is_redirect=True,
+            redirect_target="Kepler-452 b",
+            url="https://fr.wikipedia.org/wiki/Kepler-452_b",
+        )
+
+        cache.put_many([info], now=1000.0)
+
+        assert cache.get_many(["Kepler-452b", "TOI-700 d"], now=1000.0) == {"Kepler-452b": info}
+
+    def test_negative_answers_expire_before_positive_ones(self, cache):
+        cache.put_many(
+            [
+                WikiArticleInfo(exists=True, title="Kepler-22 b", queried_title="Kepler-22 b"),
+                WikiArticleInfo(exists=False, title="TOI-700 d", queried_title="TOI-700 d"),
+            ],
+            now=0.0,
+        )
+
+        assert set(cache.get_many(["Kepler-22 b", "TOI-700 d"], now=DAY - 1)) == {
+            "Kepler-22 b",
+            "TOI-700 d",
+        }
+        assert set(cache.get_many(["Kepler-22 b", "TOI-700 d"], now=DAY + 1)) == {"Kepler-22 b"}
+        assert cache.get_many(["Kepler-22 b"], now=30 * DAY + 1) == {}
+
+    def test_outdated_schema_is_dropped(self, tmp_path):
+        db_path = str(tmp_path / "old.sqlite")
+        with sqlite3.connect(db_path) as connection:
+            connection.execute("CREATE TABLE articles (title TEXT)")
+            connection.execute("PRAGMA user_version = 99")
+
+        cache = WikipediaExistenceCache(db_path, positive_ttl=DAY, negative_ttl=DAY)
+
+        assert cache.count() == 0
+        cache.close()
+
+
+class TestWikipediaCheckerWithCache:
+    """Tests de WikipediaChecker avec un cache : seuls les titres manquants vont à l'API."""
+
+    @pytest.fixture
+    def checker(self, cache):
+        return WikipediaChecker(user_agent="TestBot/1.0", cache=cache)
+
+    @patch("requests.Session.get")
+    def test_second_run_is_served_from_cache(self, mock_get, checker, cache):
+        mock_get.return_value = _api_response(
+            _existing_page("Kepler-22 b"), _missing_page("TOI-700 d")
+        )
+        first = checker.check_article_existence_batch(["Kepler-22 b", "TOI-700 d"])
+
+        second = WikipediaChecker(cache=cache).check_article_existence_batch(
+            ["Kepler-22 b", "TOI-700 d"]
+        )
+
+        assert mock_get.call_count == 1
+        assert second == first
+        assert second["Kepler-22 b"].exists is True
+        assert second["TOI-700 d"].exists is False
+
+    @patch("requests.Session.get")
+    def test_only_cache_misses_are_queried(self, mock_get, checker, cache):
+        cache.put_many(
+            [WikiArticleInfo(exists=True, title="Kepler-22 b", queried_title="Kepler-22 b")]
+        )
+        mock_get.return_value = _api_response(_missing_page("TOI-700 d"))
+
+        results = checker.check_article_existence_batch(["Kepler-22 b", "TOI-700 d"])
+
+        assert _queried_titles(mock_get) == ["TOI-700 d"]
+        assert results["Kepler-22 b"].exists is True
+        assert results["TOI-700 d"].exists is False
+
+    @patch("requests.Session.get")
+    def test_api_errors_are_not_cached(self, mock_get, checker, cache):
+        mock_get.side_effect = requests.RequestException("API Error")
+
+        results = checker.check_article_existence_batch(["Kepler-22 b"])
+
+        assert "Erreur API" in results["Kepler-22 b"].url
+        assert cache.count() == 0
+
+    @patch("requests.Session.get")
+    def test_host_star_conflict_is_applied_to_cached_answers(self, mock_get, checker, cache):
+        cache.put_many([WikiArticleInfo(exists=True, title="Kepler-22", queried_title="Kepler-22")])
+
+        results = checker.check_article_existence_batch(
+            ["Kepler-22"], exoplanet_context={"Kepler-22": {"st_name": "Kepler-22"}}
+        )
+
+        mock_get.assert_not_called()
+        assert results["Kepler-22"].exists is False
+        assert results["Kepler-22"].host_star == "Kepler-22"
+        # La réponse brute reste en cache pour les autres contextes
+        assert cache.get_many(["Kepler-22"])["Kepler-22"].exists is True
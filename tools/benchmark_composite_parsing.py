@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark du parsing des valeurs composites NEA (colonnes *str) :
+BeautifulSoup seul vs expression régulière vs expression régulière mémoïsée.
+
+Usage: poetry run python -m tools.benchmark_composite_parsing --cells 20000
+"""
+
+import argparse
+import time
+from unittest.mock import patch
+
+import numpy as np
+
+from src.mappers.nasa_exoplanet_archive_mapper import NasaExoplanetArchiveMapper
+
+
+def build_composite_cells(n_cells: int, n_distinct: int, seed: int = 42) -> list[str]:
+    """
+    Cellules au format de PSCompPars (HTML, &plusmn, limites), tirées parmi n_distinct
+    valeurs : les valeurs stellaires et les limites se répètent d'une planète à l'autre.
+    """
+    rng = np.random.default_rng(seed)
+    pool = []
+    for _ in range(n_distinct):
+        value = round(float(rng.uniform(0.1, 400)), int(rng.integers(1, 4)))
+        error = round(float(rng.uniform(0.001, 0.5)), 3)
+        layout = rng.integers(0, 4)
+        if layout == 0:
+            pool.append(
+                f'<div><span class="supersubNumber">{value}</span>'
+                f'<span class="superscript">+{error}</span>'
+                f'<span class="subscript">-{error}</span></div>'
+            )
+        elif layout == 1:
+            pool.append(f"{value}&plusmn{error}")
+        elif layout == 2:
+            pool.append(f"&lt{value}")
+        else:
+            pool.append(f"{value}")
+    return [pool[i] for i in rng.integers(0, n_distinct, n_cells)]
+
+
+def _time_parsing(mapper: NasaExoplanetArchiveMapper, cells: list[str]) -> float:
+    start = time.perf_counter()
+    for cell in cells:
+        if mapper.is_composite_formatted_string(cell):
+            mapper.parse_composite_formatted_value(cell)
+    return time.perf_counter() - start
+
+
+def run_benchmark(n_cells: int, n_distinct: int) -> None:
+    cells = build_composite_cells(n_cells, n_distinct)
+    print(f"{len(cells)} cellules ({len(set(cells))} distinctes)")
+
+    timings = {}
+    mapper = NasaExoplanetArchiveMapper()
+    with (
+        patch.object(mapper, "_parse_html_value", mapper._parse_html_value_with_soup),
+        patch.object(mapper, "parse_composite_formatted_value", mapper._parse_composite_string),
+    ):
+        timings["BeautifulSoup"] = _time_parsing(mapper, cells)
+    with patch.object(mapper, "parse_composite_formatted_value", mapper._parse_composite_string):
+        timings["regex"] = _time_parsing(mapper, cells)
+    timings["regex + mémo"] = _time_parsing(NasaExoplanetArchiveMapper(), cells)
+
+    for label, elapsed in timings.items():
+        print(f"  {label:<14} {elapsed:8.3f} s")
+    print(f"  Accélération : x{timings['BeautifulSoup'] / timings['regex + mémo']:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cells", type=int, default=20000)
+    parser.add_argument("--distinct", type=int, default=2000)
+    cli_args = parser.parse_args()
+    run_benchmark(cli_args.cells, cli_args.distinct)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la résolution des constellations : un SkyCoord par objet (ancien
+comportement), lot astropy mémorisé (mode validé) et table hors ligne de
+ConstellationUtil.
+
+Usage: poetry run python -m tools.benchmark_constellation --positions 2000
+"""
+
+import argparse
+import time
+
+import astropy.units as u
+import numpy as np
+from astropy.coordinates import SkyCoord
+
+from src.utils.astro.constellation_util import ConstellationUtil
+
+
+def _per_object(ra_deg: np.ndarray, dec_deg: np.ndarray) -> list[str]:
+    return [
+        SkyCoord(ra=ra * u.deg, dec=dec * u.deg, frame="icrs").get_constellation()
+        for ra, dec in zip(ra_deg, dec_deg, strict=True)
+    ]
+
+
+def run_benchmark(n_positions: int, repeat: int, seed: int = 42) -> None:
+    rng = np.random.default_rng(seed)
+    ra_deg = rng.uniform(0.0, 360.0, n_positions)
+    dec_deg = np.degrees(np.arcsin(rng.uniform(-1.0, 1.0, n_positions)))
+    astropy_util = ConstellationUtil(validate_with_astropy=True)
+    offline_util = ConstellationUtil()
+
+    start = time.perf_counter()
+    _per_object(ra_deg, dec_deg)
+    per_object = time.perf_counter() - start
+
+    ConstellationUtil.clear_cache()
+    start = time.perf_counter()
+    astropy_util.get_constellation_names(ra_deg, dec_deg)
+    astropy_cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        offline_util.get_constellation_names(ra_deg, dec_deg)
+    offline = (time.perf_counter() - start) / repeat
+
+    print(f"{n_positions} positions")
+    print(f"  SkyCoord par objet   {per_object:8.3f} s")
+    print(f"  lot astropy          {astropy_cold:8.3f} s  (x{per_object / astropy_cold:.1f})")
+    print(f"  table hors ligne     {offline:8.3f} s  (x{per_object / offline:.1f})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--positions", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    cli_args = parser.parse_args()
+    run_benchmark(cli_args.positions, cli_args.repeat)
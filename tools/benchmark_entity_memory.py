@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark mémoire des entités : octets par Exoplanet / Star, avec et sans __slots__,
+puis mémoire retenue par l'extraction avec et sans internement des ValueWithUncertainty.
+
+Le catalogue (synthétique, à la forme de PSCompPars) est extrait par le collecteur NEA,
+puis recopié dans chaque disposition : les valeurs feuilles (chaînes, nombres,
+références) sont partagées, seuls les objets entité et ValueWithUncertainty sont
+recréés, ce qui isole le coût de la représentation.
+
+Usage: poetry run python -m tools.benchmark_entity_memory --rows 6000
+"""
+
+import argparse
+import dataclasses
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import patch
+
+from src.collectors.implementations.nasa_exoplanet_archive_collector import (
+    NasaExoplanetArchiveCollector,
+)
+from src.models.entities.exoplanet_entity import (
+    Exoplanet,
+    ValueWithUncertainty,
+    clear_interned_values,
+)
+from src.models.entities.star_entity import Star
+from tools.nea_synthetic_catalog import build_synthetic_nea_dataframe
+
+
+def _dict_backed_class(cls: type, frozen: bool = False) -> type:
+    """Même dataclass, sans __slots__ (un __dict__ par instance)."""
+    return dataclasses.make_dataclass(
+        f"{cls.__name__}SansSlots",
+        [(f.name, f.type) for f in dataclasses.fields(cls)],
+        frozen=frozen,
+    )
+
+
+def _copy_entities(entities: list[Any], entity_cls: type, vwu_cls: type) -> list[Any]:
+    copies = []
+    for entity in entities:
+        values = {}
+        for f in dataclasses.fields(entity):
+            value = getattr(entity, f.name)
+            if isinstance(value, ValueWithUncertainty):
+                value = vwu_cls(value.value, value.error_positive, value.error_negative, value.sign)
+            values[f.name] = value
+        copies.append(entity_cls(**values))
+    return copies
+
+
+def _measure_bytes(build: Callable[..., list[Any]], *args: Any) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build(*args)
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return allocated
+
+
+def _extract_entities(df) -> tuple[list[Exoplanet], list[Star]]:
+    collector = NasaExoplanetArchiveCollector(use_mock_data=True)
+    # La constellation (astropy) n'influe pas sur la taille des entités
+    constellation_util = collector.mapper.constellation_util
+    with (
+        patch.object(constellation_util, "get_constellation_name", return_value="Cygne"),
+        patch.object(
+            constellation_util,
+            "get_constellation_names",
+            side_effect=lambda ra, dec: ["Cygne"] * len(ra),
+        ),
+    ):
+        return collector.extract_entities_from_dataframe(df)
+
+
+def _count_values(entities: list[Any]) -> tuple[int, int]:
+    """(références vers des ValueWithUncertainty, objets ValueWithUncertainty distincts)"""
+    values = [
+        value
+        for entity in entities
+        for f in dataclasses.fields(entity)
+        if isinstance(value := getattr(entity, f.name), ValueWithUncertainty)
+    ]
+    return len(values), len({id(value) for value in values})
+
+
+def _report_interning(df) -> None:
+    results = {}
+    for label, interned in (("sans internement", False), ("avec internement", True)):
+        clear_interned_values()
+        tracemalloc.start()
+        if interned:
+            exoplanets, stars = _extract_entities(df)
+        else:
+            with patch(
+                "src.mappers.nasa_exoplanet_archive_mapper.intern_value_with_uncertainty",
+                ValueWithUncertainty,
+            ):
+                exoplanets, stars = _extract_entities(df)
+        clear_interned_values()
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        results[label] = (retained, _count_values(exoplanets + stars))
+
+    print("Extraction NEA (mémoire retenue par les entités) :")
+    for label, (retained, (n_refs, n_objects)) in results.items():
+        print(
+            f"  {label:<17} {retained / 1024 / 1024:7.1f} Mo   "
+            f"{n_objects} ValueWithUncertainty pour {n_refs} valeurs"
+        )
+    before, after = results["sans internement"][0], results["avec internement"][0]
+    print(f"  Gain : -{100 * (1 - after / before):.0f} %")
+
+
+def run_benchmark(n_rows: int) -> None:
+    df = build_synthetic_nea_dataframe(n_rows)
+    exoplanets, stars = _extract_entities(df)
+    print(f"Catalogue synthétique : {len(exoplanets)} exoplanètes, {len(stars)} étoiles")
+
+    dict_vwu = _dict_backed_class(ValueWithUncertainty, frozen=True)
+    for label, entities, entity_cls in (
+        ("Exoplanet", exoplanets, Exoplanet),
+        ("Star", stars, Star),
+    ):
+        dict_cls = _dict_backed_class(entity_cls)
+        before = _measure_bytes(_copy_entities, entities, dict_cls, dict_vwu)
+        after = _measure_bytes(_copy_entities, entities, entity_cls, ValueWithUncertainty)
+        n = len(entities)
+        print(
+            f"  {label:<10} sans slots {before / n:8.0f} o/entité   "
+            f"avec slots {after / n:8.0f} o/entité   (-{100 * (1 - after / before):.0f} %)"
+        )
+
+    _report_interning(df)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=6000)
+    cli_args = parser.parse_args()
+    run_benchmark(cli_args.rows)
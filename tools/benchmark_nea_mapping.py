@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark du mapping NEA : parcours ligne par ligne vs mapping vectorisé.
+
+Usage: poetry run python -m tools.benchmark_nea_mapping --rows 6000
+"""
+
+import argparse
+import time
+from unittest.mock import patch
+
+from src.collectors.implementations.nasa_exoplanet_archive_collector import (
+    NasaExoplanetArchiveCollector,
+)
+from src.utils.astro.constellation_util import ConstellationUtil
+from tools.nea_synthetic_catalog import build_synthetic_nea_dataframe
+
+
+def _time_extraction(collector: NasaExoplanetArchiveCollector, df) -> tuple[float, int, int]:
+    start = time.perf_counter()
+    exoplanets, stars = collector.extract_entities_from_dataframe(df)
+    return time.perf_counter() - start, len(exoplanets), len(stars)
+
+
+def run_benchmark(n_rows: int, with_constellation: bool) -> None:
+    df = build_synthetic_nea_dataframe(n_rows)
+    print(f"Table synthétique : {len(df)} lignes × {len(df.columns)} colonnes")
+
+    results = {}
+    for label, vectorized in (("ligne par ligne", False), ("vectorisé", True)):
+        collector = NasaExoplanetArchiveCollector(
+            use_mock_data=True, use_vectorized_mapping=vectorized
+        )
+        ConstellationUtil.clear_cache()
+        if with_constellation:
+            results[label] = _time_extraction(collector, df)
+            continue
+        # Isole le coût du mapping : la constellation est mesurée par
+        # tools/benchmark_constellation.py
+        constellation_util = collector.mapper.constellation_util
+        with (
+            patch.object(constellation_util, "get_constellation_name", return_value="Cygne"),
+            patch.object(
+                constellation_util,
+                "get_constellation_names",
+                side_effect=lambda ra, dec: ["Cygne"] * len(ra),
+            ),
+        ):
+            results[label] = _time_extraction(collector, df)
+
+    for label, (elapsed, n_exo, n_star) in results.items():
+        print(f"  {label:<16} {elapsed:8.3f} s  ({n_exo} exoplanètes, {n_star} étoiles)")
+    speedup = results["ligne par ligne"][0] / results["vectorisé"][0]
+    print(f"  Accélération : x{speedup:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=6000)
+    parser.add_argument(
+        "--with-constellation",
+        action="store_true",
+        help="Inclure le calcul de constellation (astropy) dans la mesure",
+    )
+    cli_args = parser.parse_args()
+    run_benchmark(cli_args.rows, cli_args.with_constellation)
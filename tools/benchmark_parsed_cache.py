@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Benchmark du chargement du cache NEA : relecture du CSV vs copie Feather parsée.
+
+Usage: poetry run python -m tools.benchmark_parsed_cache --rows 6000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from src.collectors.implementations.nasa_exoplanet_archive_collector import (
+    NasaExoplanetArchiveCollector,
+)
+from tools.nea_synthetic_catalog import build_synthetic_nea_dataframe
+
+
+def run_benchmark(n_rows: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        collector = NasaExoplanetArchiveCollector(
+            cache_dir=tmp_dir, custom_cache_filename="nea.csv"
+        )
+        df = build_synthetic_nea_dataframe(n_rows)
+        df.to_csv(collector.cache_path, index=False)
+        size_mb = os.path.getsize(collector.cache_path) / 1024 / 1024
+        print(
+            f"Table synthétique : {len(df)} lignes × {len(df.columns)} colonnes ({size_mb:.1f} Mo)"
+        )
+
+        # Premier chargement : parse le CSV et écrit la copie Feather
+        collector.read_cache_file()
+
+        timings = {}
+        for label, load in (
+            ("CSV (read_csv)", lambda: collector.read_csv_file(collector.cache_path)),
+            ("cache parsé", collector.read_cache_file),
+        ):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                load()
+            timings[label] = (time.perf_counter() - start) / repeat
+
+    for label, elapsed in timings.items():
+        print(f"  {label:<16} {elapsed:8.3f} s")
+    print(f"  Accélération : x{timings['CSV (read_csv)'] / timings['cache parsé']:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=6000)
+    parser.add_argument("--repeat", type=int, default=3)
+    cli_args = parser.parse_args()
+    run_benchmark(cli_args.rows, cli_args.repeat)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la vérification Wikipedia : lots de 50 titres envoyés un par un vs
+plusieurs lots en parallèle (WikipediaService, max_workers).
+
+Les requêtes vont à un faux serveur MediaWiki local qui ajoute une latence fixe à
+chaque réponse et refuse périodiquement une requête (erreur maxlag, Retry-After: 0),
+pour exercer les nouvelles tentatives. Les résultats des deux exécutions sont comparés.
+
+Usage: poetry run python -m tools.benchmark_wikipedia_batches --planets 1000 --workers 8
+"""
+
+import argparse
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from src.models.entities.exoplanet_entity import Exoplanet
+from src.services.external.wikipedia_service import WikipediaService
+from src.utils.wikipedia.token_bucket import TokenBucket
+from src.utils.wikipedia.wikipedia_checker import WikipediaChecker
+
+
+class _FakeMediaWikiHandler(BaseHTTPRequestHandler):
+    """Réponses action=query : un titre sur trois est absent, un sur cinq est une redirection."""
+
+    latency = 0.1
+    maxlag_every = 0
+    _request_counter = itertools.count(1)
+
+    def do_GET(self) -> None:
+        time.sleep(self.latency)
+        if self.maxlag_every and next(self._request_counter) % self.maxlag_every == 0:
+            self._send_json(
+                {"error": {"code": "maxlag", "info": "Waiting for a database server"}},
+                {"Retry-After": "0"},
+            )
+            return
+
+        titles = parse_qs(urlparse(self.path).query)["titles"][0].split("|")
+        pages, redirects = {}, []
+        for index, title in enumerate(titles):
+            number = int(title.split("-")[1].split()[0])
+            if number % 3 == 0:
+                pages[str(-index - 1)] = {"title": title, "missing": ""}
+                continue
+            page_title = title
+            if number % 5 == 0:
+                page_title = f"{title} (planète)"
+                redirects.append({"from": title, "to": page_title})
+            pages[str(number)] = {
+                "pageid": number,
+                "title": page_title,
+                "fullurl": f"https://fr.wikipedia.org/wiki/{page_title.replace(' ', '_')}",
+            }
+        self._send_json({"query": {"pages": pages, "redirects": redirects}})
+
+    def _send_json(self, payload: dict, headers: dict[str, str] | None = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+def _build_exoplanets(n_planets: int) -> list[Exoplanet]:
+    return [
+        Exoplanet(pl_name=f"Bench-{i} b", st_name=f"Bench-{i}", pl_altname=[f"BD-{i} b"])
+        for i in range(1, n_planets + 1)
+    ]
+
+
+def run_benchmark(n_planets: int, workers: int, latency: float, rate: float, maxlag_every: int):
+    _FakeMediaWikiHandler.latency = latency
+    _FakeMediaWikiHandler.maxlag_every = maxlag_every
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeMediaWikiHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/w/api.php"
+
+    exoplanets = _build_exoplanets(n_planets)
+    n_batches = -(-2 * n_planets // 50)
+    print(
+        f"{n_planets} exoplanètes ({2 * n_planets} titres, {n_batches} lots), "
+        f"latence {latency * 1000:.0f} ms, débit max {rate:g} req/s"
+    )
+
+    results = {}
+    try:
+        for label, max_workers in (("séquentiel", 1), (f"{workers} threads", workers)):
+            checker = WikipediaChecker(
+                rate_limiter=TokenBucket(rate, capacity=max_workers),
+                base_url=url,
+                max_connections=max_workers,
+            )
+            service = WikipediaService(checker, max_workers=max_workers)
+            start = time.perf_counter()
+            results[label] = service.fetch_articles_for_exoplanet_batch(exoplanets)
+            elapsed = time.perf_counter() - start
+            print(f"  {label:<12} {elapsed:7.2f} s   {n_batches / elapsed:6.1f} lots/s")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    sequential, concurrent = results.values()
+    print(f"  Résultats identiques : {'oui' if sequential == concurrent else 'NON'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--planets", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.1, help="secondes par requête")
+    parser.add_argument("--rate", type=float, default=50.0, help="requêtes par seconde")
+    parser.add_argument(
+        "--maxlag-every", type=int, default=10, help="une requête sur N refusée (0 : jamais)"
+    )
+    cli_args = parser.parse_args()
+    run_benchmark(
+        cli_args.planets, cli_args.workers, cli_args.latency, cli_args.rate, cli_args.maxlag_every
+    )
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Génère la table hors ligne des limites de constellations utilisée par ConstellationUtil.
+
+Les limites IAU (Delporte, tabulées par Roman 1987) sont définies en B1875 par des
+segments d'ascension droite et de déclinaison constantes : le ciel B1875 se découpe
+donc exactement en une grille de rectangles (ra_edges × dec_edges), chaque cellule
+portant l'index de sa constellation. Le passage ICRS (J2000) → B1875 est figé sous
+forme d'un vecteur d'aberration (vitesse de la Terre à J2000) et d'une matrice de
+précession, reproduisant la transformation d'astropy à mieux qu'une seconde d'arc.
+
+Usage: poetry run python -m tools.build_constellation_boundaries
+"""
+
+import argparse
+import warnings
+
+import erfa
+import numpy as np
+from astropy import units as u
+from astropy.coordinates import GCRS, PrecessedGeocentric, SkyCoord
+from astropy.coordinates.funcs import get_constellation
+from astropy.io import ascii
+from astropy.time import Time
+from astropy.utils import data
+
+from src.utils.astro.constellation_util import CONSTELLATION_BOUNDARIES_PATH
+
+J2000_JD = 2451545.0
+
+
+def _read_roman_table() -> tuple[np.ndarray, np.ndarray, np.ndarray, list[str]]:
+    """Table de Roman (1987) fournie par astropy : (ra_low h, ra_up h, dec_low deg, nom long)."""
+    ctable = ascii.read(
+        data.get_pkg_data_contents(
+            "data/constellation_data_roman87.dat", package="astropy.coordinates"
+        ),
+        names=["ral", "rau", "decl", "name"],
+    )
+    cnames = data.get_pkg_data_contents(
+        "data/constellation_names.dat", package="astropy.coordinates", encoding="UTF8"
+    )
+    short_to_long = {
+        line[:3]: line[4:] for line in cnames.split("\n") if line and not line.startswith("#")
+    }
+    long_names = [short_to_long[name] for name in ctable["name"]]
+    return (
+        np.asarray(ctable["ral"], dtype=float),
+        np.asarray(ctable["rau"], dtype=float),
+        np.asarray(ctable["decl"], dtype=float),
+        long_names,
+    )
+
+
+def _precession_matrix() -> np.ndarray:
+    """Rotation GCRS (J2000) → PrecessedGeocentric(equinox=B1875)."""
+    obstime = Time("J2000")
+    basis = SkyCoord(
+        x=[1.0, 0.0, 0.0],
+        y=[0.0, 1.0, 0.0],
+        z=[0.0, 0.0, 1.0],
+        representation_type="cartesian",
+        frame=GCRS(obstime=obstime),
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", erfa.ErfaWarning)
+        precessed = basis.transform_to(PrecessedGeocentric(equinox="B1875", obstime=obstime))
+    cartesian = precessed.cartesian
+    matrix = np.vstack([cartesian.x.value, cartesian.y.value, cartesian.z.value])
+    return matrix / np.linalg.norm(matrix, axis=0)
+
+
+def _aberration_vector() -> np.ndarray:
+    """Vitesse barycentrique de la Terre à J2000, en unités de c."""
+    _, barycentric = erfa.epv00(J2000_JD, 0.0)
+    speed_of_light_au_per_day = (299792458.0 * 86400.0) / erfa.DAU
+    return np.asarray(barycentric[1]) / speed_of_light_au_per_day
+
+
+def build_boundary_table() -> dict[str, np.ndarray]:
+    ra_low, ra_up, dec_low, long_names = _read_roman_table()
+    names = sorted(set(long_names))
+    name_index = {name: i for i, name in enumerate(names)}
+    row_index = np.array([name_index[name] for name in long_names], dtype=np.uint8)
+
+    ra_edges = np.unique(np.concatenate([ra_low, ra_up, [0.0, 24.0]]))
+    dec_edges = np.unique(np.concatenate([dec_low, [-90.0, 90.0]]))
+    ra_mid = (ra_edges[:-1] + ra_edges[1:]) / 2
+    dec_mid = (dec_edges[:-1] + dec_edges[1:]) / 2
+    rah, decd = np.meshgrid(ra_mid, dec_mid, indexing="ij")
+
+    # Même règle que astropy : première ligne telle que ral < ra < rau et dec > decl
+    cells = np.full(rah.shape, -1, dtype=int)
+    for i in range(len(row_index)):
+        mask = (cells == -1) & (ra_low[i] < rah) & (rah < ra_up[i]) & (decd > dec_low[i])
+        cells[mask] = row_index[i]
+    if (cells == -1).any():
+        raise ValueError("Cellules sans constellation dans la grille générée")
+
+    return {
+        "rotation": _precession_matrix(),
+        "aberration": _aberration_vector(),
+        "ra_edges": ra_edges,
+        "dec_edges": dec_edges,
+        "cells": cells.astype(np.uint8),
+        "names": np.array(names),
+    }
+
+
+def _check_against_astropy(table: dict[str, np.ndarray], n_positions: int) -> int:
+    """Compare la table générée à astropy sur des positions aléatoires ; retourne les écarts."""
+    from src.utils.astro.constellation_util import ConstellationBoundaryTable
+
+    rng = np.random.default_rng(0)
+    ra_deg = rng.uniform(0.0, 360.0, n_positions)
+    dec_deg = np.degrees(np.arcsin(rng.uniform(-1.0, 1.0, n_positions)))
+    expected = get_constellation(SkyCoord(ra=ra_deg * u.deg, dec=dec_deg * u.deg, frame="icrs"))
+    offline = ConstellationBoundaryTable(**table).lookup(ra_deg, dec_deg)
+    return int(np.sum(offline != expected))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", default=CONSTELLATION_BOUNDARIES_PATH)
+    parser.add_argument("--check", type=int, default=100_000, help="Positions de contrôle")
+    cli_args = parser.parse_args()
+
+    boundary_table = build_boundary_table()
+    np.savez_compressed(cli_args.output, **boundary_table)
+    print(
+        f"Table écrite dans {cli_args.output} : "
+        f"{boundary_table['cells'].shape[0]}×{boundary_table['cells'].shape[1]} cellules, "
+        f"{len(boundary_table['names'])} constellations"
+    )
+    if cli_args.check:
+        mismatches = _check_against_astropy(boundary_table, cli_args.check)
+        print(f"Contrôle astropy : {mismatches} écart(s) sur {cli_args.check} positions")
@@ -0,0 +1,131 @@
+"""
+Génération d'une table PSCompPars synthétique pour les benchmarks.
+
+Le vrai catalogue NEA n'est pas versionné : cette table reproduit sa forme
+(toutes les colonnes de NEA_ENTITY, plusieurs planètes par étoile hôte,
+cellules vides) avec des valeurs aléatoires reproductibles.
+"""
+
+from dataclasses import fields
+
+import numpy as np
+import pandas as pd
+
+from src.models.entities.nea_entity import NEA_ENTITY
+
+TEXT_COLUMNS: set[str] = {
+    "pl_name",
+    "pl_letter",
+    "hostname",
+    "hd_name",
+    "hip_name",
+    "tic_id",
+    "gaia_id",
+    "discoverymethod",
+    "disc_method",
+    "disc_locale",
+    "disc_facility",
+    "disc_instrument",
+    "disc_telescope",
+    "disc_refname",
+    "disc_pubdate",
+    "st_spectype",
+    "rastr",
+    "decstr",
+    "sy_name",
+    "objectid",
+    "hostid",
+}
+
+DISCOVERY_METHODS = ["Transit", "Radial Velocity", "Imaging", "Microlensing"]
+SPECTRAL_TYPES = ["G2 V", "K1 V", "M3.5 V", "F8 V", "A0 V"]
+
+
+def _is_text_column(name: str) -> bool:
+    return name in TEXT_COLUMNS or name.endswith(("str", "_reflink", "format", "_solnid"))
+
+
+def _format_ra(ra_deg: float) -> str:
+    hours = ra_deg / 15.0
+    h = int(hours)
+    m = int((hours - h) * 60)
+    s = ((hours - h) * 60 - m) * 60
+    return f"{h:02d}h{m:02d}m{s:05.2f}s"
+
+
+def _format_dec(dec_deg: float) -> str:
+    sign = "+" if dec_deg >= 0 else "-"
+    value = abs(dec_deg)
+    d = int(value)
+    m = int((value - d) * 60)
+    s = ((value - d) * 60 - m) * 60
+    return f"{sign}{d:02d}d{m:02d}m{s:04.1f}s"
+
+
+def build_synthetic_nea_dataframe(
+    n_rows: int = 6000, seed: int = 42, missing_ratio: float = 0.4
+) -> pd.DataFrame:
+    """Construit un DataFrame à la forme de PSCompPars (n_rows planètes)."""
+    rng = np.random.default_rng(seed)
+
+    # Découpage en systèmes de 1 à 7 planètes
+    host_ids: list[int] = []
+    host = 0
+    while len(host_ids) < n_rows:
+        host_ids.extend([host] * int(rng.integers(1, 8)))
+        host += 1
+    host_ids = host_ids[:n_rows]
+    n_hosts = host_ids[-1] + 1
+
+    host_ra = rng.uniform(0, 360, n_hosts)
+    host_dec = np.degrees(np.arcsin(rng.uniform(-1, 1, n_hosts)))
+
+    columns: dict[str, object] = {}
+    for field in fields(NEA_ENTITY):
+        name = field.name
+        if _is_text_column(name):
+            columns[name] = [np.nan] * n_rows
+            continue
+        values = rng.normal(10, 3, n_rows)
+        values[rng.random(n_rows) < missing_ratio] = np.nan
+        columns[name] = values
+
+    letters = "bcdefgh"
+    planet_index: list[int] = []
+    previous, rank = -1, 0
+    for h in host_ids:
+        rank = rank + 1 if h == previous else 0
+        planet_index.append(rank)
+        previous = h
+    planet_counts = np.bincount(host_ids)
+
+    hostnames = [f"SYN-{h:05d}" for h in host_ids]
+    columns.update(
+        {
+            "pl_name": [
+                f"{name} {letters[i]}" for name, i in zip(hostnames, planet_index, strict=True)
+            ],
+            "pl_letter": [letters[i] for i in planet_index],
+            "hostname": hostnames,
+            "hd_name": [f"HD {h}" if h % 3 == 0 else np.nan for h in host_ids],
+            "hip_name": [f"HIP {h}" if h % 4 == 0 else np.nan for h in host_ids],
+            "tic_id": [f"TIC {100000 + h}" for h in host_ids],
+            "gaia_id": [f"Gaia DR2 {900000 + h}" for h in host_ids],
+            "discoverymethod": [DISCOVERY_METHODS[h % 4] for h in host_ids],
+            "disc_facility": ["Kepler" for _ in host_ids],
+            "st_spectype": [SPECTRAL_TYPES[h % 5] if h % 2 else np.nan for h in host_ids],
+            "ra": host_ra[host_ids],
+            "dec": host_dec[host_ids],
+            "rastr": [_format_ra(host_ra[h]) for h in host_ids],
+            "decstr": [_format_dec(host_dec[h]) for h in host_ids],
+            "disc_year": rng.integers(1995, 2025, n_rows).astype(float),
+            "sy_snum": rng.integers(1, 3, n_rows).astype(float),
+            "sy_pnum": planet_counts[host_ids].astype(float),
+            "st_lum": rng.normal(0, 0.5, n_rows),
+        }
+    )
+    for name in ("pl_orbper", "pl_orbsmax", "pl_bmassj", "pl_radj", "st_teff", "st_mass"):
+        columns[f"{name}_err1"] = np.abs(rng.normal(0, 0.1, n_rows))
+        columns[f"{name}_err2"] = -np.abs(rng.normal(0, 0.1, n_rows))
+
+    return pd.DataFrame(columns)